@@ -0,0 +1,163 @@
+"""
+Synthetic student submissions. The functions are built from templates of code typical for
+introductory courses (and typical for the defects EduLint reports), with names and constants
+drawn from a seeded generator, so that the same corpus is generated on every run.
+"""
+
+from pathlib import Path
+from random import Random
+from typing import Callable, List
+
+NAMES = ["numbers", "values", "scores", "data", "items", "grades", "temps", "results"]
+VARIABLES = ["x", "value", "number", "item", "current", "score", "count", "total"]
+
+
+def _is_positive(rnd: Random, fun: str) -> str:
+    var = rnd.choice(VARIABLES)
+    return f"""\
+def {fun}({var}):
+    if {var} > {rnd.randint(0, 9)}:
+        return True
+    else:
+        return False
+"""
+
+
+def _index_loop(rnd: Random, fun: str) -> str:
+    lst = rnd.choice(NAMES)
+    return f"""\
+def {fun}({lst}):
+    result = 0
+    i = 0
+    while i < len({lst}):
+        if {lst}[i] % {rnd.randint(2, 5)} == 0:
+            result = result + {lst}[i]
+        i += 1
+    return result
+"""
+
+
+def _duplicate_branches(rnd: Random, fun: str) -> str:
+    var = rnd.choice(VARIABLES)
+    a, b, c = rnd.sample(range(10), 3)
+    return f"""\
+def {fun}({var}):
+    if {var} < {a}:
+        print("small")
+        print({var} * {b})
+        print({var} + {c})
+    else:
+        print("small")
+        print({var} * {b})
+        print({var} - {c})
+"""
+
+
+def _repeated_statements(rnd: Random, fun: str) -> str:
+    lst = rnd.choice(NAMES)
+    lines = "\n".join(f"    {lst}.append({i} * {i})" for i in range(rnd.randint(3, 6)))
+    return f"""\
+def {fun}():
+    {lst} = []
+{lines}
+    return {lst}
+"""
+
+
+def _grade(rnd: Random, fun: str) -> str:
+    var = rnd.choice(VARIABLES)
+    return f"""\
+def {fun}({var}):
+    if {var} >= 90:
+        return "A"
+    elif {var} >= 80 and {var} < 90:
+        return "B"
+    elif {var} >= 70 and {var} < 80:
+        return "C"
+    elif {var} < 70:
+        return "F"
+"""
+
+
+def _nested_loops(rnd: Random, fun: str) -> str:
+    lst = rnd.choice(NAMES)
+    return f"""\
+def {fun}({lst}):
+    pairs = []
+    for i in range(len({lst})):
+        for j in range(i + 1, len({lst})):
+            if {lst}[i] + {lst}[j] == {rnd.randint(5, 20)}:
+                pairs.append(({lst}[i], {lst}[j]))
+    return pairs
+"""
+
+
+def _counter(rnd: Random, fun: str) -> str:
+    lst = rnd.choice(NAMES)
+    return f"""\
+def {fun}({lst}, limit={rnd.randint(1, 9)}):
+    count = 0
+    for item in {lst}:
+        if item > limit:
+            count = count + 1
+    found = False
+    for item in {lst}:
+        if item == limit:
+            found = True
+    return count, found
+"""
+
+
+def _clean(rnd: Random, fun: str) -> str:
+    lst = rnd.choice(NAMES)
+    return f'''\
+def {fun}({lst}):
+    """Returns the largest value."""
+    best = {lst}[0]
+    for value in {lst}[1:]:
+        best = max(best, value)
+    return best
+'''
+
+
+TEMPLATES: List[Callable[[Random, str], str]] = [
+    _is_positive,
+    _index_loop,
+    _duplicate_branches,
+    _repeated_statements,
+    _grade,
+    _nested_loops,
+    _counter,
+    _clean,
+]
+
+SIZES = {"small": 3, "medium": 20, "large": 120}  # functions per submission
+
+
+def generate_submission(rnd: Random, functions: int) -> str:
+    parts = []
+    for i in range(functions):
+        parts.append(rnd.choice(TEMPLATES)(rnd, f"function_{i}"))
+    parts.append(f"\n\nprint(function_0({list(range(rnd.randint(1, 10)))}))\n")
+    return "\n\n".join(parts)
+
+
+def write_submission(path: Path, size: str, seed: int = 0) -> Path:
+    path.write_text(generate_submission(Random(seed), SIZES[size]), encoding="utf8")
+    return path
+
+
+def write_corpus(folder: Path, count: int, seed: int = 0) -> List[Path]:
+    """
+    Writes ``count`` submissions into the folder. Most are small, as in a real course; every
+    tenth is medium-sized.
+    """
+    rnd = Random(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        functions = SIZES["medium"] if i % 10 == 9 else rnd.randint(1, 2 * SIZES["small"])
+        path = folder / f"submission_{i:04}.py"
+        path.write_text(generate_submission(rnd, functions), encoding="utf8")
+        paths.append(path)
+    return paths
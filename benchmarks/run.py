@@ -0,0 +1,353 @@
+"""
+Benchmarks of EduLint: start-up, per-file latency, batch throughput and single checkers.
+
+    python -m benchmarks.run [-k PATTERN] [--rounds N] [--compare RESULTS.json]
+
+Results are written as JSON to ``.benchmarks/<commit>.json`` (or ``--output``), so that runs on
+different commits can be compared with ``--compare``.
+"""
+
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from benchmarks.corpus import write_corpus, write_submission
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+RESULTS_PATH = REPO_PATH / ".benchmarks"
+REAL_WORLD_PATH = REPO_PATH / "tests" / "data"
+REGRESSION_THRESHOLD = 1.10  # median slower by more than 10 %
+
+
+class Timer:
+    """Measures the time spent in its ``with`` blocks."""
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed += time.perf_counter() - self._start
+
+
+Round = Callable[[Timer], None]
+"""One measured round; only the parts run inside the timer are measured."""
+
+
+@dataclass
+class Context:
+    folder: Path
+    args: Namespace
+
+
+@dataclass
+class Benchmark:
+    name: str
+    prepare: Callable[[Context], Optional[Round]]
+    """Prepares the benchmark (not measured) and returns its round, or None to skip it."""
+    rounds: int = 5
+    items: Callable[[Context], int] = lambda _ctx: 1
+    """Number of files processed in a round, to compute the throughput."""
+
+
+@dataclass
+class Result:
+    rounds: int
+    times: List[float]
+    items: int
+    min: float = field(init=False)
+    median: float = field(init=False)
+    mean: float = field(init=False)
+    stdev: float = field(init=False)
+    items_per_second: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.min = min(self.times)
+        self.median = statistics.median(self.times)
+        self.mean = statistics.mean(self.times)
+        self.stdev = statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+        self.items_per_second = self.items / self.median if self.median > 0 else 0.0
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+Prepare = Callable[[Context], Optional[Round]]
+
+
+def benchmark(name: str, rounds: int = 5, items: Callable[[Context], int] = lambda _ctx: 1):
+    """Registers the decorated function as the preparation of a benchmark with the name."""
+
+    def register(prepare: Prepare) -> Prepare:
+        BENCHMARKS.append(Benchmark(name, prepare, rounds, items))
+        return prepare
+
+    return register
+
+
+# %% cold start
+
+
+def _edulint_process(*args: str) -> Round:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_PATH), env.get("PYTHONPATH")]))
+    env["EDULINT_OFFLINE"] = "1"
+    command = [sys.executable, "-m", "edulint", *args]
+
+    def run_round(timer: Timer) -> None:
+        with timer:
+            subprocess.run(
+                command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+            )
+
+    return run_round
+
+
+@benchmark("cold_start/version")
+def _cold_start_version(_ctx: Context) -> Round:
+    return _edulint_process("version")
+
+
+@benchmark("cold_start/check_small")
+def _cold_start_check(ctx: Context) -> Round:
+    path = write_submission(ctx.folder / "cold_start.py", "small")
+    return _edulint_process(
+        "check", "--disable-version-check", "--disable-explanations-update", str(path)
+    )
+
+
+# %% linting in-process
+
+
+def _check(paths: List[str]) -> Round:
+    from edulint.edulint import check_code
+
+    def run_round(timer: Timer) -> None:
+        with timer:
+            check_code(paths)
+
+    return run_round
+
+
+def _latency(size: str) -> Callable[[Context], Round]:
+    def prepare(ctx: Context) -> Round:
+        return _check([str(write_submission(ctx.folder / f"latency_{size}.py", size))])
+
+    return prepare
+
+
+for _size in ("small", "medium", "large"):
+    benchmark(f"latency/{_size}", rounds=10)(_latency(_size))
+
+
+@benchmark("batch/synthetic", rounds=3, items=lambda ctx: ctx.args.corpus_size)
+def _batch_synthetic(ctx: Context) -> Round:
+    folder = ctx.folder / "corpus"
+    write_corpus(folder, ctx.args.corpus_size)
+    return _check([str(folder)])
+
+
+def _real_world_files(ctx: Context) -> List[Path]:
+    folder = ctx.args.real_world
+    return sorted(folder.rglob("*.py")) if folder.is_dir() else []
+
+
+@benchmark("batch/real_world", rounds=3, items=lambda ctx: len(_real_world_files(ctx)))
+def _batch_real_world(ctx: Context) -> Optional[Round]:
+    files = _real_world_files(ctx)
+    if not files:
+        return None
+    return _check([str(path) for path in files])
+
+
+# %% single checkers and analyses
+
+
+def _analysed_module(path: Path):
+    import astroid
+    from edulint.linting.analyses.patcher import run_analyses
+
+    module = astroid.parse(path.read_text(encoding="utf8"), module_name=path.stem, path=str(path))
+    run_analyses(module)
+    return module
+
+
+def _checker(checker_module: str, checker_class: str) -> Callable[[Context], Round]:
+    def prepare(ctx: Context) -> Round:
+        from importlib import import_module
+
+        from pylint.lint import PyLinter
+        from pylint.reporters import CollectingReporter
+        from pylint.utils import ASTWalker, FileState
+
+        path = write_submission(ctx.folder / "checker.py", "large")
+        linter = PyLinter(reporter=CollectingReporter())
+        checker = getattr(import_module(checker_module), checker_class)(linter)
+        linter.register_checker(checker)
+
+        def run_round(timer: Timer) -> None:
+            module = _analysed_module(path)
+            linter.set_current_module(module.name, str(path))
+            linter.file_state = FileState(module.name, linter.msgs_store, module)
+            walker = ASTWalker(linter)
+            walker.add_checker(checker)
+            with timer:
+                checker.open()
+                walker.walk(module)
+                checker.close()
+
+        return run_round
+
+    return prepare
+
+
+benchmark("checkers/simplifiable_if", rounds=10)(
+    _checker("edulint.linting.checkers.simplifiable_if", "SimplifiableIf")
+)
+benchmark("checkers/no_duplicate_code", rounds=10)(
+    _checker("edulint.linting.checkers.duplication.checker", "NoDuplicateCode")
+)
+benchmark("checkers/unsuited_loop", rounds=10)(
+    _checker("edulint.linting.checkers.unsuited_loop", "UnsuitedLoop")
+)
+
+
+@benchmark("analyses/collect_reaching_definitions", rounds=10)
+def _reaching_definitions(ctx: Context) -> Round:
+    import astroid
+    from edulint.linting.analyses.cfg.visitor import CFGVisitor
+    from edulint.linting.analyses.data_dependency import collect_reaching_definitions
+    from edulint.linting.analyses.variable_scope import VarEventsAnalysis
+
+    code = write_submission(ctx.folder / "analyses.py", "large").read_text(encoding="utf8")
+
+    def run_round(timer: Timer) -> None:
+        module = astroid.parse(code)
+        module.accept(CFGVisitor())
+        collected = VarEventsAnalysis().collect(module)
+        with timer:
+            collect_reaching_definitions(module, *collected, None)
+
+    return run_round
+
+
+# %% running and comparing
+
+
+def get_commit() -> str:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_PATH, capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    return commit + "-dirty" if git("status", "--porcelain", "--untracked-files=no") else commit
+
+
+def run_benchmarks(args: Namespace) -> Dict[str, Result]:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="edulint-benchmarks-") as folder:
+        ctx = Context(Path(folder), args)
+        for bench in BENCHMARKS:
+            if args.k and not any(fnmatch(bench.name, f"*{pattern}*") for pattern in args.k):
+                continue
+
+            run_round = bench.prepare(ctx)
+            if run_round is None:
+                print(f"{bench.name:40} skipped", file=sys.stderr)
+                continue
+
+            run_round(Timer())  # warm-up: imports, caches, pooled linters
+            times = []
+            for _ in range(args.rounds or bench.rounds):
+                timer = Timer()
+                run_round(timer)
+                times.append(timer.elapsed)
+
+            result = Result(len(times), times, bench.items(ctx))
+            results[bench.name] = result
+            print(f"{bench.name:40} {result.median * 1000:10.2f} ms", file=sys.stderr)
+    return results
+
+
+def compare(old: Dict, new: Dict) -> bool:
+    """Prints the change of medians; returns whether any benchmark regressed."""
+    regressed = False
+    print(f"{'benchmark':40} {'old ms':>10} {'new ms':>10} {'ratio':>7}")
+    for name, result in new["benchmarks"].items():
+        old_result = old["benchmarks"].get(name)
+        if old_result is None:
+            print(f"{name:40} {'-':>10} {result['median'] * 1000:10.2f}")
+            continue
+        ratio = result["median"] / old_result["median"]
+        slower = ratio > REGRESSION_THRESHOLD
+        regressed |= slower
+        print(
+            f"{name:40} {old_result['median'] * 1000:10.2f} {result['median'] * 1000:10.2f} "
+            f"{ratio:7.2f}{'  slower' if slower else ''}"
+        )
+    return regressed
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Runs EduLint benchmarks and stores the results as JSON.")
+    parser.add_argument("-k", action="append", help="run only benchmarks matching the pattern")
+    parser.add_argument("--rounds", type=int, help="measured rounds of each benchmark")
+    parser.add_argument(
+        "--corpus-size", type=int, default=1000, help="files in the synthetic batch"
+    )
+    parser.add_argument(
+        "--real-world", type=Path, default=REAL_WORLD_PATH, help="folder with real submissions"
+    )
+    parser.add_argument(
+        "--output", type=Path, help="results file (default .benchmarks/<commit>.json)"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="results file of an earlier run to compare with"
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    from edulint.version import version
+
+    commit = get_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "edulint_version": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {name: asdict(result) for name, result in run_benchmarks(args).items()},
+    }
+
+    output = args.output or RESULTS_PATH / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf8")
+    print(f"results written to {output}", file=sys.stderr)
+
+    if args.compare is not None:
+        old = json.loads(args.compare.read_text(encoding="utf8"))
+        return 1 if compare(old, report) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
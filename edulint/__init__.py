@@ -1,14 +1,37 @@
-from .config.arg import Arg
+from typing import TYPE_CHECKING
+
 from .options import Option
 from .linters import Linter
-from .config.config import ImmutableConfig, get_config_one, get_config_many
-from .config.language_translations import Translation
-from .linting.problem import Problem
-from .linting.linting import lint_one, lint_many
-from .explanations import get_explanations
-from .edulint import check_code, get_message_explanations
 from .version import version
 
+# the rest is imported on first access (see __getattr__), so that importing the package
+# does not load the linters, configuration parsing and networking libraries
+if TYPE_CHECKING:
+    from .config.arg import Arg
+    from .config.config import ImmutableConfig, get_config_one, get_config_many
+    from .config.language_translations import Translation
+    from .linting.problem import Problem
+    from .linting.linting import lint_one, lint_many
+    from .linting.profiling import StageHook
+    from .explanations import get_explanations
+    from .edulint import check_code, iter_check, get_message_explanations
+
+_LAZY_ATTRIBUTES = {
+    "Arg": ".config.arg",
+    "ImmutableConfig": ".config.config",
+    "get_config_one": ".config.config",
+    "get_config_many": ".config.config",
+    "Translation": ".config.language_translations",
+    "Problem": ".linting.problem",
+    "lint_one": ".linting.linting",
+    "lint_many": ".linting.linting",
+    "StageHook": ".linting.profiling",
+    "get_explanations": ".explanations",
+    "check_code": ".edulint",
+    "iter_check": ".edulint",
+    "get_message_explanations": ".edulint",
+}
+
 __all__ = [
     "Option",
     "Arg",
@@ -20,10 +43,29 @@ __all__ = [
     "Problem",
     "lint_one",
     "lint_many",
+    "StageHook",
     "get_explanations",
     "check_code",
+    "iter_check",
     "get_message_explanations",
 ]
 
 __version__ = version
 __version_info__ = tuple(map(int, __version__.split(".")))
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # __import__ rather than importlib.import_module, so that the import goes through
+    # the regular import machinery (and shows up in `python -X importtime`)
+    module = __import__(module_name.lstrip("."), globals(), None, [name], 1)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
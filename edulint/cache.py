@@ -0,0 +1,312 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterator, Optional
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from loguru import logger
+from platformdirs import PlatformDirs
+
+
+DEFAULT_MAX_CACHE_SIZE = 64 * 1024 * 1024  # bytes
+INDEX_FILENAME = "index.sqlite"
+BUSY_TIMEOUT = 10  # seconds
+CLAIM_LEASE = 30  # seconds; a claimed refresh not finished by then may be retried by others
+
+
+def current_timestamp() -> int:
+    return int(time.time())
+
+
+@contextmanager
+def atomic_file(path: Path, prefix: str = ".tmp-") -> Iterator[str]:
+    """
+    Yields a temporary path next to ``path``; the file written there replaces ``path`` when the
+    block finishes, so that readers never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=prefix)
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    with atomic_file(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+
+try:
+    import fcntl
+
+    def _try_lock_file(f: IO) -> bool:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _try_lock_file(f: IO) -> bool:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+
+@contextmanager
+def try_lock(path: Path) -> Iterator[bool]:
+    """
+    Takes an advisory lock on ``path`` (created if missing) without waiting for it. Yields whether
+    the lock was acquired; it is released when the block finishes.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        yield _try_lock_file(f)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    path: Path
+    timestamp: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+
+    def is_fresh(self, max_age_in_seconds: int) -> bool:
+        return current_timestamp() < self.timestamp + max_age_in_seconds
+
+    def read(self) -> Optional[str]:
+        try:
+            with open(self.path, "r", encoding="utf8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+class CacheStore:
+    """
+    Key-value store for downloaded files (remote configs, explanations, version information).
+    The values are stored in a sharded directory, the metadata in a single SQLite index, so that
+    each lookup costs one index query and the directory never grows too large.
+
+    Many processes may share the store. Values are replaced by atomic renames and the index is in
+    WAL mode, so lookups never write and are not blocked by writers; :meth:`claim` lets exactly
+    one of the processes which find an entry stale refresh it. The claim is a short lease: the
+    entry becomes fresh only when the refreshed content is stored.
+    """
+
+    def __init__(self, folder: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE) -> None:
+        self.folder = Path(folder)
+        self.max_size = max_size
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.folder / INDEX_FILENAME, timeout=BUSY_TIMEOUT)
+            # the journal mode is persistent, so it is switched (which needs a write lock) only
+            # by the first process, and so is the table created
+            if connection.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+                try:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError as e:
+                    logger.debug("switching cache index to WAL failed: {e}", e=e)
+            if not self._has_entries_table(connection):
+                with connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS entries ("
+                        "key TEXT PRIMARY KEY, filename TEXT NOT NULL, timestamp INTEGER NOT NULL, "
+                        "etag TEXT, last_modified TEXT, size INTEGER NOT NULL, claimed_at INTEGER)"
+                    )
+            elif not self._has_claims_column(connection):
+                # indices created by older versions
+                try:
+                    with connection:
+                        connection.execute("ALTER TABLE entries ADD COLUMN claimed_at INTEGER")
+                except sqlite3.OperationalError as e:  # added by another process in the meantime
+                    logger.debug("adding claims to cache index failed: {e}", e=e)
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _has_entries_table(connection: sqlite3.Connection) -> bool:
+        return (
+            connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries'"
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _has_claims_column(connection: sqlite3.Connection) -> bool:
+        return any(
+            row[1] == "claimed_at" for row in connection.execute("PRAGMA table_info(entries)")
+        )
+
+    def _get_filename(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode(errors="replace")).hexdigest()
+        return os.path.join(digest[:2], digest)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT filename, timestamp, etag, last_modified, size FROM entries WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.error("reading cache index failed:\n {e}", e=e)
+            return None
+
+        if row is None:
+            return None
+        filename, timestamp, etag, last_modified, size = row
+        return CacheEntry(key, self.folder / filename, timestamp, etag, last_modified, size)
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        filename = self._get_filename(key)
+        path = self.folder / filename
+        try:
+            encoded = content.encode("utf8")
+            write_atomically(path, encoded)
+            _remove_stale_temporary_files(path.parent)
+
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, filename, timestamp, etag, last_modified, size, claimed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                    (key, filename, current_timestamp(), etag, last_modified, len(encoded)),
+                )
+            self._evict(connection)
+        except (OSError, sqlite3.Error) as e:
+            logger.error("saving cache file failed:\n {e}", e=e)
+
+    def touch(
+        self, key: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Marks the entry as fresh (possibly updating its validators) without rewriting its
+        content and releases its claim. If there is no entry for the key yet, an empty one is
+        created.
+        """
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT INTO entries (key, filename, timestamp, etag, last_modified, size) "
+                    "VALUES (?, ?, ?, ?, ?, 0) ON CONFLICT(key) DO UPDATE SET "
+                    "timestamp = excluded.timestamp, claimed_at = NULL, "
+                    "etag = COALESCE(excluded.etag, etag), "
+                    "last_modified = COALESCE(excluded.last_modified, last_modified)",
+                    (key, self._get_filename(key), current_timestamp(), etag, last_modified),
+                )
+        except sqlite3.Error as e:
+            logger.error("updating cache index failed:\n {e}", e=e)
+
+    def claim(self, key: str, ttl: int, lease: int = CLAIM_LEASE) -> bool:
+        """
+        Claims the refresh of the entry if it is missing or older than ``ttl`` seconds and nobody
+        claimed it in the last ``lease`` seconds, and returns whether it did. The check and the
+        update are one statement, so of concurrent processes which find the entry stale, only one
+        gets to refresh it. The entry stays stale (and its content is kept) until the refreshed
+        content is stored by :meth:`put` or :meth:`touch`; if the refresh fails, the claim is
+        to be given up by :meth:`release`. A claim abandoned by an exiting process expires with
+        its lease.
+        """
+        now = current_timestamp()
+        try:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO entries (key, filename, timestamp, size, claimed_at) "
+                    "VALUES (?, ?, 0, 0, ?) ON CONFLICT(key) DO UPDATE "
+                    "SET claimed_at = excluded.claimed_at "
+                    "WHERE timestamp <= ? AND (claimed_at IS NULL OR claimed_at <= ?)",
+                    (key, self._get_filename(key), now, now - ttl, now - lease),
+                )
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.error("updating cache index failed:\n {e}", e=e)
+            return False
+
+    def release(self, key: str) -> None:
+        """Gives up the claim of the entry, so that another process may refresh it right away."""
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("UPDATE entries SET claimed_at = NULL WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.error("updating cache index failed:\n {e}", e=e)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total_size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total_size <= self.max_size:
+            return
+
+        evicted = []
+        for key, filename, size in connection.execute(
+            "SELECT key, filename, size FROM entries ORDER BY timestamp"
+        ).fetchall():
+            if total_size <= self.max_size:
+                break
+            evicted.append((key, filename))
+            total_size -= size
+
+        with connection:
+            connection.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in evicted])
+        for _key, filename in evicted:
+            try:
+                os.remove(self.folder / filename)
+            except FileNotFoundError:
+                pass
+
+
+def _remove_stale_temporary_files(folder: Path, prefix: str = ".tmp-") -> None:
+    """Removes temporary files left behind by writes of processes which exited in the middle."""
+    threshold = time.time() - CLAIM_LEASE
+    for tmp_path in folder.glob(prefix + "*"):
+        try:
+            if tmp_path.stat().st_mtime < threshold:
+                tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_cache_store: Optional[CacheStore] = None
+
+
+def get_cache_store() -> CacheStore:
+    global _cache_store
+    if _cache_store is None:
+        _cache_store = CacheStore(Path(PlatformDirs(appname="edulint").user_data_dir) / "cache")
+    return _cache_store
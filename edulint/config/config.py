@@ -15,7 +15,15 @@ from edulint.option_parses import (
     LANG_TRANSLATIONS_LABEL,
     DEFAULT_ENABLER_LABEL,
 )
-from edulint.config.file_config import load_toml_file, get_path_relative_to
+from edulint.config.file_config import (
+    load_toml_file,
+    get_path_relative_to,
+    prefetch_remote_files,
+    get_config_type,
+    ConfigFileType,
+    get_packaged_config_names,
+    get_packaged_configs_fingerprint,
+)
 from edulint.config.option_sets import OptionSets, OptionSet, parse_option_sets
 from edulint.config.language_translations import (
     LangTranslations,
@@ -23,6 +31,8 @@ from edulint.config.language_translations import (
     parse_lang_file,
 )
 from edulint.config.utils import print_invalid_type_message, config_file_val_to_str, add_enabled
+from edulint.cache import get_cache_store, write_atomically
+from edulint.version import version
 from typing import Dict, List, Optional, Tuple, Iterator, Any
 
 from dataclasses import dataclass
@@ -31,6 +41,8 @@ import re
 import shlex
 from loguru import logger
 import os
+import pickle
+import hashlib
 
 
 IMPLICIT_CONFIG_FILENAMES = ("edulint.toml", ".edulint.toml")
@@ -366,6 +378,101 @@ def parse_infile_config(path: str, option_parses: Dict[Option, OptionParse]) ->
 
 def parse_config_file(
     path: str, option_parses: Dict[Option, OptionParse]
+) -> Optional[Tuple[Config, OptionSets, LangTranslations]]:
+    if get_config_type(path) == ConfigFileType.PACKAGED and option_parses == get_option_parses():
+        pickled = _get_packaged_configs_bundle().get(path)
+        if pickled is not None:
+            return pickle.loads(pickled)  # fresh objects each time, callers may modify them
+
+    return _parse_config_file(path, option_parses)
+
+
+# %% packaged configs bundle
+
+_packaged_configs_bundle: Optional[Dict[str, bytes]] = None
+
+
+# the sources of the package define the pickled objects and how they are parsed; a change to any of
+# them (e.g., in a development checkout) invalidates the bundle
+PACKAGE_FOLDER = Path(__file__).resolve().parent.parent
+
+
+def _get_package_sources_fingerprint() -> str:
+    fingerprint = hashlib.sha256()
+    for root, dirs, files in os.walk(PACKAGE_FOLDER):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                relative = os.path.relpath(path, PACKAGE_FOLDER)
+                fingerprint.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return fingerprint.hexdigest()[:16]
+
+
+def _get_packaged_configs_bundle_prefix() -> str:
+    # bundles of other versions or installations sharing the cache are kept
+    installation = hashlib.sha256(str(PACKAGE_FOLDER).encode(errors="replace")).hexdigest()[:8]
+    return f"packaged-configs-{version}-{installation}-"
+
+
+def _get_packaged_configs_bundle_path() -> Path:
+    return get_cache_store().folder / (
+        f"{_get_packaged_configs_bundle_prefix()}{get_packaged_configs_fingerprint()}"
+        f"-{_get_package_sources_fingerprint()}.pickle"
+    )
+
+
+def _build_packaged_configs_bundle() -> Dict[str, bytes]:
+    bundle = {}
+    for name in get_packaged_config_names():
+        parsed = _parse_config_file(name, get_option_parses())
+        if parsed is not None:
+            bundle[name] = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    return bundle
+
+
+def _save_packaged_configs_bundle(bundle_path: Path, bundle: Dict[str, bytes]) -> None:
+    try:
+        write_atomically(bundle_path, pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+
+        for stale in bundle_path.parent.glob(f"{_get_packaged_configs_bundle_prefix()}*.pickle"):
+            if stale != bundle_path:
+                stale.unlink()
+    except OSError as e:
+        logger.debug("saving packaged configs bundle failed: {e}", e=e)
+
+
+def _get_packaged_configs_bundle() -> Dict[str, bytes]:
+    """
+    Returns the packaged configs, already parsed and pickled. The bundle is built on the first
+    run of each EduLint version (or after the TOML files or the sources of EduLint change) and
+    then loaded instead of parsing the TOML files again.
+    """
+    global _packaged_configs_bundle
+    if _packaged_configs_bundle is not None:
+        return _packaged_configs_bundle
+
+    bundle_path = _get_packaged_configs_bundle_path()
+    try:
+        with open(bundle_path, "rb") as f:
+            _packaged_configs_bundle = pickle.load(f)
+        return _packaged_configs_bundle
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("loading packaged configs bundle failed: {e}", e=e)
+
+    # packaged configs reference each other; while building, they are parsed directly
+    _packaged_configs_bundle = {}
+    bundle = _build_packaged_configs_bundle()
+    _save_packaged_configs_bundle(bundle_path, bundle)
+    _packaged_configs_bundle = bundle
+    return bundle
+
+
+def _parse_config_file(
+    path: str, option_parses: Dict[Option, OptionParse]
 ) -> Optional[Tuple[Config, OptionSets, LangTranslations]]:
     def parse_base_config(config_dict: Dict[str, Any]) -> Optional[Config]:
         rec_config = config_dict.get(Option.CONFIG_FILE.to_name(), BASE_CONFIG)
@@ -557,6 +664,12 @@ def get_config_many(
     else:
         config_paths = {iconfig[Option.CONFIG_FILE] for iconfig in infile_configs.keys()}
 
+    prefetch_remote_files(
+        config_paths
+        | {cmd_config.get_last_value(Option.LANGUAGE_FILE, use_default=False)}
+        | {iconfig[Option.LANGUAGE_FILE] for iconfig in infile_configs.keys()}
+    )
+
     config_file_results = {
         config_path: parse_config_file(config_path, option_parses) for config_path in config_paths
     }
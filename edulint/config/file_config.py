@@ -1,21 +1,25 @@
 from pathlib import Path
 import string
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Set, List
 import hashlib
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from enum import Enum, auto
 
 import tomli
 import requests
-from platformdirs import PlatformDirs
+
+from edulint.options import Option
+from edulint.cache import CacheEntry, get_cache_store
+from edulint.maintenance import get_http_session
 
 
 ALLOWED_FILENAME_LETTERS = string.ascii_letters + string.digits + "-_"
 ALLOW_UNRESTRICTED_LOCAL_PATHS = True
 ALLOW_HTTP_S_PATHS = True
+PACKAGED_CONFIGS_FOLDER = os.path.join(os.path.dirname(__file__), "files")
+MAX_CONCURRENT_FETCHES = 8
 
 
 class EduLintConfigFileException(Exception):
@@ -70,6 +74,47 @@ def get_path_relative_to(filepath: str, parent_filepath: str):
     return os.path.abspath(os.path.join(os.path.dirname(parent_filepath), filepath))
 
 
+def _get_remote_references(url: str, content: str) -> Set[str]:
+    try:
+        file_toml = tomli.loads(content)
+    except tomli.TOMLDecodeError:
+        return set()  # reported when the file is actually loaded
+
+    result = set()
+    for option in (Option.CONFIG_FILE, Option.LANGUAGE_FILE):
+        reference = file_toml.get(option.to_name())
+        if isinstance(reference, str) and get_config_type(reference) == ConfigFileType.REMOTE:
+            result.add(reference)
+    return result
+
+
+def prefetch_remote_files(paths_or_urls: Iterable[Optional[str]]) -> None:
+    """
+    Downloads all remote files among the given ones and all remote files they
+    reference (transitively) into the cache. Files on the same level of the
+    reference chain are fetched concurrently, so that the subsequent loads
+    mostly hit the cache instead of doing the round-trips one by one.
+    """
+    if not ALLOW_HTTP_S_PATHS:
+        return
+
+    pending = {
+        path_or_url
+        for path_or_url in paths_or_urls
+        if path_or_url is not None and get_config_type(path_or_url) == ConfigFileType.REMOTE
+    }
+    seen = set(pending)
+    while pending:
+        fetched = CachedHTTPGet.prefetch(pending)
+        pending = set()
+        for url, content in fetched.items():
+            if content is None:
+                continue
+            for reference in _get_remote_references(url, content) - seen:
+                seen.add(reference)
+                pending.add(reference)
+
+
 def _load_file_from_uri(path_or_url: str) -> str:
     config_type = get_config_type(path_or_url)
 
@@ -89,10 +134,30 @@ def _only_acceptable_chars(filepath: str) -> bool:
     return all([x in ALLOWED_FILENAME_LETTERS for x in filepath])
 
 
+def get_packaged_config_names() -> List[str]:
+    return sorted(
+        os.path.splitext(filename)[0]
+        for filename in os.listdir(PACKAGED_CONFIGS_FOLDER)
+        if filename.endswith(".toml")
+    )
+
+
+def get_packaged_configs_fingerprint() -> str:
+    """
+    Identifies the current state of packaged configuration files, so that data derived from them
+    can be invalidated when they change (e.g., in a development checkout).
+    """
+    fingerprint = hashlib.sha256()
+    for name in get_packaged_config_names():
+        stat = os.stat(os.path.join(PACKAGED_CONFIGS_FOLDER, name + ".toml"))
+        fingerprint.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return fingerprint.hexdigest()[:16]
+
+
 def _load_packaged_config_file(filename: str) -> str:
     assert _only_acceptable_chars(filename)
 
-    relative_path = os.path.join(os.path.dirname(__file__), "files", filename + ".toml")
+    relative_path = os.path.join(PACKAGED_CONFIGS_FOLDER, filename + ".toml")
     return _load_local_config_file(relative_path, filename, "packaged", is_path_safe=True)
 
 
@@ -131,18 +196,34 @@ class CachedHTTPGet:
         max_cache_time_when_offline: int = 500 * 24 * 60,
     ) -> str:
         """
-        Source priority: file cache with max age > HTTP GET from URL > file cache with extended max age
+        Source priority: file cache with max age > HTTP GET from URL (revalidating the cached
+        version if there is one) > file cache with extended max age
         """
 
-        cached_version: str = cls._read_version_from_disk(url, max_age_in_seconds=max_cache_time)
-        if cached_version:
+        store = get_cache_store()
+        entry = store.get(url)
+        cached_version = entry.read() if entry is not None else None
+        if cached_version is not None and entry.is_fresh(max_cache_time):
             return cached_version
 
         try:
-            resp = requests.get(url, timeout=5)
+            headers = cls._get_revalidation_headers(entry) if cached_version is not None else {}
+            resp = get_http_session().get(url, timeout=5, headers=headers)
+            if resp.status_code == 304 and cached_version is not None:
+                store.touch(
+                    url, etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified")
+                )
+                return cached_version
+
             if resp.status_code == 200:
                 content = resp.text
-                cls._write_version_to_disk(url, content)
+                # security: writing arbitrary content from web is not great, but at least it's written as text
+                store.put(
+                    url,
+                    content,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                )
                 return content
 
             logger.error(
@@ -155,75 +236,39 @@ class CachedHTTPGet:
         except requests.exceptions.RequestException:
             pass
 
-        cached_version: str = cls._read_version_from_disk(
-            url, max_age_in_seconds=max_cache_time_when_offline
-        )
-        if cached_version:
+        if cached_version is not None and entry.is_fresh(max_cache_time_when_offline):
             return cached_version
         raise FileNotFoundError(
             f"request for external config '{url}' failed -- maybe you are offline or the URL is incorrect."
         )
 
-    @staticmethod
-    def _get_timestamp() -> int:
-        return int(time.time())
-
-    @staticmethod
-    def _get_edulint_cache_folder_location() -> Path:
-        path_str = PlatformDirs(appname="edulint").user_data_dir
-        path = Path(path_str)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
-
-    @staticmethod
-    def _convert_source_to_safe_filename(source: str) -> str:
-        return hashlib.sha256(source.encode(errors="replace")).hexdigest() + ".toml"
-
     @classmethod
-    def _get_filepath_from_source(cls, source: str) -> str:
-        folder_path = cls._get_edulint_cache_folder_location()
-        source_filename = cls._convert_source_to_safe_filename(source)
-        # future: saving everything into same folder can become problem if there are too many filder in the folder
-        return folder_path / source_filename
+    def prefetch(cls, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Gets all passed URLs concurrently (through the cache). Returns the content for each URL,
+        or None if it could not be obtained.
+        """
 
-    @classmethod
-    def _get_metadata_filepath(cls, source: str) -> str:
-        base_filepath = cls._get_filepath_from_source(source)
-        return base_filepath.with_suffix(base_filepath.suffix + ".metadata")
+        def safe_http_get(url: str) -> Optional[str]:
+            try:
+                return cls.http_get(url)
+            except FileNotFoundError:
+                return None  # reported when the file is actually loaded
 
-    @classmethod
-    def _write_version_to_disk(cls, source: str, content: str):
-        try:
-            with open(cls._get_filepath_from_source(source), "w", encoding="utf8") as f:
-                # security: writing arbitrary content from web is not great, but at least it's written as text
-                f.write(content)
-            with open(cls._get_metadata_filepath(source), "w", encoding="utf8") as f:
-                json.dump(
-                    {
-                        "timestamp": cls._get_timestamp(),
-                        "source": source,
-                    },
-                    f,
-                    indent=4,
-                )
-        except Exception as e:
-            logger.error("saving cache file for configuration failed:\n {e}", e=e)
+        urls = list(dict.fromkeys(urls))
+        if len(urls) == 0:
+            return {}
+        if len(urls) == 1:
+            return {urls[0]: safe_http_get(urls[0])}
 
-    @classmethod
-    def _read_version_from_disk(
-        cls, source: str, max_age_in_seconds: int = 5 * 60
-    ) -> Optional[str]:
-        try:
-            with open(cls._get_metadata_filepath(source), "r", encoding="utf8") as f:
-                metadata = json.load(f)
-            if metadata["timestamp"] + max_age_in_seconds <= cls._get_timestamp():  # todo: int
-                return None
-
-            with open(cls._get_filepath_from_source(source), "r", encoding="utf8") as f:
-                return f.read()
-        except FileNotFoundError:
-            return None
-        except Exception as e:
-            logger.error("reading or parsing cache file for configuration failed:\n {e}", e=e)
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENT_FETCHES)) as executor:
+            return dict(zip(urls, executor.map(safe_http_get, urls)))
 
-        return None
+    @staticmethod
+    def _get_revalidation_headers(entry: CacheEntry) -> Dict[str, str]:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
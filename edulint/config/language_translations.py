@@ -1,19 +1,20 @@
-from typing import Any, Dict, ClassVar, List
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
 from dataclasses import dataclass
+import functools
+import hashlib
 import inspect
+import os
 import pkgutil
 import importlib
+import json
 import re
 
 from loguru import logger
 
-import pylint
-from pylint.checkers import BaseChecker
-
 from edulint.option_parses import LANG_TRANSLATED_EXTRACTS_LABEL
 from edulint.config.file_config import load_toml_file
 from edulint.config.raw_flake8_patterns import FLAKE8
-from edulint.linting import checkers as edulint_checkers
+from edulint.config import raw_checker_patterns
 
 
 def to_pattern(message: str):
@@ -21,6 +22,8 @@ def to_pattern(message: str):
 
 
 def checker_classes(module):
+    from pylint.checkers import BaseChecker
+
     for module_info in pkgutil.walk_packages(module.__path__):
         submodule = importlib.import_module(f"{module.__name__}.{module_info.name}")
         for name, obj in inspect.getmembers(submodule):
@@ -29,6 +32,8 @@ def checker_classes(module):
 
 
 def get_edulint_patterns():
+    from edulint.linting import checkers as edulint_checkers
+
     messages = {}
     for checker in checker_classes(edulint_checkers):
         messages.update({code: info[0] for code, info in checker.msgs.items()})
@@ -37,6 +42,8 @@ def get_edulint_patterns():
 
 
 def get_pylint_patterns():
+    import pylint.checkers
+
     messages = {}
     for checker in checker_classes(pylint.checkers):
         messages.update({code: info[0] for code, info in checker.msgs.items()})
@@ -44,6 +51,7 @@ def get_pylint_patterns():
     return messages
 
 
+@functools.lru_cache(maxsize=None)
 def get_patterns():
     return {
         code: to_pattern(message)
@@ -51,6 +59,86 @@ def get_patterns():
     }
 
 
+def get_edulint_checkers_fingerprint() -> str:
+    """Identifies the sources of EduLint's checkers, which define the messages of the checkers."""
+    from edulint.linting import checkers as edulint_checkers
+
+    fingerprint = hashlib.sha256()
+    (folder,) = edulint_checkers.__path__
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                fingerprint.update(os.path.relpath(path, folder).replace(os.sep, "/").encode())
+                with open(path, "rb") as f:
+                    fingerprint.update(f.read())
+    return fingerprint.hexdigest()[:16]
+
+
+def _get_pylint_messages() -> Dict[str, str]:
+    from pylint import __version__ as pylint_version
+
+    if pylint_version == raw_checker_patterns.PYLINT_VERSION:
+        return raw_checker_patterns.PYLINT
+    return get_pylint_patterns()
+
+
+def _get_edulint_messages() -> Dict[str, str]:
+    if get_edulint_checkers_fingerprint() == raw_checker_patterns.EDULINT_FINGERPRINT:
+        return raw_checker_patterns.EDULINT
+    return get_edulint_patterns()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_messages() -> Dict[str, str]:
+    """
+    Returns the messages of all checkers, as :func:`get_patterns` does, but from the prebuilt tables
+    while they match the installed pylint and the sources of EduLint's checkers.
+    """
+    return {**_get_pylint_messages(), **_get_edulint_messages(), **FLAKE8}
+
+
+def _get_raw_pattern(code: str) -> Optional[str]:
+    message = _get_messages().get(code)
+    return to_pattern(message) if message is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_pattern(code: str) -> Optional[Pattern[str]]:
+    """
+    Returns the compiled pattern matching messages with the given code, or None if there is no
+    such pattern or if the message has no parts to extract. Patterns are compiled on first use.
+    """
+    pattern = _get_raw_pattern(code)
+    if pattern is None or "(.*)" not in pattern:
+        return None
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+
+def generate_raw_checker_patterns() -> str:
+    from pylint import __version__ as pylint_version
+
+    def format_messages(name: str, messages: Dict[str, str]) -> str:
+        lines = [f"{name} = {{"]
+        lines.extend(
+            f"    {json.dumps(code)}: {json.dumps(message, ensure_ascii=False)},"
+            for code, message in sorted(messages.items())
+        )
+        lines.append("}")
+        return "\n".join(lines)
+
+    return (
+        '"""Generated by ``python -m edulint.config.language_translations``, do not edit."""\n\n'
+        f"PYLINT_VERSION = {json.dumps(pylint_version)}\n\n"
+        + format_messages("PYLINT", get_pylint_patterns())
+        + "\n\n"
+        + f"EDULINT_FINGERPRINT = {json.dumps(get_edulint_checkers_fingerprint())}\n\n"
+        + format_messages("EDULINT", get_edulint_patterns())
+        + "\n"
+    )
+
+
 @dataclass
 class Translation:
     """Holds information on how to translate a message."""
@@ -63,7 +151,6 @@ class Translation:
     message which are filled in dynamically, but which do not contain a code
     but rather some words in the source language.
     """
-    patterns: ClassVar[Dict[str, str]] = get_patterns()
 
     def translate_extracts(self, extracts: List[str]) -> List[str]:
         """
@@ -84,6 +171,31 @@ class Translation:
                 result.append(word)
         return result
 
+    def prepare(self, code: str) -> Callable[[str], str]:
+        """
+        Returns a function translating messages with the given code using this translation
+        template. The pattern of the code is looked up only once, so that the function can be
+        reused for all messages with the code.
+
+        :param code: the message id of the translated messages
+        :type code: str
+        """
+        template = self.translation
+        pattern = get_pattern(code)
+        if pattern is None:
+            return lambda _message: template
+
+        format_template = template.format
+        translate_extracts = self.translate_extracts
+
+        def translate(message: str) -> str:
+            match = pattern.match(message)
+            if not match:
+                return template
+            return format_template(*translate_extracts(match.groups()))
+
+        return translate
+
     def translate(self, code: str, message: str):
         """
         Translates passed message using this translation template.
@@ -94,19 +206,38 @@ class Translation:
           the expected pattern, the template is returned
         :type message: str
         """
-        pattern = self.patterns.get(code)
-        if pattern is None or "(.*)" not in pattern:
-            return self.translation
-
-        match = re.match(pattern, message, flags=re.IGNORECASE)
-        if not match:
-            return self.translation
-        return self.translation.format(*self.translate_extracts(match.groups()))
+        return self.prepare(code)(message)
 
 
 LangTranslations = Dict[str, Translation]
 
 
+class LangTranslator:
+    """
+    Translates messages using the given language translations. The translation of each code is
+    prepared (see :meth:`Translation.prepare`) on its first use and then reused for all further
+    messages with the same code.
+    """
+
+    def __init__(self, lang_translations: LangTranslations) -> None:
+        self.lang_translations = lang_translations
+        self._translators: Dict[Tuple[str, Optional[str]], Optional[Callable[[str], str]]] = {}
+
+    def _prepare(self, code: str, symbol: Optional[str]) -> Optional[Callable[[str], str]]:
+        translation = self.lang_translations.get(code)
+        if translation is None:
+            translation = self.lang_translations.get(symbol)
+            if translation is None:
+                return None
+        return translation.prepare(code)
+
+    def get_translator(self, code: str, symbol: Optional[str]) -> Optional[Callable[[str], str]]:
+        key = (code, symbol)
+        if key not in self._translators:
+            self._translators[key] = self._prepare(code, symbol)
+        return self._translators[key]
+
+
 def parse_lang_translations(raw_lang_translations: Any) -> LangTranslations:
     if not isinstance(raw_lang_translations, dict):
         logger.warning(
@@ -178,3 +309,8 @@ def parse_lang_file(filename: str):
     if lang_file_raw is None:
         return {}
     return parse_lang_translations(lang_file_raw)
+
+
+if __name__ == "__main__":
+    with open(raw_checker_patterns.__file__, "w", encoding="utf8") as f:
+        f.write(generate_raw_checker_patterns())
@@ -0,0 +1,435 @@
+"""Generated by ``python -m edulint.config.language_translations``, do not edit."""
+
+PYLINT_VERSION = "3.2.7"
+
+PYLINT = {
+    "C0103": "%s name \"%s\" doesn't conform to %s",
+    "C0104": "Disallowed name \"%s\"",
+    "C0105": "Type variable name does not reflect variance%s",
+    "C0112": "Empty %s docstring",
+    "C0114": "Missing module docstring",
+    "C0115": "Missing class docstring",
+    "C0116": "Missing function or method docstring",
+    "C0117": "Consider changing \"%s\" to \"%s\"",
+    "C0121": "Comparison %s should be %s",
+    "C0123": "Use isinstance() rather than type() for a typecheck.",
+    "C0131": "TypeVar cannot be both covariant and contravariant",
+    "C0132": "TypeVar name \"%s\" does not match assigned variable name \"%s\"",
+    "C0200": "Consider using enumerate instead of iterating with range and len",
+    "C0201": "Consider iterating the dictionary directly instead of calling .keys()",
+    "C0202": "Class method %s should have %s as first argument",
+    "C0203": "Metaclass method %s should have %s as first argument",
+    "C0204": "Metaclass class method %s should have %s as first argument",
+    "C0205": "Class __slots__ should be a non-string iterable",
+    "C0206": "Consider iterating with .items()",
+    "C0207": "Use %s instead",
+    "C0208": "Use a sequence type when iterating over values",
+    "C0209": "Formatting a regular string which could be an f-string",
+    "C0301": "Line too long (%s/%s)",
+    "C0302": "Too many lines in module (%s/%s)",
+    "C0303": "Trailing whitespace",
+    "C0304": "Final newline missing",
+    "C0305": "Trailing newlines",
+    "C0321": "More than one statement on a single line",
+    "C0325": "Unnecessary parens after %r keyword",
+    "C0327": "Mixed line endings LF and CRLF",
+    "C0328": "Unexpected line ending format. There is '%s' while it should be '%s'.",
+    "C0401": "Wrong spelling of a word '%s' in a comment:\n%s\n%s\nDid you mean: '%s'?",
+    "C0402": "Wrong spelling of a word '%s' in a docstring:\n%s\n%s\nDid you mean: '%s'?",
+    "C0403": "Invalid characters %r in a docstring",
+    "C0410": "Multiple imports on one line (%s)",
+    "C0411": "%s should be placed before %s",
+    "C0412": "Imports from package %s are not grouped",
+    "C0413": "Import \"%s\" should be placed at the top of the module",
+    "C0414": "Import alias does not rename original package",
+    "C0415": "Import outside toplevel (%s)",
+    "C1802": "Do not use `len(SEQUENCE)` without comparison to determine if a sequence is empty",
+    "C1803": "\"%s\" can be simplified to \"%s\", if it is strictly a sequence, as an empty %s is falsey",
+    "C1804": "\"%s\" can be simplified to \"%s\", if it is striclty a string, as an empty string is falsey",
+    "C1805": "\"%s\" can be simplified to \"%s\", if it is strictly an int, as 0 is falsey",
+    "C2401": "%s name \"%s\" contains a non-ASCII character, consider renaming it.",
+    "C2403": "%s name \"%s\" contains a non-ASCII character, use an ASCII-only alias for import.",
+    "C2503": "PEP8 recommends UTF-8 as encoding for Python files",
+    "C2801": "Unnecessarily calls dunder method %s. %s.",
+    "C3001": "Lambda expression assigned to a variable. Define a function using the \"def\" keyword instead.",
+    "C3002": "Lambda expression called directly. Execute the expression inline instead.",
+    "E0100": "__init__ method is a generator",
+    "E0101": "Explicit return in __init__",
+    "E0102": "%s already defined line %s",
+    "E0103": "%r not properly in loop",
+    "E0104": "Return outside function",
+    "E0105": "Yield outside function",
+    "E0106": "Return with argument inside generator",
+    "E0107": "Use of the non-existent %s operator",
+    "E0108": "Duplicate argument name %s in function definition",
+    "E0110": "Abstract class %r with abstract methods instantiated",
+    "E0111": "The first reversed() argument is not a sequence",
+    "E0112": "More than one starred expression in assignment",
+    "E0113": "Starred assignment target must be in a list or tuple",
+    "E0114": "Can use starred expression only in assignment target",
+    "E0115": "Name %r is nonlocal and global",
+    "E0116": "'continue' not supported inside 'finally' clause",
+    "E0117": "nonlocal name %s found without binding",
+    "E0118": "Name %r is used prior to global declaration",
+    "E0119": "format function is not called on str",
+    "E0202": "An attribute defined in %s line %s hides this method",
+    "E0203": "Access to member %r before its definition line %s",
+    "E0211": "Method %r has no argument",
+    "E0213": "Method %r should have \"self\" as first argument",
+    "E0236": "Invalid object %r in __slots__, must contain only non empty strings",
+    "E0237": "Assigning to attribute %r not defined in class slots",
+    "E0238": "Invalid __slots__ object",
+    "E0239": "Inheriting %r, which is not a class.",
+    "E0240": "Inconsistent method resolution order for class %r",
+    "E0241": "Duplicate bases for class %r",
+    "E0242": "Value %r in slots conflicts with class variable",
+    "E0243": "Invalid assignment to '__class__'. Should be a class definition but got a '%s'",
+    "E0244": "Extending inherited Enum class \"%s\"",
+    "E0301": "__iter__ returns non-iterator",
+    "E0302": "The special method %r expects %s param(s), %d %s given",
+    "E0303": "__len__ does not return non-negative integer",
+    "E0304": "__bool__ does not return bool",
+    "E0305": "__index__ does not return int",
+    "E0306": "__repr__ does not return str",
+    "E0307": "__str__ does not return str",
+    "E0308": "__bytes__ does not return bytes",
+    "E0309": "__hash__ does not return int",
+    "E0310": "__length_hint__ does not return non-negative integer",
+    "E0311": "__format__ does not return str",
+    "E0312": "__getnewargs__ does not return a tuple",
+    "E0313": "__getnewargs_ex__ does not return a tuple containing (tuple, dict)",
+    "E0401": "Unable to import %s",
+    "E0402": "Attempted relative import beyond top-level package",
+    "E0601": "Using variable %r before assignment",
+    "E0602": "Undefined variable %r",
+    "E0603": "Undefined variable name %r in __all__",
+    "E0604": "Invalid object %r in __all__, must contain only strings",
+    "E0605": "Invalid format for __all__, must be tuple or list",
+    "E0606": "Possibly using variable %r before assignment",
+    "E0611": "No name %r in module %r",
+    "E0633": "Attempting to unpack a non-sequence%s",
+    "E0643": "Invalid index for iterable length",
+    "E0701": "Bad except clauses order (%s)",
+    "E0702": "Raising %s while only classes or instances are allowed",
+    "E0704": "The raise statement is not inside an except clause",
+    "E0705": "Exception cause set to something which is not an exception, nor None",
+    "E0710": "Raising a new style class which doesn't inherit from BaseException",
+    "E0711": "NotImplemented raised - should raise NotImplementedError",
+    "E0712": "Catching an exception which doesn't inherit from Exception: %s",
+    "E1003": "Bad first argument %r given to super()",
+    "E1101": "%s %r has no %r member%s",
+    "E1102": "%s is not callable",
+    "E1111": "Assigning result of a function call, where the function has no return",
+    "E1120": "No value for argument %s in %s call",
+    "E1121": "Too many positional arguments for %s call",
+    "E1123": "Unexpected keyword argument %r in %s call",
+    "E1124": "Argument %r passed by position and keyword in %s call",
+    "E1125": "Missing mandatory keyword argument %r in %s call",
+    "E1126": "Sequence index is not an int, slice, or instance with __index__",
+    "E1127": "Slice index is not an int, None, or instance with __index__",
+    "E1128": "Assigning result of a function call, where the function returns None",
+    "E1129": "Context manager '%s' doesn't implement __enter__ and __exit__.",
+    "E1130": "%s",
+    "E1131": "%s",
+    "E1132": "Got multiple values for keyword argument %r in function call",
+    "E1133": "Non-iterable value %s is used in an iterating context",
+    "E1134": "Non-mapping value %s is used in a mapping context",
+    "E1135": "Value '%s' doesn't support membership test",
+    "E1136": "Value '%s' is unsubscriptable",
+    "E1137": "%r does not support item assignment",
+    "E1138": "%r does not support item deletion",
+    "E1139": "Invalid metaclass %r used",
+    "E1141": "Unpacking a dictionary in iteration without calling .items()",
+    "E1142": "'await' should be used within an async function",
+    "E1143": "'%s' is unhashable and can't be used as a %s in a %s",
+    "E1144": "Slice step cannot be 0",
+    "E1200": "Unsupported logging format character %r (%#02x) at index %d",
+    "E1201": "Logging format string ends in middle of conversion specifier",
+    "E1205": "Too many arguments for logging format string",
+    "E1206": "Not enough arguments for logging format string",
+    "E1300": "Unsupported format character %r (%#02x) at index %d",
+    "E1301": "Format string ends in middle of conversion specifier",
+    "E1302": "Mixing named and unnamed conversion specifiers in format string",
+    "E1303": "Expected mapping for format string, not %s",
+    "E1304": "Missing key %r in format string dictionary",
+    "E1305": "Too many arguments for format string",
+    "E1306": "Not enough arguments for format string",
+    "E1307": "Argument %r does not match format type %r",
+    "E1310": "Suspicious argument in %s.%s call",
+    "E1507": "%s does not support %s type argument",
+    "E1519": "singledispatch decorator should not be used with methods, use singledispatchmethod instead.",
+    "E1520": "singledispatchmethod decorator should not be used with functions, use singledispatch instead.",
+    "E1700": "Yield inside async function",
+    "E1701": "Async context manager '%s' doesn't implement __aenter__ and __aexit__.",
+    "E2501": "UTF-16 and UTF-32 aren't backward compatible. Use UTF-8 instead",
+    "E2502": "Contains control characters that can permit obfuscated code executed differently than displayed",
+    "E2510": "Invalid unescaped character backspace, use \"\\b\" instead.",
+    "E2511": "Invalid unescaped character carriage-return, use \"\\r\" instead.",
+    "E2512": "Invalid unescaped character sub, use \"\\x1A\" instead.",
+    "E2513": "Invalid unescaped character esc, use \"\\x1B\" instead.",
+    "E2514": "Invalid unescaped character nul, use \"\\0\" instead.",
+    "E2515": "Invalid unescaped character zero-width-space, use \"\\u200B\" instead.",
+    "E3102": "`%s()` got some positional-only arguments passed as keyword arguments: %s",
+    "E3701": "Invalid usage of field(), %s",
+    "E4702": "Iterated dict '%s' is being modified inside for loop body, iterate through a copy of it instead.",
+    "E4703": "Iterated set '%s' is being modified inside for loop body, iterate through a copy of it instead.",
+    "F0202": "Unable to check methods signature (%s / %s)",
+    "I0023": "%s",
+    "I1101": "%s %r has no %r member%s, but source is unavailable. Consider adding this module to extension-pkg-allow-list if you want to perform analysis based on run-time introspection of living objects.",
+    "R0123": "In '%s', use '%s' when comparing constant literals not '%s' ('%s')",
+    "R0124": "Redundant comparison - %s",
+    "R0133": "Comparison between constants: '%s %s %s' has a constant value",
+    "R0202": "Consider using a decorator instead of calling classmethod",
+    "R0203": "Consider using a decorator instead of calling staticmethod",
+    "R0205": "Class %r inherits from object, can be safely removed from bases in python3",
+    "R0206": "Cannot have defined parameters for properties",
+    "R0401": "Cyclic import (%s)",
+    "R0402": "Use 'from %s import %s' instead",
+    "R0801": "Similar lines in %s files\n%s",
+    "R0901": "Too many ancestors (%s/%s)",
+    "R0902": "Too many instance attributes (%s/%s)",
+    "R0903": "Too few public methods (%s/%s)",
+    "R0904": "Too many public methods (%s/%s)",
+    "R0911": "Too many return statements (%s/%s)",
+    "R0912": "Too many branches (%s/%s)",
+    "R0913": "Too many arguments (%s/%s)",
+    "R0914": "Too many local variables (%s/%s)",
+    "R0915": "Too many statements (%s/%s)",
+    "R0916": "Too many boolean expressions in if statement (%s/%s)",
+    "R0917": "Too many positional arguments in a function call.",
+    "R1701": "Consider merging these isinstance calls to isinstance(%s, (%s))",
+    "R1702": "Too many nested blocks (%s/%s)",
+    "R1703": "The if statement can be replaced with %s",
+    "R1704": "Redefining argument with the local name %r",
+    "R1705": "Unnecessary \"%s\" after \"return\", %s",
+    "R1706": "Consider using ternary (%s)",
+    "R1707": "Disallow trailing comma tuple",
+    "R1708": "Do not raise StopIteration in generator, use return statement instead",
+    "R1709": "Boolean expression may be simplified to %s",
+    "R1710": "Either all return statements in a function should return an expression, or none of them should.",
+    "R1711": "Useless return at end of function or method",
+    "R1712": "Consider using tuple unpacking for swapping variables",
+    "R1713": "Consider using str.join(sequence) for concatenating strings from an iterable",
+    "R1714": "Consider merging these comparisons with 'in' by using '%s %sin (%s)'. Use a set instead if elements are hashable.",
+    "R1715": "Consider using dict.get for getting values from a dict if a key is present or a default if not",
+    "R1716": "Simplify chained comparison between the operands",
+    "R1717": "Consider using a dictionary comprehension",
+    "R1718": "Consider using a set comprehension",
+    "R1719": "The if expression can be replaced with %s",
+    "R1720": "Unnecessary \"%s\" after \"raise\", %s",
+    "R1721": "Unnecessary use of a comprehension, use %s instead.",
+    "R1722": "Consider using 'sys.exit' instead",
+    "R1723": "Unnecessary \"%s\" after \"break\", %s",
+    "R1724": "Unnecessary \"%s\" after \"continue\", %s",
+    "R1725": "Consider using Python 3 style super() without arguments",
+    "R1726": "Boolean condition \"%s\" may be simplified to \"%s\"",
+    "R1727": "Boolean condition '%s' will always evaluate to '%s'",
+    "R1728": "Consider using a generator instead '%s(%s)'",
+    "R1729": "Use a generator instead '%s(%s)'",
+    "R1730": "Consider using '%s' instead of unnecessary if block",
+    "R1731": "Consider using '%s' instead of unnecessary if block",
+    "R1732": "Consider using 'with' for resource-allocating operations",
+    "R1733": "Unnecessary dictionary index lookup, use '%s' instead",
+    "R1734": "Consider using [] instead of list()",
+    "R1735": "Consider using '%s' instead of a call to 'dict'.",
+    "R1736": "Unnecessary list index lookup, use '%s' instead",
+    "R1737": "Use 'yield from' directly instead of yielding each element one by one",
+    "W0101": "Unreachable code",
+    "W0102": "Dangerous default value %s as argument",
+    "W0104": "Statement seems to have no effect",
+    "W0105": "String statement has no effect",
+    "W0106": "Expression \"%s\" is assigned to nothing",
+    "W0107": "Unnecessary pass statement",
+    "W0108": "Lambda may not be necessary",
+    "W0109": "Duplicate key %r in dictionary",
+    "W0120": "Else clause on loop without a break statement, remove the else and de-indent all the code inside it",
+    "W0122": "Use of exec",
+    "W0123": "Use of eval",
+    "W0124": "Following \"as\" with another context manager looks like a tuple.",
+    "W0125": "Using a conditional statement with a constant value",
+    "W0126": "Using a conditional statement with potentially wrong function or method call due to missing parentheses",
+    "W0127": "Assigning the same variable %r to itself",
+    "W0128": "Redeclared variable %r in assignment",
+    "W0129": "Assert statement has a string literal as its first argument. The assert will %s fail.",
+    "W0130": "Duplicate value %r in set",
+    "W0131": "Named expression used without context",
+    "W0133": "Exception statement has no effect",
+    "W0134": "'return' shadowed by the 'finally' clause.",
+    "W0135": "The context used in function %r will not be exited.",
+    "W0143": "Comparing against a callable, did you omit the parenthesis?",
+    "W0150": "%s statement in finally block may swallow exception",
+    "W0177": "Comparison %s should be %s",
+    "W0199": "Assert called on a populated tuple. Did you mean 'assert x,y'?",
+    "W0201": "Attribute %r defined outside __init__",
+    "W0211": "Static method with %r as first argument",
+    "W0212": "Access to a protected member %s of a client class",
+    "W0213": "Flag member %(overlap)s shares bit positions with %(sources)s",
+    "W0221": "%s %s %r method",
+    "W0222": "Signature differs from %s %r method",
+    "W0223": "Method %r is abstract in class %r but is not overridden in child class %r",
+    "W0231": "__init__ method from base class %r is not called",
+    "W0233": "__init__ method from a non direct base class %r is called",
+    "W0236": "Method %r was expected to be %r, found it instead as %r",
+    "W0237": "%s %s %r method",
+    "W0238": "Unused private member `%s.%s`",
+    "W0239": "Method %r overrides a method decorated with typing.final which is defined in class %r",
+    "W0240": "Class %r is a subclass of a class decorated with typing.final: %r",
+    "W0244": "Redefined slots %r in subclass",
+    "W0245": "Super call without brackets",
+    "W0246": "Useless parent or super() delegation in method %r",
+    "W0301": "Unnecessary semicolon",
+    "W0311": "Bad indentation. Found %s %s, expected %s",
+    "W0401": "Wildcard import %s",
+    "W0404": "Reimport %r (imported line %s)",
+    "W0406": "Module import itself",
+    "W0407": "Prefer importing %r instead of %r",
+    "W0410": "__future__ import is not the first non docstring statement",
+    "W0416": "Shadowed %r (imported line %s)",
+    "W0511": "%s",
+    "W0601": "Global variable %r undefined at the module level",
+    "W0602": "Using global for %r but no assignment is done",
+    "W0603": "Using the global statement",
+    "W0604": "Using the global statement at the module level",
+    "W0611": "Unused %s",
+    "W0612": "Unused variable %r",
+    "W0613": "Unused argument %r",
+    "W0614": "Unused import(s) %s from wildcard import of %s",
+    "W0621": "Redefining name %r from outer scope (line %s)",
+    "W0622": "Redefining built-in %r",
+    "W0631": "Using possibly undefined loop variable %r",
+    "W0632": "Possible unbalanced tuple unpacking with sequence %s: left side has %d label%s, right side has %d value%s",
+    "W0640": "Cell variable %s defined in loop",
+    "W0641": "Possibly unused variable %r",
+    "W0642": "Invalid assignment to %s in method",
+    "W0644": "Possible unbalanced dict unpacking with %s: left side has %d label%s, right side has %d value%s",
+    "W0702": "No exception type(s) specified",
+    "W0705": "Catching previously caught exception type %s",
+    "W0706": "The except handler raises immediately",
+    "W0707": "Consider explicitly re-raising using %s'%s from %s'",
+    "W0711": "Exception to catch is the result of a binary \"%s\" operation",
+    "W0715": "Exception arguments suggest string formatting might be intended",
+    "W0716": "Invalid exception operation. %s",
+    "W0718": "Catching too general exception %s",
+    "W0719": "Raising too general exception: %s",
+    "W1113": "Keyword argument before variable positional arguments list in the definition of %s function",
+    "W1114": "Positional arguments appear to be out of order",
+    "W1115": "Non-string value assigned to __name__",
+    "W1116": "Second argument of isinstance is not a type",
+    "W1117": "%r will be included in %r since a positional-only parameter with this name already exists",
+    "W1201": "Use %s formatting in logging functions",
+    "W1202": "Use %s formatting in logging functions",
+    "W1203": "Use %s formatting in logging functions",
+    "W1300": "Format string dictionary key should be a string, not %s",
+    "W1301": "Unused key %r in format string dictionary",
+    "W1302": "Invalid format string",
+    "W1303": "Missing keyword argument %r for format string",
+    "W1304": "Unused format argument %r",
+    "W1305": "Format string contains both automatic field numbering and manual field specification",
+    "W1306": "Missing format attribute %r in format specifier %r",
+    "W1307": "Using invalid lookup key %r in format specifier %r",
+    "W1308": "Duplicate string formatting argument %r, consider passing as named argument",
+    "W1309": "Using an f-string that does not have any interpolated variables",
+    "W1310": "Using formatting for a string that does not have any interpolated variables",
+    "W1401": "Anomalous backslash in string: '%s'. String constant might be missing an r prefix.",
+    "W1402": "Anomalous Unicode escape in byte string: '%s'. String constant might be missing an r or u prefix.",
+    "W1404": "Implicit string concatenation found in %s",
+    "W1405": "Quote delimiter %s is inconsistent with the rest of the file",
+    "W1406": "The u prefix for strings is no longer necessary in Python >=3.0",
+    "W1501": "\"%s\" is not a valid mode for open.",
+    "W1502": "Using datetime.time in a boolean context.",
+    "W1503": "Redundant use of %s with constant value %r",
+    "W1506": "threading.Thread needs the target function",
+    "W1507": "Using copy.copy(os.environ). Use os.environ.copy() instead.",
+    "W1508": "%s default type is %s. Expected str or None.",
+    "W1509": "Using preexec_fn keyword which may be unsafe in the presence of threads",
+    "W1510": "'subprocess.run' used without explicitly defining the value for 'check'.",
+    "W1514": "Using open without explicitly specifying an encoding",
+    "W1515": "Leaving functions creating breakpoints in production code is not recommended",
+    "W1518": "'lru_cache(maxsize=None)' or 'cache' will keep all method args alive indefinitely, including 'self'",
+    "W2101": "'%s()' directly created in 'with' has no effect",
+    "W2301": "Unnecessary ellipsis constant",
+    "W2402": "%s name \"%s\" contains a non-ASCII character.",
+    "W2601": "F-strings are not supported by all versions included in the py-version setting",
+    "W2602": "typing.final is not supported by all versions included in the py-version setting",
+    "W3101": "Missing timeout argument for method '%s' can cause your program to hang indefinitely",
+    "W3301": "Do not use nested call of '%s'; it's possible to do '%s' instead",
+    "W3601": "Suspicious %s-part chained comparison using semantically incompatible operators (%s)",
+    "W4701": "Iterated list '%s' is being modified inside for loop body, consider iterating through a copy of it instead.",
+    "W4901": "Deprecated module %r",
+    "W4902": "Using deprecated method %s()",
+    "W4903": "Using deprecated argument %s of method %s()",
+    "W4904": "Using deprecated class %s of module %s",
+    "W4905": "Using deprecated decorator %s()",
+    "W4906": "Using deprecated attribute %r",
+}
+
+EDULINT_FINGERPRINT = "e3eb7c7cd6e5f199"
+
+EDULINT = {
+    "E9984": "For loop or comprehension variable \"%s\" should not be a part of a larger object.",
+    "E9988": "Comprehension variable '%s' shadows a variable in an outer scope",
+    "E9992": "Forbidden top-level code found on line %s",
+    "E9996": "This loop will only ever run for one iteration",
+    "R6201": "The if statement can be replaced with 'return %s'",
+    "R6202": "The if statement can be replaced with 'return %s'",
+    "R6203": "The conditional assignment can be replaced with '%s = %s'",
+    "R6204": "The if expression can be replaced with '%s'",
+    "R6205": "Use 'if %s: <else body>' instead of 'pass'",
+    "R6206": "Both branches should return a value explicitly (one returns implicit None)",
+    "R6207": "The if statement can be merged with the nested one to 'if %s:'",
+    "R6208": "The if statement can be merged with the following one to 'if %s:'",
+    "R6209": "The if expression can be replaced with '%s'",
+    "R6210": "The conditional assignment can be replaced with '%s = %s'",
+    "R6211": "'%s' can be replaced with '%s'",
+    "R6212": "'%s' can be simplified to '%s'. Simplify the condition if it is on purpose, or change it if it was not.",
+    "R6213": "'%s' can be replaced with '%s'",
+    "R6214": "'%s' can be replaced with '%s'",
+    "R6215": "'%s' can be replaced with '%s'",
+    "R6216": "'%s' can be replaced with '%s'",
+    "R6217": "This '%s' is unreachable.",
+    "R6218": "This 'elif' can be replaced with just 'else'.",
+    "R6219": "'%s' can be replaced with '%s', because some operands of the '%s' are always %s.",
+    "R6220": "Conditions in the if statement can be simplified by reordering elif blocks, we suggest this order: '%s' with these possibly simplified test conditions respectively: '%s'.",
+    "R6221": "The body of this 'elif' is never executed, because its condition is always False when reached.",
+    "R6222": "This condition is always %s.",
+    "R6223": "The next %d if statements after this one can be elif statements.",
+    "R6224": "The next %d if statements after this one can be elif statements.",
+    "R6301": "The while condition can be replaced with '<negated %s>'",
+    "R6302": "Use tighter range boundaries, the %s iteration never happens.",
+    "R6303": "Iterated structure %s is being modified inside the for loop body. Use while loop or iterate over a copy.",
+    "R6304": "Changing the control variable %s of a for loop has no effect.",
+    "R6305": "You should use for loop instead of this form of while loop.",
+    "R6306": "Inner for loop shadows outer for loop's control variable %s.",
+    "R6307": "Iterate directly: \"for var in %s\" (with appropriate name for \"var\")",
+    "R6308": "Iterate using enumerate: \"for %s, var in enumerate(%s)\" (with appropriate name for \"var\")",
+    "R6309": "This while loop is infinite.",
+    "R6310": "This while loop is infinite.",
+    "R6401": "Do not use global variables; you use %s, modifying it for example at line %i.",
+    "R6595": "Identical code inside all if's branches, move %d lines %s the if.",
+    "R6596": "Identical code inside %d consecutive ifs, join their conditions using 'or'.",
+    "R6597": "A complex expression '%s' used repeatedly (on lines %s). Extract it to a local variable or create a helper function.",
+    "R6598": "Duplicate blocks starting on lines %s. Extract the code to a helper function.",
+    "R6599": "Duplicate sequence of %d repetitions of %d lines of code. Use a loop to avoid this.",
+    "R6600": "Should never be emitted",
+    "R6601": "Use %s.append(%s) instead of %s.",
+    "R6602": "Use integral division //.",
+    "R6603": "Use isdecimal to test if string contains a number.",
+    "R6604": "Do not use %s loop with else.",
+    "R6605": "Use elif.",
+    "R6606": "The for loop makes %s.",
+    "R6607": "Use %s instead of repeated %s in %s.",
+    "R6608": "Redundant arithmetic: %s",
+    "R6609": "Use augmented assignment: '%s %s= %s'",
+    "R6610": "Do not multiply list with mutable content.",
+    "R6611": "Use else instead of elif.",
+    "R6612": "Unreachable else.",
+    "R6613": "Use '%s' directly rather than as '%s'.",
+    "R6614": "Use \"%s\" instead of using the magical constant %i.",
+    "R6615": "Remove the call to 'ord' and compare to the string directly \"%s\" instead of using the magical constant %i. Careful, this may require changing the comparison operator.",
+    "R6616": "Use early return.",
+    "R6617": "Consider replacing '%s' with '%s'",
+    "R6618": "Consider replacing '%s' with '%s'",
+    "R6619": "Consider replacing '%s' with '%s'",
+    "R6701": "Too much code outside of functions or classes (%d which is over %d statements).",
+    "R6702": "Function '%s' is too long (%d which is over %d statements).",
+}
@@ -1,20 +1,27 @@
+from __future__ import annotations
+
 from edulint.options import Option
 from edulint.option_parses import OptionParse, get_option_parses
-from edulint.config.config import get_config_many, get_cmd_args, ImmutableConfig
-from edulint.config.language_translations import LangTranslations
-from edulint.linting.problem import Problem
-from edulint.linting.linting import lint_many, sort, EduLintLinterFailedException
-from edulint.versions.version_checker import PackageInfoManager
-from edulint.explanations import update_explanations, get_explanations
 from edulint.version import version
-from typing import List, Dict, Tuple, Any, Optional
+from typing import TYPE_CHECKING, Callable, List, Dict, Tuple, Any, Optional, Iterator
+from dataclasses import dataclass
 import argparse
 import os
 import sys
 import json
-from threading import Thread
 from loguru import logger
 
+# configs, linting and network access are imported only by the commands using them,
+# so that the other commands start quickly
+if TYPE_CHECKING:
+    from edulint.config.config import ImmutableConfig
+    from edulint.config.language_translations import LangTranslations
+    from edulint.linting.problem import Problem
+    from edulint.linting.linting import FileResult
+    from edulint.linting.profiling import Profiler
+    from edulint.linting.analyses.z3_analysis import Z3StatisticsCollector
+    from edulint.linting.profiling import StageHook, StageHooks
+
 
 def setup_logger() -> None:
     logger.remove()
@@ -54,6 +61,9 @@ def format_options_help(option_parses: Dict[Option, OptionParse]) -> str:
     return "\n".join(result) + "\n"
 
 
+OUTPUT_FORMATS = ("text", "json", "ndjson")
+
+
 def setup_argparse(option_parses: Dict[Option, OptionParse]) -> argparse.Namespace:
     main_parser = argparse.ArgumentParser(prog="edulint")
 
@@ -93,6 +103,44 @@ def setup_argparse(option_parses: Dict[Option, OptionParse]) -> argparse.Namespa
         action="append",
         help=format_options_help(option_parses),
     )
+    check_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="output format; json is the same as --json, ndjson prints the configs on the first line "
+        "and then the problems of each file on a separate line as soon as the chunk of files it "
+        "belongs to is linted",
+    )
+    check_parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="measure the time spent in the linters, analyses and EduLint checkers for each file; "
+        "the times are added to the json output and summarized on stderr",
+    )
+    check_parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        default=False,
+        help="profile as with --profile and also trace the memory allocated in each section "
+        "(its peak and the memory still retained when it ends); makes linting much slower; "
+        "requires Python 3.9+",
+    )
+    check_parser.add_argument(
+        "--keep-analyses",
+        action="store_true",
+        default=False,
+        help="keep the annotations of EduLint's analyses on each module after it is checked "
+        "(by default, they are dropped to bound the memory used when checking many files)",
+    )
+    check_parser.add_argument(
+        "--z3-slow-query-threshold",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="collect statistics of z3 queries (as with --profile) and log the queries checked "
+        "longer than SECONDS, with the location of the checked code and the size of the formula",
+    )
     check_parser.add_argument(
         "files_or_dirs",
         metavar="FILE-OR-DIRECTORY",
@@ -117,33 +165,104 @@ def setup_argparse(option_parses: Dict[Option, OptionParse]) -> argparse.Namespa
     return main_parser.parse_args()
 
 
+def _config_to_json(obj: Any) -> str:
+    from edulint.config.config import ImmutableConfig
+
+    if isinstance(obj, ImmutableConfig):
+        return {arg.option.to_name(): arg.val for arg in obj.config}
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+@dataclass
+class CheckStatistics:
+    """Statistics collected while checking, if requested by ``--profile`` or the z3 options."""
+
+    profiler: Optional["Profiler"] = None
+    z3: Optional["Z3StatisticsCollector"] = None
+
+    def file_to_dict(self, path: str) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        if self.profiler is not None:
+            result["timings"] = self.profiler.get_file_timings(path)
+        if self.z3 is not None:
+            result["z3"] = self.z3.get_file_statistics(os.path.abspath(path))
+        return result
+
+    def to_dict(self, get_path: Callable[[str], str]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        if self.profiler is not None:
+            result["timings"] = self.profiler.to_dict()
+        if self.z3 is not None:
+            result["z3"] = self.z3.to_dict(get_path)
+        return result
+
+    def print_summary(self) -> None:
+        if self.profiler is not None:
+            print(self.profiler.format_summary(), file=sys.stderr)
+        if self.z3 is not None:
+            print(self.z3.format_summary(), file=sys.stderr)
+
+
 def to_json(
-    configs: List[Tuple[List[str], ImmutableConfig, LangTranslations]], problems: List[Problem]
+    configs: List[Tuple[List[str], ImmutableConfig, LangTranslations]],
+    problems: List[Problem],
+    statistics: Optional[Dict[str, Any]] = None,
 ) -> str:
-    def config_to_json(obj: Any) -> str:
-        if isinstance(obj, ImmutableConfig):
-            return {arg.option.to_name(): arg.val for arg in obj.config}
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
     config_json = json.dumps(
-        [config for _files, config, _translation in configs], default=config_to_json
+        [config for _files, config, _translation in configs], default=_config_to_json
     )
-    problems_json = Problem.schema().dumps(problems, indent=2, many=True)
-    return f'{{"configs": {config_json}, "problems": {problems_json}}}'
+    from edulint.linting.problem import problems_to_json
+
+    problems_json = problems_to_json(problems, indent=2)
+    statistics_json = "".join(
+        f", {json.dumps(key)}: {json.dumps(value, indent=2)}"
+        for key, value in (statistics or {}).items()
+    )
+    return f'{{"configs": {config_json}, "problems": {problems_json}{statistics_json}}}'
+
+
+def to_ndjson(
+    configs: List[Tuple[List[str], ImmutableConfig, LangTranslations]],
+    results: Iterator[FileResult],
+    statistics: Optional[CheckStatistics] = None,
+) -> Iterator[str]:
+    """
+    Yields the configs as the first line and then a line with the problems of each checked file
+    (an empty list if it has none), as soon as the results for the file are available. When
+    collecting statistics, the line also contains the statistics of the file.
+    """
+    from edulint.linting.problem import problem_to_dict
+
+    yield json.dumps(
+        {"configs": [config for _files, config, _translation in configs]}, default=_config_to_json
+    )
+
+    for path, _config, problems in results:
+        record = {"path": path, "problems": [problem_to_dict(problem) for problem in problems]}
+        if statistics is not None:
+            record.update(statistics.file_to_dict(path))
+        yield json.dumps(record)
+
+
+VERSION_TTL = 600  # seconds
 
 
 def check_for_updates(is_check_disabled: bool = False):
     if is_check_disabled:
         return
 
-    Thread(target=_update_check).start()
+    from edulint.maintenance import get_maintenance_scheduler
+
+    get_maintenance_scheduler().schedule("pypi-latest-version:edulint", VERSION_TTL, _update_check)
 
 
 def _update_check():
+    from edulint.versions.version_checker import PackageInfoManager
+
     python_executable = sys.executable or (
         "python" if os.name == "nt" else "python3"
     )  # nt is Windows
-    version_ttl = 600
+    version_ttl = VERSION_TTL
     if PackageInfoManager.is_update_waiting("edulint", ttl=version_ttl):
         try:
             logger.warning(
@@ -155,10 +274,18 @@ def _update_check():
                 raise e
 
 
-def _check_code(
-    files_or_dirs: List[str], options: List[str], option_parses: Dict[Option, OptionParse]
-) -> Optional[Tuple[List[Tuple[List[str], ImmutableConfig, LangTranslations]], List[Problem]]]:
+def _get_linting_exceptions() -> Tuple[type, ...]:
+    from edulint.linting.linting import EduLintLinterFailedException
+
+    return (TimeoutError, json.decoder.JSONDecodeError, EduLintLinterFailedException)
+
 
+def _get_file_configs(
+    files_or_dirs: List[str],
+    options: List[str],
+    option_parses: Dict[Option, OptionParse],
+    hooks: "StageHooks" = (),
+) -> Optional[List[Tuple[List[str], ImmutableConfig, LangTranslations]]]:
     for file_or_dir in files_or_dirs:
         if not os.path.exists(file_or_dir):
             logger.opt(raw=True, colors=True).critical(
@@ -166,28 +293,120 @@ def _check_code(
             )
             return None
 
-    cmd_args = get_cmd_args(options)
-    file_configs = get_config_many(files_or_dirs, cmd_args, option_parses=option_parses)
+    from edulint.config.config import get_config_many, get_cmd_args
+    from edulint.linting.profiling import stage
+
+    with stage(hooks, "config", files_or_dirs=files_or_dirs):
+        cmd_args = get_cmd_args(options)
+        return get_config_many(files_or_dirs, cmd_args, option_parses=option_parses)
+
+
+def _log_linting_failed(e: Exception) -> None:
+    logger.opt(raw=True, colors=True).critical(f"<red>EduLint linting failed:</red> {e}\n")
+
+
+def _check_code(
+    files_or_dirs: List[str],
+    options: List[str],
+    option_parses: Dict[Option, OptionParse],
+    hooks: "StageHooks" = (),
+) -> Optional[Tuple[List[Tuple[List[str], ImmutableConfig, LangTranslations]], List[Problem]]]:
+    from edulint.linting.linting import lint_many, sort
+
+    file_configs = _get_file_configs(files_or_dirs, options, option_parses, hooks)
+    if file_configs is None:
+        return None
 
     try:
-        results = lint_many(file_configs)
-    except (TimeoutError, json.decoder.JSONDecodeError, EduLintLinterFailedException) as e:
-        logger.opt(raw=True, colors=True).critical(f"<red>EduLint linting failed:</red> {e}\n")
+        results = lint_many(file_configs, hooks=list(hooks))
+    except _get_linting_exceptions() as e:
+        _log_linting_failed(e)
         return None
 
     return file_configs, sort(files_or_dirs, results)
 
 
+def check_and_print_ndjson(
+    args, option_parses, statistics: Optional[CheckStatistics] = None
+) -> int:
+    from edulint.linting.linting import iter_lint_files
+
+    file_configs = _get_file_configs(args.files_or_dirs, args.options, option_parses)
+    if file_configs is None:
+        return 2
+
+    def count_problems(results: Iterator[FileResult]) -> Iterator[FileResult]:
+        nonlocal any_problems
+        for path, config, problems in results:
+            any_problems = any_problems or len(problems) > 0
+            yield path, config, problems
+
+    any_problems = False
+    try:
+        lines = to_ndjson(file_configs, count_problems(iter_lint_files(file_configs)), statistics)
+        print(next(lines), flush=True)
+        for line in lines:
+            print(line, flush=True)
+    except _get_linting_exceptions() as e:
+        _log_linting_failed(e)
+        return 2
+
+    return 1 if any_problems else 0
+
+
+def _enable_statistics(args) -> Optional[CheckStatistics]:
+    profile = args.profile or args.profile_memory
+    if not profile and args.z3_slow_query_threshold is None:
+        return None
+
+    from edulint.linting.profiling import enable_profiling
+    from edulint.linting.analyses.z3_analysis import enable_z3_statistics
+
+    return CheckStatistics(
+        profiler=enable_profiling(memory=args.profile_memory) if profile else None,
+        z3=enable_z3_statistics(args.z3_slow_query_threshold),
+    )
+
+
 def check_and_print(args, option_parses) -> int:
+    if args.profile_memory:
+        from edulint.linting.profiling import MEMORY_PROFILING_SUPPORTED
+
+        if not MEMORY_PROFILING_SUPPORTED:
+            logger.opt(raw=True, colors=True).critical(
+                "<red>--profile-memory requires Python 3.9 or newer</red>\n"
+            )
+            return 2
+
+    statistics = _enable_statistics(args)
+    if args.keep_analyses:
+        from edulint.linting.analyses.patcher import set_release_analyses
+
+        set_release_analyses(False)
+
+    output_format = args.format if args.format is not None else "json" if args.json else "text"
+    if output_format == "ndjson":
+        return_code = check_and_print_ndjson(args, option_parses, statistics)
+        if statistics is not None:
+            statistics.print_summary()
+        return return_code
+
     result = _check_code(args.files_or_dirs, args.options, option_parses)
     if result is None:
         return 2
 
     file_configs, lint_results = result
+    if statistics is not None:
+        statistics.print_summary()
 
     checks_single_file = len(args.files_or_dirs) == 1 and not os.path.isdir(args.files_or_dirs[0])
-    if args.json:
-        print(to_json(file_configs, lint_results))
+    if output_format == "json":
+        statistics_dict = None
+        if statistics is not None:
+            from edulint.linting.linting import RootIndex
+
+            statistics_dict = statistics.to_dict(RootIndex(args.files_or_dirs).get_used_path)
+        print(to_json(file_configs, lint_results, statistics_dict))
     else:
         prev_problem = None
         for problem in lint_results:
@@ -203,7 +422,9 @@ def check_and_print(args, option_parses) -> int:
 
 
 def check_code(
-    files_or_dirs: List[str], options: Optional[List[str]] = None
+    files_or_dirs: List[str],
+    options: Optional[List[str]] = None,
+    hooks: Optional[List["StageHook"]] = None,
 ) -> Optional[Tuple[List[Tuple[List[str], ImmutableConfig, LangTranslations]], List[Problem]]]:
     """
     Analyzes the passed files or directories. If a directory is passed, it
@@ -216,6 +437,12 @@ def check_code(
       OPTION (see ``edulint check -h`` for help) (a possible value could be
       ``["pylint=--enable=duplicate-key"]``)
     :type options: Optional[List[str]]
+    :param hooks: Context manager factories called with the name and attributes
+      of each stage of the checking (e.g., ``"linter"`` and
+      ``{"linter": Linter.PYLINT, "files_or_dirs": [...]}``) and wrapped around
+      it, e.g., to export the stages as spans to a tracing system. The hooks
+      apply only to this call. See :any:`StageHook` for the stages.
+    :type hooks: Optional[List[StageHook]]
     :return: A configurations used for each file and encoutered issues. The
       first element of the returned tuple is a list of tuples containing three
       elements: a list of analyzed files, a configuration and message
@@ -227,7 +454,53 @@ def check_code(
     :rtype: Tuple[List[Tuple[List[str], ImmutableConfig, LangTranslations]], List[Problem]] | None
     """
     options = options if options is not None else []
-    return _check_code(files_or_dirs, options, get_option_parses())
+    hooks = tuple(hooks) if hooks is not None else ()
+    return _check_code(files_or_dirs, options, get_option_parses(), hooks)
+
+
+def iter_check(
+    files_or_dirs: List[str],
+    options: Optional[List[str]] = None,
+    hooks: Optional[List["StageHook"]] = None,
+) -> Iterator[Tuple[str, ImmutableConfig, List[Problem]]]:
+    """
+    Analyzes the passed files or directories like :any:`check_code`, but
+    yields the results file by file as soon as they are available instead of
+    returning them all at the end.
+
+    Files sharing a configuration are linted together in chunks of up to
+    ``LINT_CHUNK_SIZE`` files or subdirectories of the passed directories (or
+    all at once if a check comparing several files is enabled), so the results
+    of a chunk become available at once.
+    When the consumer stops iterating (or closes the generator), the chunks
+    not linted yet are not linted at all.
+
+    :param files_or_dirs: Files or directories to analyze.
+    :type files_or_dirs: List[str]
+    :param options: A list of options, as in :any:`check_code`.
+    :type options: Optional[List[str]]
+    :param hooks: Hooks called around the stages of the checking, as in
+      :any:`check_code`. They apply only to the linting done by this iterator
+      (not to other code run while it is paused).
+    :type hooks: Optional[List[StageHook]]
+    :return: An iterator of triples: the path of an analyzed file, the
+      configuration used for it and the list of problems encountered in it
+      (possibly empty). If an error is encountered, it is logged to stderr and
+      the iteration stops.
+    :rtype: Iterator[Tuple[str, ImmutableConfig, List[Problem]]]
+    """
+    from edulint.linting.linting import iter_lint_files
+
+    options = options if options is not None else []
+    hooks = tuple(hooks) if hooks is not None else ()
+    file_configs = _get_file_configs(files_or_dirs, options, get_option_parses(), hooks)
+    if file_configs is None:
+        return
+
+    try:
+        yield from iter_lint_files(file_configs, hooks)
+    except _get_linting_exceptions() as e:
+        _log_linting_failed(e)
 
 
 def get_message_explanations(message_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
@@ -245,9 +518,12 @@ def get_message_explanations(message_ids: Optional[List[str]] = None) -> Dict[st
       contains examples of erroneous and corrected code.
     :rtype: Dict[str, Dict[str, str]]
     """
-    explanations = get_explanations()
-    message_ids = message_ids if message_ids is not None else explanations.keys()
+    from edulint.explanations import get_explanations, get_explanations_for
+
+    if message_ids is None:
+        return get_explanations()
 
+    explanations = get_explanations_for(message_ids)
     m_id_expls = {}
     for m_id in message_ids:
         expl = explanations.get(m_id)
@@ -293,6 +569,9 @@ def main() -> int:
     args = setup_argparse(option_parses)
 
     check_for_updates(args.disable_version_check)
+
+    from edulint.explanations import update_explanations
+
     update_explanations(
         args.disable_explanations_update
     )  # get_explanations also can trigger update, but we're not calling it anywhere else.
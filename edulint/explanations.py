@@ -1,35 +1,68 @@
-from typing import Dict
-import os
-from threading import Thread
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, Dict
-import dbm
-import time
-import random
+from typing import Dict, Iterable, Optional
+import json
+import os
+import sqlite3
+import threading
+from functools import partial
 
 import tomli
-import requests
-from platformdirs import PlatformDirs
 from loguru import logger
 
+from edulint.cache import atomic_file, get_cache_store, try_lock
+from edulint.maintenance import get_http_session, get_maintenance_scheduler
+
 
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
 EXPLANATIONS_PIP_DISTRIBUTED_FILEPATH = os.path.join(SCRIPT_PATH, "explanations.toml")
 
-EDULINT_LOCAL_DATA_FOLDER = PlatformDirs(appname="edulint").user_data_dir
-EXPLANATIONS_ONLINE_DISTRIBUTED_FILEPATH = os.path.join(EDULINT_LOCAL_DATA_FOLDER, "explanations_online.toml")
-EXPLANATIONS_DBM = os.path.join(EDULINT_LOCAL_DATA_FOLDER, "explanations.dbm")
-GITHUB_URL = "https://raw.githubusercontent.com/GiraffeReversed/edulint/main/edulint/explanations.toml"
+EXPLANATIONS_INDEX_FILENAME = "explanations-index.sqlite"
+EXPLANATIONS_TTL = 600  # seconds
 
-try:
-    Path(EDULINT_LOCAL_DATA_FOLDER).mkdir(parents=True, exist_ok=True)
-except Exception as e:
-    logger.warning("Failed to create local directory for edulints internal files. {e}")
+GITHUB_URL = "https://raw.githubusercontent.com/GiraffeReversed/edulint/main/edulint/explanations.toml"
 
 # --- Read explanations
 def get_explanations(disable_explanations_update: bool = False) -> Dict[str, Dict[str, str]]:
     update_explanations(disable_explanations_update)  # This is async. Its results won't be ready during the lifetime of this function.
 
+    index = _get_explanations_index()
+    if index is not None:
+        try:
+            return index.get_all()
+        except sqlite3.Error as e:
+            logger.debug("reading explanations index failed: {e}", e=e)
+    return _parse_explanations()
+
+
+def get_explanations_for(
+    message_ids: Iterable[str], disable_explanations_update: bool = False
+) -> Dict[str, Dict[str, str]]:
+    """Returns explanations of the given message ids (those without an explanation are left out)."""
+    update_explanations(disable_explanations_update)
+
+    index = _get_explanations_index()
+    if index is not None:
+        try:
+            return index.get_many(message_ids)
+        except sqlite3.Error as e:
+            logger.debug("reading explanations index failed: {e}", e=e)
+    explanations = _parse_explanations()
+    return {m_id: explanations[m_id] for m_id in message_ids if m_id in explanations}
+
+
+def _load_updated_explanations() -> Optional[Dict[str, str]]:
+    entry = get_cache_store().get(GITHUB_URL)
+    online_explanations = entry.read() if entry is not None else None
+    if not online_explanations:
+        return
+    try:
+        return tomli.loads(online_explanations)
+    except:
+        logger.warning("Updated explanations seem to be corrupted. Falling back to those distributed with the pip package.")
+
+
+def _parse_explanations() -> Dict[str, Dict[str, str]]:
     updated_explanations = _load_updated_explanations()
     if updated_explanations:
         return updated_explanations
@@ -39,44 +72,139 @@ def get_explanations(disable_explanations_update: bool = False) -> Dict[str, Dic
     return parsed_toml
 
 
-def _load_updated_explanations() -> Optional[Dict[str, str]]:
-    path_for_online_file = Path(EXPLANATIONS_ONLINE_DISTRIBUTED_FILEPATH)
-    if not path_for_online_file.exists():
-        return
+# --- Explanations index
+def _get_file_fingerprint(path: str) -> str:
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _get_sources_fingerprint() -> str:
+    """Changes whenever the pip-distributed file or the downloaded copy changes."""
+    fingerprint = _get_file_fingerprint(EXPLANATIONS_PIP_DISTRIBUTED_FILEPATH)
+    entry = get_cache_store().get(GITHUB_URL)
+    if entry is not None and entry.size > 0:
+        try:
+            fingerprint += "|" + _get_file_fingerprint(str(entry.path))
+        except OSError:
+            pass
+    return fingerprint
+
+
+class ExplanationsIndex:
+    """
+    Explanations compiled into an SQLite table keyed by message id, so that explaining a few
+    messages does not require parsing the whole TOML file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True)
+            self._local.connection = connection
+        return connection
+
+    def get_fingerprint(self) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        return row[0] if row is not None else None
+
+    def get_many(self, message_ids: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        connection = self._connect()
+        result = {}
+        for m_id in message_ids:
+            row = connection.execute(
+                "SELECT explanation FROM explanations WHERE message_id = ?", (m_id,)
+            ).fetchone()
+            if row is not None:
+                result[m_id] = json.loads(row[0])
+        return result
+
+    def get_all(self) -> Dict[str, Dict[str, str]]:
+        rows = self._connect().execute("SELECT message_id, explanation FROM explanations ORDER BY rowid")
+        return {m_id: json.loads(explanation) for m_id, explanation in rows}
+
+    @staticmethod
+    def build(path: Path, fingerprint: str, explanations: Dict[str, Dict[str, str]]) -> None:
+        with atomic_file(path, prefix=".tmp-explanations-") as tmp_path:
+            with closing(sqlite3.connect(tmp_path)) as connection, connection:
+                connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                connection.execute(
+                    "CREATE TABLE explanations (message_id TEXT PRIMARY KEY, explanation TEXT)"
+                )
+                connection.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+                connection.executemany(
+                    "INSERT INTO explanations VALUES (?, ?)",
+                    ((m_id, json.dumps(expl)) for m_id, expl in explanations.items()),
+                )
+
+
+_explanations_index: Optional[ExplanationsIndex] = None
+
+
+def _open_explanations_index(path: Path, fingerprint: str) -> Optional[ExplanationsIndex]:
+    if not path.exists():
+        return None
+    index = ExplanationsIndex(path)
+    return index if index.get_fingerprint() == fingerprint else None
+
+
+def _get_explanations_index() -> Optional[ExplanationsIndex]:
+    """Returns the index of current explanations, (re)building it if they changed."""
+    global _explanations_index
+
+    path = get_cache_store().folder / EXPLANATIONS_INDEX_FILENAME
     try:
-        with open(EXPLANATIONS_PIP_DISTRIBUTED_FILEPATH, "rb") as f:
-            return tomli.load(f)
-    except:
-        logger.warning("Updated explanations seem to be corrupted. Falling back to those distributed with the pip package.")
+        fingerprint = _get_sources_fingerprint()
+        if _explanations_index is not None and _explanations_index.path == path:
+            if _explanations_index.get_fingerprint() == fingerprint:
+                return _explanations_index
+
+        index = _open_explanations_index(path, fingerprint)
+        if index is not None:
+            _explanations_index = index
+            return index
+
+        # one process rebuilds the index, the others parse the explanations in the meantime
+        with try_lock(path.with_name(path.name + ".lock")) as locked:
+            if not locked:
+                return None
+            # another process may have rebuilt the index before this one took the lock
+            index = _open_explanations_index(path, fingerprint)
+            if index is None:
+                ExplanationsIndex.build(path, fingerprint, _parse_explanations())
+                index = ExplanationsIndex(path)
+        _explanations_index = index
+        return index
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("explanations index unavailable: {e}", e=e)
+        return None
 
 
 # --- Update explanation
-def current_timestamp() -> int:
-    return int(time.time())
-
-
-def update_explanations(disable_explanations_update: bool = False):
+def update_explanations(disable_explanations_update: bool = False, ttl: int = EXPLANATIONS_TTL):
     if disable_explanations_update:
         return
-    Thread(target=_thread_update_explanations).start()
+    get_maintenance_scheduler().schedule(GITHUB_URL, ttl, partial(_refresh_explanations, ttl))
 
 
-def _thread_update_explanations(ttl: int = 600): 
+def _refresh_explanations(ttl: int = EXPLANATIONS_TTL):
     try:
-        if not Path(EXPLANATIONS_DBM).exists():
-            time.sleep(random.randint(1,30)/1000)  # Small random delay to lower the chance for file creation race condition 
-        with dbm.open(EXPLANATIONS_DBM, 'c') as db:
-            if current_timestamp() < int(db.get('last_update', b'0')) + ttl:
-                return
-            db['last_update'] = str(current_timestamp())  # We're counting any update attempt, not just the succesfull ones
-        logger.debug(f"Succesfully wrote current time to {EXPLANATIONS_DBM}.")
-
-        resp = requests.get(GITHUB_URL, timeout=3)
-        if resp.status_code != 200:
+        store = get_cache_store()
+        # Of the processes starting at once, only the one which claims the entry downloads it.
+        # The entry becomes fresh only once the download is stored.
+        if not store.claim(GITHUB_URL, ttl):
             return
 
-        with open(EXPLANATIONS_ONLINE_DISTRIBUTED_FILEPATH, "w", encoding="utf8") as f:
-            f.write(resp.text)
+        try:
+            resp = get_http_session().get(GITHUB_URL, timeout=3)
+            if resp.status_code == 200:
+                store.put(GITHUB_URL, resp.text)
+        finally:
+            # lets other processes retry right away if the download failed
+            store.release(GITHUB_URL)
     except Exception as e:
         logger.debug(f"Update of explanations failed with {e}. This can ocassionaly hapen for some processes due to race condition.")
 
@@ -12,6 +12,7 @@ from edulint.linting.analyses.data_dependency import (
 )
 from edulint.linting.analyses.cfg.visitor import CFGVisitor
 from edulint.linting.analyses.utils import new_node, eprint
+from edulint.linting.profiling import profiled
 
 
 class AunifyVar(nodes.Name):
@@ -467,6 +468,7 @@ def merge_indistinguishable_vars(core, avars: List[AunifyVar], require_name_cons
     return core, get_avars(core)
 
 
+@profiled("antiunify")
 def antiunify(
     to_aunify: List[Union[nodes.NodeNG, List[nodes.NodeNG]]],
     stop_on: Callable[[List[AunifyVar]], bool] = lambda _: False,
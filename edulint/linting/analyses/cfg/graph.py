@@ -150,6 +150,15 @@ class ControlFlowGraph:
             yield edge
             yield from self._get_edges(edge.target, visited)
 
+    def unlink(self) -> None:
+        """Removes all edges and statements of the blocks, breaking the reference cycles between
+        the blocks (and their locations), so that they can be freed without the cycle collector."""
+        for block in set(self.get_blocks()) | self.unreachable_blocks:
+            block.locs.clear()
+            block.predecessors.clear()
+            block.successors.clear()
+        self.unreachable_blocks.clear()
+
     def update_block_reachability(self) -> None:
         for block in self.get_blocks():
             block.reachable = True
@@ -2,48 +2,155 @@
 
 # adapted from https://github.com/pyta-uoft/pyta/blob/4c858623549e24a49fea7aef9c8ec7c20c836bd6/python_ta/patches/transforms.py
 
+from typing import Callable, List
+
 import astroid
 from pylint.lint import PyLinter
 
 from edulint.linting.analyses.variable_scope import UnknowableLocalsException
 from edulint.linting.analyses.variable_scope import VarEventsAnalysis
+from edulint.linting.analyses.var_events import VarEvents
 from edulint.linting.analyses.data_dependency import collect_reaching_definitions
 
 from edulint.linting.analyses.antiunify import AunifyVar
 from edulint.linting.analyses.cfg.visitor import CFGVisitor
+from edulint.linting.profiling import (
+    get_current_stage_hooks,
+    get_profiler,
+    profiled_section,
+    stage,
+)
 from loguru import logger
 
 
 def run_analyses(ast: astroid.nodes.Module):
-    ast.accept(CFGVisitor())
+    with profiled_section("analysis:cfg"):
+        ast.accept(CFGVisitor())
     if len(ast.cfg_loc.block.locs) == 0:
         ast.cfg_loc.var_events.successful = False
         return
 
     try:
-        variables, function_defs, call_graph, outside_scope_events = VarEventsAnalysis().collect(
-            ast
-        )
-        collect_reaching_definitions(
-            ast, variables, function_defs, call_graph, outside_scope_events, None
-        )
+        with profiled_section("analysis:var-events"):
+            variables, function_defs, call_graph, outside_scope_events = (
+                VarEventsAnalysis().collect(ast)
+            )
+        with profiled_section("analysis:reaching-definitions"):
+            collect_reaching_definitions(
+                ast, variables, function_defs, call_graph, outside_scope_events, None
+            )
         ast.cfg_loc.var_events.successful = True
     except UnknowableLocalsException as e:
         ast.cfg_loc.var_events.successful = False
         logger.warning(str(e))
 
 
+ModuleTeardown = Callable[[astroid.nodes.Module], None]
+"""Called with each checked module once all checkers have processed it."""
+
+_module_teardowns: List[ModuleTeardown] = []
+
+
+def register_module_teardown(teardown: ModuleTeardown) -> ModuleTeardown:
+    """
+    Registers a teardown of checked modules, e.g. to drop data the checkers no longer need.
+    Teardowns are called in the order of registration. Usable as a decorator.
+    """
+    _module_teardowns.append(teardown)
+    return teardown
+
+
+def teardown_module(ast: astroid.nodes.Module) -> None:
+    for teardown in _module_teardowns:
+        teardown(ast)
+
+
+MODULE_ANNOTATIONS = ("function_defs", "call_graph", "unresolved_calls", "block_kills")
+"""Attributes set on the module by :func:`run_analyses`, besides ``cfg_loc`` of its nodes."""
+
+_release_analyses = True
+
+
+def set_release_analyses(release: bool) -> None:
+    """
+    Sets whether the annotations of the analyses are dropped from each module once its checkers
+    finish (the default), so that modules kept alive by pylint (in astroid's cache) do not keep
+    them too. Callers which inspect the checked modules afterwards can keep them.
+    """
+    global _release_analyses
+    _release_analyses = release
+
+
+def get_release_analyses() -> bool:
+    return _release_analyses
+
+
+def release_analyses(ast: astroid.nodes.Module) -> None:
+    """
+    Drops the annotations added by :func:`run_analyses` from the module and its nodes and breaks
+    the reference cycles between them (events referring to each other, blocks and edges of the
+    control flow graphs), so that they are freed right away instead of by the cycle collector.
+    """
+    for annotation in MODULE_ANNOTATIONS:
+        ast.__dict__.pop(annotation, None)
+
+    cfgs = set()
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        loc = node.__dict__.pop("cfg_loc", None)
+        if loc is not None:
+            _release_events(loc.var_events)
+            cfgs.add(loc.block.cfg)
+        stack.extend(node.get_children())
+
+    for cfg in cfgs:
+        cfg.unlink()
+
+
+def _release_events(var_events: VarEvents) -> None:
+    for _var, event in var_events.all():
+        event.definitions.clear()
+        event.uses.clear()
+        event.redefines.clear()
+        event.redefined_by.clear()
+    var_events.var_events.clear()
+
+
+@register_module_teardown
+def release_analyses_teardown(ast: astroid.nodes.Module) -> None:
+    if _release_analyses:
+        release_analyses(ast)
+
+
 def patch_ast_transforms():
+    # the plugin is registered with every new linter, but the analyses must run only once per module
+    if getattr(PyLinter.get_ast, "edulint_patched", False):
+        return
+
     old_get_ast = PyLinter.get_ast
 
     def new_get_ast(self, filepath, modname, data=None):
+        profiler = get_profiler()
+        if profiler is not None:
+            with profiler.file(filepath):
+                # the analyses are measured in their own sections, not in the parsing
+                with profiler.measure("pylint:parse"):
+                    ast = old_get_ast(self, filepath, modname, data)
+                if ast is not None:
+                    with stage(get_current_stage_hooks(), "analysis", path=filepath):
+                        run_analyses(ast)
+            return ast
+
         ast = old_get_ast(self, filepath, modname, data)
         if ast is None:
             return None
 
-        run_analyses(ast)
+        with stage(get_current_stage_hooks(), "analysis", path=filepath):
+            run_analyses(ast)
         return ast
 
+    new_get_ast.edulint_patched = True
     PyLinter.get_ast = new_get_ast
     astroid.raw_building._CONST_PROXY[AunifyVar] = None
 
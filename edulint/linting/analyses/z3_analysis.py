@@ -1,9 +1,13 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import Any, List, Optional, Dict, Tuple, TYPE_CHECKING, Callable, TypeVar
+import time
 
 from astroid import nodes
 from edulint.linting.analyses.utils import get_const_value, is_integer, is_number, is_float
 from edulint.linting.analyses.types import guess_type, Type
+from edulint.linting.profiling import profiled
 
 if TYPE_CHECKING:
     import z3  # pyright: ignore[reportMissingImports]
@@ -11,6 +15,8 @@ else:
     from edulint.linting.analyses._z3 import z3
 
 
+T = TypeVar("T")
+
 EXCLUDED_COMPARES_IN_Z3 = {"in", "not in", "is", "is not"}
 EXCLUDED_OPERATIONS_IN_Z3 = {"<<", ">>", "|", "&", "^", "@"}
 
@@ -356,6 +362,207 @@ def convert_condition_to_z3_expression(
     return None, False
 
 
+@dataclass
+class Z3Statistics:
+    queries: int = 0
+    sat: int = 0
+    unsat: int = 0
+    unknown: int = 0
+    rlimit_exhausted: int = 0
+    """Unknown results caused by running out of the rlimit."""
+    check_time: float = 0.0
+    rlimit_used: int = 0
+
+    def add(self, other: Z3Statistics) -> None:
+        self.queries += other.queries
+        self.sat += other.sat
+        self.unsat += other.unsat
+        self.unknown += other.unknown
+        self.rlimit_exhausted += other.rlimit_exhausted
+        self.check_time += other.check_time
+        self.rlimit_used += other.rlimit_used
+
+
+@dataclass
+class SlowZ3Query:
+    path: Optional[str]
+    line: Optional[int]
+    column: Optional[int]
+    node: Optional[str]
+    """Type of the astroid node being checked when the query was made."""
+    formula_size: int
+    check_time: float
+    rlimit: int
+    rlimit_used: int
+    result: str
+
+
+@dataclass
+class Z3StatisticsCollector:
+    """
+    Statistics of the z3 queries, per file in which the query originated (see
+    :func:`z3_query_origin`). Queries checked longer than ``slow_query_threshold`` seconds are also
+    logged individually.
+    """
+
+    slow_query_threshold: Optional[float] = None
+    by_file: Dict[Optional[str], Z3Statistics] = field(default_factory=dict)
+    slow_queries: List[SlowZ3Query] = field(default_factory=list)
+    origin: Optional[nodes.NodeNG] = None
+
+    def get_origin_path(self) -> Optional[str]:
+        if self.origin is None:
+            return None
+        return self.origin.root().file
+
+    def record(
+        self,
+        condition: z3.ExprRef,
+        result: z3.CheckSatResult,
+        check_time: float,
+        rlimit: int,
+        rlimit_used: int,
+    ) -> None:
+        path = self.get_origin_path()
+        statistics = self.by_file.get(path)
+        if statistics is None:
+            statistics = self.by_file[path] = Z3Statistics()
+
+        statistics.queries += 1
+        statistics.check_time += check_time
+        statistics.rlimit_used += rlimit_used
+        if result == z3.sat:
+            statistics.sat += 1
+        elif result == z3.unsat:
+            statistics.unsat += 1
+        else:
+            statistics.unknown += 1
+            if rlimit_used >= rlimit:
+                statistics.rlimit_exhausted += 1
+
+        if self.slow_query_threshold is not None and check_time >= self.slow_query_threshold:
+            origin = self.origin
+            self.slow_queries.append(
+                SlowZ3Query(
+                    path,
+                    origin.fromlineno if origin is not None else None,
+                    origin.col_offset if origin is not None else None,
+                    type(origin).__name__ if origin is not None else None,
+                    get_formula_size(condition),
+                    check_time,
+                    rlimit,
+                    rlimit_used,
+                    str(result),
+                )
+            )
+
+    def total(self) -> Z3Statistics:
+        result = Z3Statistics()
+        for statistics in self.by_file.values():
+            result.add(statistics)
+        return result
+
+    def get_file_statistics(self, path: Optional[str]) -> Dict[str, Any]:
+        """Statistics and slow queries of the file with the given absolute path, as a dict."""
+        return {
+            **asdict(self.by_file.get(path, Z3Statistics())),
+            "slow_queries": [asdict(query) for query in self.slow_queries if query.path == path],
+        }
+
+    def to_dict(self, get_path: Callable[[str], str] = lambda path: path) -> Dict[str, Any]:
+        return {
+            "total": asdict(self.total()),
+            "files": {
+                get_path(path) if path is not None else None: asdict(statistics)
+                for path, statistics in self.by_file.items()
+            },
+            "slow_queries": [
+                {**asdict(query), "path": get_path(query.path) if query.path is not None else None}
+                for query in self.slow_queries
+            ],
+        }
+
+    def format_summary(self, limit: int = 10) -> str:
+        total = self.total()
+        lines = [
+            f"z3: {total.queries} queries ({total.sat} sat, {total.unsat} unsat, {total.unknown} "
+            f"unknown of which {total.rlimit_exhausted} exhausted the rlimit), "
+            f"{total.check_time:.3f} s checking, {total.rlimit_used} rlimit used"
+        ]
+        slowest = sorted(self.slow_queries, key=lambda query: query.check_time, reverse=True)
+        for query in slowest[:limit]:
+            lines.append(
+                f"  {query.check_time:.3f} s {query.result:7} size {query.formula_size:5} "
+                f"rlimit {query.rlimit_used}/{query.rlimit} "
+                f"at {query.path}:{query.line}:{query.column} ({query.node})"
+            )
+        if len(slowest) > limit:
+            lines.append(f"  ... {len(slowest) - limit} more slow queries")
+        return "\n".join(lines)
+
+
+_statistics_collector: Optional[Z3StatisticsCollector] = None
+
+
+def enable_z3_statistics(slow_query_threshold: Optional[float] = None) -> Z3StatisticsCollector:
+    global _statistics_collector
+    _statistics_collector = Z3StatisticsCollector(slow_query_threshold)
+    return _statistics_collector
+
+
+def disable_z3_statistics() -> None:
+    global _statistics_collector
+    _statistics_collector = None
+
+
+def get_z3_statistics() -> Optional[Z3StatisticsCollector]:
+    """Returns the collected statistics if collecting them is enabled."""
+    return _statistics_collector
+
+
+def z3_query_origin(visit: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator of checker visit methods; z3 queries made while visiting a node are attributed to it
+    (and to its file) in the statistics.
+    """
+
+    @wraps(visit)
+    def wrapper(self, node: nodes.NodeNG) -> T:
+        collector = _statistics_collector
+        if collector is None:
+            return visit(self, node)
+
+        previous = collector.origin
+        collector.origin = node
+        try:
+            return visit(self, node)
+        finally:
+            collector.origin = previous
+
+    return wrapper
+
+
+def get_formula_size(condition: z3.ExprRef) -> int:
+    """Number of distinct subterms of the formula."""
+    seen = set()
+    to_visit = [condition]
+    while to_visit:
+        expr = to_visit.pop()
+        expr_id = expr.get_id()
+        if expr_id in seen:
+            continue
+        seen.add(expr_id)
+        to_visit.extend(expr.children())
+    return len(seen)
+
+
+def _get_rlimit_count(solver: z3.Solver) -> int:
+    """The rlimit count is shared by all solvers of the context, it only grows."""
+    statistics = solver.statistics()
+    return statistics.get_key_value("rlimit count") if "rlimit count" in statistics.keys() else 0
+
+
+@profiled("z3")
 def sat_check_condition(condition: z3.ExprRef, rlimit=1700) -> z3.CheckSatResult:
     solver = z3.Then(
         z3.Tactic("simplify"),
@@ -366,7 +573,18 @@ def sat_check_condition(condition: z3.ExprRef, rlimit=1700) -> z3.CheckSatResult
     ).solver()
     solver.set("rlimit", rlimit)
     solver.add(condition)
-    return solver.check()
+
+    collector = _statistics_collector
+    if collector is None:
+        return solver.check()
+
+    rlimit_count = _get_rlimit_count(solver)
+    start = time.perf_counter()
+    result = solver.check()
+    check_time = time.perf_counter() - start
+    rlimit_used = _get_rlimit_count(solver) - rlimit_count
+    collector.record(condition, result, check_time, rlimit, rlimit_used)
+    return result
 
 
 def unsatisfiable(condition: z3.ExprRef, rlimit=1700) -> bool:
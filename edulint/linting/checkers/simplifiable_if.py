@@ -21,6 +21,7 @@ from edulint.linting.analyses.z3_analysis import (
     convert_condition_to_z3_expression,
     unsatisfiable,
     _is_bool_node,
+    z3_query_origin,
 )
 
 from edulint.linting.analyses.z3_block_analysis import (
@@ -1357,6 +1358,7 @@ class SimplifiableIf(BaseChecker):  # type: ignore
         "use-if-elif-else",
         "use-if-elif-else-modifying",
     )
+    @z3_query_origin
     def visit_if(self, node: nodes.If) -> None:
         if any(
             self.linter.is_message_enabled(symbol)
@@ -1389,6 +1391,7 @@ class SimplifiableIf(BaseChecker):  # type: ignore
             self._check_for_use_if_elif_else(node)
 
     @only_required_for_messages("simplifiable-if-expr", "simplifiable-if-expr-conj")
+    @z3_query_origin
     def visit_ifexp(self, node: nodes.IfExp) -> None:
         then, orelse = node.body, node.orelse
         assert then is not None and orelse is not None
@@ -2286,12 +2289,14 @@ class SimplifiableIf(BaseChecker):  # type: ignore
         "redundant-condition-part",
         "condition-always-true-or-false",
     )
+    @z3_query_origin
     def visit_boolop(self, node: nodes.BoolOp) -> None:
         self._check_for_simplification_of_boolop(node)
 
     @only_required_for_messages(
         "condition-always-true-or-false",
     )
+    @z3_query_origin
     def visit_compare(self, node: nodes.Compare) -> None:
         if isinstance(node.parent, nodes.BoolOp) or not is_pure_expression(node):
             return
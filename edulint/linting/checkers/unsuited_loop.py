@@ -31,7 +31,7 @@ from edulint.linting.analyses.z3_block_analysis import (
     END_NODES,
     condition_implies_another_with_block_in_between,
 )
-from edulint.linting.analyses.z3_analysis import sat_condition
+from edulint.linting.analyses.z3_analysis import sat_condition, z3_query_origin
 
 
 class UnsuitedLoop(BaseChecker):
@@ -251,6 +251,7 @@ class UnsuitedLoop(BaseChecker):
     @only_required_for_messages(
         "no-while-true", "use-for-loop", "explicit-infinite-loop", "implicit-infinite-loop"
     )
+    @z3_query_origin
     def visit_while(self, node: nodes.While) -> None:
         self._check_no_while_true(node)
         self._check_use_for_loop(node)
@@ -520,6 +521,7 @@ class UnsuitedLoop(BaseChecker):
         "use-enumerate",
         "use-foreach",
     )
+    @z3_query_origin
     def visit_for(self, node: nodes.For) -> None:
         self._check_use_tighter_bounds(node)
         self._check_modifying_iterable(node)
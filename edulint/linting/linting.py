@@ -1,17 +1,22 @@
-from io import StringIO
-from typing import List, Callable, Tuple, Dict, Set, Any
-from edulint.linting.problem import ProblemJson, Problem
+from typing import List, Callable, Tuple, Dict, Set, Iterator, Optional
+from edulint.linting.problem import Problem
 from edulint.linting.nonparsing_checkers import report_infile_config
 from edulint.linting.process_handler import ProcessHandler
-from edulint.linting.overrides import get_overriders
-from edulint.linting.tweakers import get_tweakers, Tweakers
+from edulint.linting.postprocessing import PostProcessor
+from edulint.linting.profiling import (
+    StageHook,
+    StageHooks,
+    current_stage_hooks,
+    get_profiler,
+    stage,
+)
 from edulint.config.config import ImmutableConfig
-from edulint.config.language_translations import LangTranslations
+from edulint.config.language_translations import LangTranslations, LangTranslator
 from edulint.options import Option, ImmutableT
 from edulint.linters import Linter
 from functools import partial
+from contextlib import nullcontext
 import sys
-import json
 import os
 from pathlib import Path
 from loguru import logger
@@ -25,83 +30,74 @@ def get_proper_path(path: str) -> str:
     return os.path.abspath(path) if os.path.isabs(path) else os.path.relpath(path)
 
 
-def flake8_to_problem(enablers: Dict[str, str], raw: ProblemJson) -> Problem:
-    assert isinstance(raw["filename"], str), f'got {type(raw["filename"])} for filename'
-    assert isinstance(raw["line_number"], int), f'got {type(raw["line_number"])} for line_number'
-    assert isinstance(
-        raw["column_number"], int
-    ), f'got {type(raw["column_number"])} for column_number'
-    assert isinstance(raw["code"], str), f'got {type(raw["code"])} for code'
-    assert isinstance(raw["text"], str), f'got {type(raw["text"])} for text'
-
-    return Problem(
-        Linter.FLAKE8,
-        enablers.get(raw["code"]),
-        get_proper_path(raw["filename"]),
-        raw["line_number"],
-        raw["column_number"],
-        raw["code"],
-        raw["text"],
-    )
-
-
 def is_pylint_out_of_file_problem(path):
     return any(segment in path.lower() for segment in ("command line", "configuration file"))
 
 
-def pylint_to_problem(
-    files_or_dirs: List[str], enablers: Dict[str, str], raw: ProblemJson
-) -> Problem:
-    assert isinstance(raw["path"], str), f'got {type(raw["path"])} for path'
-    assert isinstance(raw["line"], int), f'got {type(raw["line"])} for line'
-    assert isinstance(raw["column"], int), f'got {type(raw["column"])} for column'
-    assert isinstance(raw["messageId"], str), f'got {type(raw["messageId"])} for messageId'
-    assert isinstance(raw["message"], str), f'got {type(raw["message"])} for message'
-    assert (
-        isinstance(raw["endLine"], int) or raw["endLine"] is None
-    ), f'got {type(raw["endLine"])} for endLine'
-    assert (
-        isinstance(raw["endColumn"], int) or raw["endColumn"] is None
-    ), f'got {type(raw["endColumn"])} for endColumn'
-    assert isinstance(raw["symbol"], str), f'get {type(raw["symbol"])} for symbol'
-
-    def get_used_filename(path: str) -> str:
-        if is_pylint_out_of_file_problem(path):
-            return path
+class RootIndex:
+    """
+    Maps paths of linted files to the index of the passed file or directory (root) they belong to
+    and to the path under which their problems are reported. Roots are resolved once and each
+    file path only the first time it is seen, so that later lookups are plain dict accesses.
+    """
+
+    def __init__(self, files_or_dirs: List[str]) -> None:
+        self.files_or_dirs = [Path(fd) for fd in files_or_dirs]
+        self._resolved_roots: Optional[List[Path]] = None
+        self._used_paths: Dict[str, str] = {}
+        self._root_indices: Dict[str, int] = {}
 
-        path = Path(path)
-        abs_path = path.resolve()
-        for fd in [Path(path) for path in files_or_dirs]:
-            abs_fd = fd.resolve()
+    def _get_resolved_roots(self) -> List[Path]:
+        if self._resolved_roots is None:
+            self._resolved_roots = [fd.resolve() for fd in self.files_or_dirs]
+        return self._resolved_roots
+
+    def _compute_used_path(self, path: str) -> str:
+        abs_path = Path(path).resolve()
+        for fd, abs_fd in zip(self.files_or_dirs, self._get_resolved_roots()):
             if abs_fd == abs_path or abs_fd in abs_path.parents:
                 if fd.is_absolute():
-                    return abs_path
-                else:
-                    cwd_parts = Path.cwd().parts
-                    abs_path_parts = abs_path.parts
+                    return get_proper_path(str(abs_path))
+
+                cwd_parts = Path.cwd().parts
+                abs_path_parts = abs_path.parts
 
-                    for i in range(min(len(cwd_parts), len(abs_path_parts))):
-                        if cwd_parts[i] != abs_path_parts[i]:
-                            break
+                for i in range(min(len(cwd_parts), len(abs_path_parts))):
+                    if cwd_parts[i] != abs_path_parts[i]:
+                        break
 
-                    return Path(*[".."] * (len(cwd_parts) - i), *abs_path_parts[i:])
+                return get_proper_path(
+                    str(Path(*[".."] * (len(cwd_parts) - i), *abs_path_parts[i:]))
+                )
         assert False, f"unreachable, but {path}"
 
-    code_enabler = enablers.get(raw["messageId"])
-    symbol_enabler = enablers.get(raw["symbol"])
+    def get_used_path(self, path: str) -> str:
+        """Returns the path under which problems reported by pylint for ``path`` are shown."""
+        if is_pylint_out_of_file_problem(path):
+            return path
 
-    return Problem(
-        Linter.PYLINT,
-        code_enabler if code_enabler is not None else symbol_enabler,
-        get_proper_path(get_used_filename(raw["path"])),
-        raw["line"],
-        raw["column"],
-        raw["messageId"],
-        raw["message"],
-        raw["endLine"],
-        raw["endColumn"],
-        raw["symbol"],
-    )
+        used_path = self._used_paths.get(path)
+        if used_path is None:
+            used_path = self._used_paths[path] = sys.intern(self._compute_used_path(path))
+        return used_path
+
+    def _compute_root_index(self, path: str) -> int:
+        if is_pylint_out_of_file_problem(path):
+            return -1
+
+        parsed_path = Path(path)
+        parents = parsed_path.parents
+        for i, fd in enumerate(self.files_or_dirs):
+            if fd == parsed_path or fd in parents:
+                return i
+        assert False, "unreachable"
+
+    def get_root_index(self, path: str) -> int:
+        """Returns the index of the root a reported path belongs to (-1 for out-of-file problems)."""
+        index = self._root_indices.get(path)
+        if index is None:
+            index = self._root_indices[path] = self._compute_root_index(path)
+        return index
 
 
 def lint_in_subprocess(
@@ -117,37 +113,6 @@ def lint_in_subprocess(
     return return_code, outs, errs
 
 
-def process_results(
-    linter: Linter,
-    return_code: int,
-    outs: str,
-    errs: str,
-    result_getter: Callable[[Any], Any],
-    out_to_problem: Callable[[Dict[str, str], ProblemJson], Problem],
-    enablers: Dict[str, str],
-) -> List[Problem]:
-    errs = errs.strip()
-    if errs:
-        logger.error(errs)
-
-    if (linter == Linter.FLAKE8 and return_code not in (0, 1)) or (
-        linter == Linter.PYLINT and return_code == 32
-    ):
-        raise EduLintLinterFailedException(f"{linter} exited with return code {return_code}")
-
-    if not outs:
-        return []
-
-    try:
-        parsed = json.loads(outs)
-    except json.decoder.JSONDecodeError as e:
-        logger.critical("could not parse results:\n{e}", e=e)
-        logger.debug(outs)
-        raise e
-
-    return list(map(partial(out_to_problem, enablers), result_getter(parsed)))
-
-
 def lint_edulint(files_or_dirs: List[str], config: ImmutableConfig) -> List[Problem]:
     ignored_infile = set(config[Option.IGNORE_INFILE_CONFIG_FOR])
     if len(ignored_infile) > 0:
@@ -156,100 +121,90 @@ def lint_edulint(files_or_dirs: List[str], config: ImmutableConfig) -> List[Prob
 
 
 def lint_flake8(files_or_dirs: List[str], config: ImmutableConfig) -> List[Problem]:
-    from flake8.main.application import Application
-
-    new_stdout = StringIO()
-    old_stdout = sys.stdout
-    sys.stdout = new_stdout
+    from edulint.linting.reporters import ProblemApplication
+
+    enablers = config.enablers
+    proper_paths: Dict[str, str] = {}
+
+    def violation_to_problem(violation) -> Problem:
+        path = proper_paths.get(violation.filename)
+        if path is None:
+            path = proper_paths[violation.filename] = sys.intern(
+                get_proper_path(violation.filename)
+            )
+        code = sys.intern(violation.code)
+        return Problem(
+            Linter.FLAKE8,
+            enablers.get(code),
+            path,
+            violation.line_number,
+            violation.column_number,
+            code,
+            violation.text,
+        )
 
-    new_stderr = StringIO()
-    old_stderr = sys.stderr
-    sys.stderr = new_stderr
+    flake8_args = list(config[Option.FLAKE8])
+    if get_profiler() is not None:
+        flake8_args.append("--jobs=1")  # so that each file is measured in this process
 
+    application = ProblemApplication(violation_to_problem)
     try:
-        Application()._run(["--format=json"] + list(config[Option.FLAKE8]) + files_or_dirs)
-        return_code = 0
+        application._run(flake8_args + files_or_dirs)
     except SystemExit as e:
-        return_code = e.code
-
-    sys.stdout = old_stdout
-    sys.stderr = old_stderr
-
-    return process_results(
-        Linter.FLAKE8,
-        return_code,
-        new_stdout.getvalue(),
-        new_stderr.getvalue(),
-        lambda r: [problem for problems in r.values() for problem in problems],
-        flake8_to_problem,
-        config.enablers,
-    )
-
-
-def lint_pylint(files_or_dirs: List[str], config: ImmutableConfig) -> List[Problem]:
-    pylint_args = ["--recursive=y"] + list(config[Option.PYLINT]) + files_or_dirs
+        if e.code not in (0, 1):
+            raise EduLintLinterFailedException(f"{Linter.FLAKE8} exited with return code {e.code}")
 
-    from pylint.lint import Run
-    from pylint.reporters.json_reporter import JSON2Reporter
+    if application.catastrophic_failure:
+        raise EduLintLinterFailedException(f"{Linter.FLAKE8} failed to run its checks")
 
-    output = StringIO()
-    reporter = JSON2Reporter(output)
+    return application.problems
 
-    new_stderr = StringIO()
-    old_stderr = sys.stderr
-    sys.stderr = new_stderr
 
-    try:
-        Run(pylint_args, reporter=reporter, exit=False)
-        return_code = 0
-    except SystemExit as e:
-        return_code = e.code
-
-    sys.stderr = old_stderr
+def pylint_message_to_problem(root_index: RootIndex, enablers: Dict[str, str], message) -> Problem:
+    code_enabler = enablers.get(message.msg_id)
+    symbol_enabler = enablers.get(message.symbol)
 
-    return process_results(
+    return Problem(
         Linter.PYLINT,
-        return_code,
-        output.getvalue(),
-        new_stderr.getvalue(),
-        lambda r: r["messages"],
-        partial(pylint_to_problem, files_or_dirs),
-        config.enablers,
+        code_enabler if code_enabler is not None else symbol_enabler,
+        root_index.get_used_path(message.path),
+        message.line,
+        message.column,
+        sys.intern(message.msg_id),
+        message.msg or "",
+        message.end_line,
+        message.end_column,
+        sys.intern(message.symbol),
     )
 
 
-def apply_overrides(problems: List[Problem], overriders: Dict[str, Set[str]]) -> List[Problem]:
-    codes_on_lines: Dict[Tuple[str, int], Set[str]] = {
-        (problem.path, problem.line): set() for problem in problems
-    }
-
-    for problem in problems:
-        codes_on_lines[(problem.path, problem.line)].add(problem.code)
-
-    result = []
-    for problem in problems:
-        o = overriders.get(problem.code, set())
-        if not (o & codes_on_lines[(problem.path, problem.line)]):
-            result.append(problem)
-
-    return result
-
-
-def apply_tweaks(
-    problems: List[Problem], tweakers: Tweakers, config: ImmutableConfig
+def lint_pylint(
+    files_or_dirs: List[str],
+    config: ImmutableConfig,
+    root_index: Optional[RootIndex] = None,
+    checked_paths: Optional[Set[str]] = None,
 ) -> List[Problem]:
-    result = []
-    for problem in problems:
-        tweaker = tweakers.get((problem.source, problem.code))
-        if tweaker:
-            if tweaker.should_keep(
-                problem, [arg for arg in config if arg.option in tweaker.used_options]
-            ):
-                problem.text = tweaker.get_reword(problem)
-                result.append(problem)
-        else:
-            result.append(problem)
-    return result
+    """
+    Lints the files or directories with pylint and returns the problems. If ``checked_paths`` is
+    passed, the paths of all checked files (as used in the problems) are added to it.
+    """
+    if root_index is None:
+        root_index = RootIndex(files_or_dirs)
+    pylint_args = ["--recursive=y"] + list(config[Option.PYLINT])
+
+    from edulint.linting.pylint_pool import run_pylint
+    from edulint.linting.reporters import ProblemReporter
+
+    reporter = ProblemReporter(partial(pylint_message_to_problem, root_index, config.enablers))
+    try:
+        run_pylint(pylint_args, files_or_dirs, reporter)
+    except SystemExit as e:
+        if e.code == 32:
+            raise EduLintLinterFailedException(f"{Linter.PYLINT} exited with return code {e.code}")
+
+    if checked_paths is not None:
+        checked_paths.update(map(root_index.get_used_path, reporter.checked_paths))
+    return reporter.problems
 
 
 def lint_one(filename: str, config: Tuple[ImmutableConfig, LangTranslations]) -> List[Problem]:
@@ -257,22 +212,15 @@ def lint_one(filename: str, config: Tuple[ImmutableConfig, LangTranslations]) ->
     return lint_many([([filename], option_config, lang_translations)])
 
 
-def sort(files_or_dirs: List[str], problems: List[Problem]) -> List[Problem]:
-    files_or_dirs = [Path(path) for path in files_or_dirs]
-
-    def get_file_or_dir_index(path: str):
-        if is_pylint_out_of_file_problem(path):
-            return -1
-
-        path = Path(path)
-        for i, fd in enumerate(files_or_dirs):
-            if fd == path or fd in path.parents:
-                return i
-        assert False, "unreachable"
+def sort(
+    files_or_dirs: List[str], problems: List[Problem], root_index: Optional[RootIndex] = None
+) -> List[Problem]:
+    if root_index is None:
+        root_index = RootIndex(files_or_dirs)
 
     problems.sort(
         key=lambda problem: (
-            get_file_or_dir_index(problem.path),
+            root_index.get_root_index(problem.path),
             problem.path,
             problem.line,
             problem.column,
@@ -281,35 +229,202 @@ def sort(files_or_dirs: List[str], problems: List[Problem]) -> List[Problem]:
     return problems
 
 
-def lint(files_or_dirs: List[str], config: ImmutableConfig) -> List[Problem]:
+# files of a larger partition are linted (and yielded) this many at a time, unless cross-file checks
+# need to see all of them at once
+LINT_CHUNK_SIZE = 64
+
+# the pylint messages computed over all linted modules, by the names that enable or disable them
+_CROSS_FILE_MESSAGES = {
+    "duplicate-code": ("duplicate-code", "r0801", "similarities"),
+    "cyclic-import": ("cyclic-import", "r0401", "imports"),
+}
+
+
+def uses_cross_file_checks(pylint_args: List[str]) -> bool:
+    """Returns whether the pylint arguments leave a message that compares several files enabled."""
+    enabled = {message: True for message in _CROSS_FILE_MESSAGES}
+    for arg in pylint_args:
+        option, _eq, value = arg.lower().partition("=")
+        if option not in ("--enable", "-e", "--disable", "-d"):
+            continue
+        names = {name.strip() for name in value.split(",")}
+        for message, message_names in _CROSS_FILE_MESSAGES.items():
+            if names & {"all", "r", *message_names}:
+                enabled[message] = option in ("--enable", "-e")
+    return any(enabled.values())
+
+
+def _get_entries(path: str) -> List[str]:
+    """
+    Returns the path itself if it is a file, otherwise its Python files and subdirectories, in the
+    order of the paths of the files they contain. Symlinked directories are left out, as they
+    would be when the linters walk the directory.
+    """
+    if not os.path.isdir(path):
+        return [path]
+
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                entries.append((entry.name + "/", entry.path))
+            elif not entry.is_dir() and os.path.splitext(entry.name)[1].lower() == ".py":
+                entries.append((entry.name, entry.path))
+    return [entry_path for _key, entry_path in sorted(entries)]
+
+
+def _get_chunks(files_or_dirs: List[str], config: ImmutableConfig) -> List[List[str]]:
+    """
+    Splits the files and the entries of the directories into chunks of ``LINT_CHUNK_SIZE``. The
+    linters walk the subdirectories themselves and apply their ignore and exclude options to the
+    passed paths, so they check the same files as when given the whole directories.
+    """
+    if uses_cross_file_checks(list(config[Option.PYLINT])):
+        return [files_or_dirs]
+
+    entries = [entry for fd in files_or_dirs for entry in _get_entries(fd)]
+    if len(entries) <= LINT_CHUNK_SIZE:
+        return [files_or_dirs]
+    return [entries[i : i + LINT_CHUNK_SIZE] for i in range(0, len(entries), LINT_CHUNK_SIZE)]
+
+
+def lint_files(
+    files_or_dirs: List[str],
+    config: ImmutableConfig,
+    lang_translator: Optional[LangTranslator] = None,
+    hooks: StageHooks = (),
+) -> Iterator[Tuple[str, List[Problem]]]:
+    """
+    Lints the files or directories using the config and yields the post-processed problems of each
+    file (sorted by line and column), file by file in the order of ``sort``. Each checked file
+    (and each file passed directly) is yielded, even if it has no problems. The hooks are called
+    around each stage.
+
+    If the files and the entries of the directories are more than ``LINT_CHUNK_SIZE`` and no enabled
+    check compares several files, they are linted in chunks of that size and the problems of each
+    chunk are yielded before the next one is linted.
+    """
     logger.info("linting files: {files_or_dirs}", files_or_dirs=files_or_dirs)
     logger.info("using config: {config}", config=config)
 
-    edulint_result = lint_edulint(files_or_dirs, config)
-    flake8_result = [] if config[Option.NO_FLAKE8] else lint_flake8(files_or_dirs, config)
-    pylint_result = lint_pylint(files_or_dirs, config)
+    root_index = RootIndex(files_or_dirs)
+    passed_files = {get_proper_path(fd) for fd in files_or_dirs if os.path.isfile(fd)}
+    post_processor = PostProcessor(config, lang_translator)
+    for chunk in _get_chunks(files_or_dirs, config):
+        yield from _lint_chunk(chunk, config, root_index, passed_files, post_processor, hooks)
+
+
+def _lint_chunk(
+    files_or_dirs: List[str],
+    config: ImmutableConfig,
+    root_index: RootIndex,
+    passed_files: Set[str],
+    post_processor: PostProcessor,
+    hooks: StageHooks,
+) -> Iterator[Tuple[str, List[Problem]]]:
+    by_path: Dict[str, List[Problem]] = {
+        path: [] for path in map(get_proper_path, files_or_dirs) if path in passed_files
+    }
+
+    with stage(hooks, "linter", linter=Linter.EDULINT, files_or_dirs=files_or_dirs):
+        for problem in lint_edulint(files_or_dirs, config):
+            by_path.setdefault(problem.path, []).append(problem)
+    if not config[Option.NO_FLAKE8]:
+        with stage(hooks, "linter", linter=Linter.FLAKE8, files_or_dirs=files_or_dirs):
+            for problem in lint_flake8(files_or_dirs, config):
+                by_path.setdefault(problem.path, []).append(problem)
+    # the analyses run inside pylint, which is why the hooks are passed to them through the thread
+    checked_paths: Set[str] = set()
+    with stage(hooks, "linter", linter=Linter.PYLINT, files_or_dirs=files_or_dirs):
+        with current_stage_hooks(hooks):
+            pylint_problems = lint_pylint(files_or_dirs, config, root_index, checked_paths)
+        for problem in pylint_problems:
+            by_path.setdefault(problem.path, []).append(problem)
+    for path in checked_paths:
+        by_path.setdefault(path, [])
+
+    profiler = get_profiler()
+    if profiler is not None:
+        profiler.assign_paths(root_index.get_used_path)
+    measured = profiler is not None or len(hooks) > 0
+
+    for path in sorted(by_path, key=lambda path: (root_index.get_root_index(path), path)):
+        if measured:
+            problems = _post_process_measured(post_processor, path, by_path.pop(path), hooks)
+        else:
+            problems = post_processor.process(by_path.pop(path))
+        problems.sort(key=lambda problem: (problem.line, problem.column))
+        yield path, problems
+
+
+def _post_process_measured(
+    post_processor: PostProcessor, path: str, problems: List[Problem], hooks: StageHooks
+) -> List[Problem]:
+    profiler = get_profiler()
+    with profiler.measure_used("postprocessing", path) if profiler is not None else nullcontext():
+        with stage(hooks, "postprocessing", path=path):
+            problems = post_processor.process(problems, translate=False)
+        with stage(hooks, "translation", path=path):
+            return post_processor.translate(problems)
+
+
+def lint(
+    files_or_dirs: List[str],
+    config: ImmutableConfig,
+    lang_translator: Optional[LangTranslator] = None,
+) -> List[Problem]:
+    return [
+        problem
+        for _path, problems in lint_files(files_or_dirs, config, lang_translator)
+        for problem in problems
+    ]
 
-    result = apply_overrides(edulint_result + flake8_result + pylint_result, get_overriders())
-    result = apply_tweaks(result, get_tweakers(), config)
-    return sort(files_or_dirs, result)
 
+FileResult = Tuple[str, ImmutableConfig, List[Problem]]
+FileResultConsumer = Callable[[str, ImmutableConfig, List[Problem]], None]
 
-def translate(lang_translations: LangTranslations, problem: Problem):
-    translation = lang_translations.get(problem.code)
-    if translation is None:
-        translation = lang_translations.get(problem.symbol)
-        if translation is None:
-            return problem
 
-    problem.text = translation.translate(problem.code, problem.text)
-    return problem
+def _get_lang_translators(
+    partition: List[Tuple[List[str], ImmutableConfig, LangTranslations]],
+) -> Iterator[Tuple[List[str], ImmutableConfig, LangTranslator]]:
+    lang_translators: Dict[int, LangTranslator] = {}
+    for files_or_dirs, config, lang_translations in partition:
+        # partitions using the same config file share the translations object
+        lang_translator = lang_translators.get(id(lang_translations))
+        if lang_translator is None:
+            lang_translator = LangTranslator(lang_translations)
+            lang_translators[id(lang_translations)] = lang_translator
+        yield files_or_dirs, config, lang_translator
+
+
+def iter_lint_files(
+    partition: List[Tuple[List[str], ImmutableConfig, LangTranslations]],
+    hooks: StageHooks = (),
+) -> Iterator[FileResult]:
+    """
+    Lints the partition and yields the path, config and problems of each file as soon as its
+    problems are post-processed. Only the problems of the part being linted are held in memory.
+    """
+    for files_or_dirs, config, lang_translator in _get_lang_translators(partition):
+        for path, problems in lint_files(files_or_dirs, config, lang_translator, hooks):
+            yield path, config, problems
 
 
 def lint_many(
     partition: List[Tuple[List[str], ImmutableConfig, LangTranslations]],
+    consumer: Optional[FileResultConsumer] = None,
+    hooks: Optional[List[StageHook]] = None,
 ) -> List[Problem]:
-    return [
-        translate(lang_translations, problem)
-        for files_or_dirs, config, lang_translations in partition
-        for problem in lint(files_or_dirs, config)
-    ]
+    """
+    Lints the partition and returns all the problems. If a consumer is passed, it is instead
+    called with the path, config and problems of each file as soon as they are ready, the problems
+    are not collected and an empty list is returned. The hooks are called around each stage of
+    linting (see :any:`StageHook`).
+    """
+    results = iter_lint_files(partition, tuple(hooks) if hooks is not None else ())
+    if consumer is not None:
+        for path, config, problems in results:
+            consumer(path, config, problems)
+        return []
+
+    return [problem for _path, _config, problems in results for problem in problems]
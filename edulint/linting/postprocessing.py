@@ -0,0 +1,118 @@
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from edulint.config.config import ImmutableConfig
+from edulint.config.language_translations import LangTranslator
+from edulint.linting.overrides import get_overriders
+from edulint.linting.problem import Problem
+from edulint.linting.tweakers import get_tweakers
+
+ProblemRule = Callable[[Problem], bool]
+"""Applied to each problem that was not overridden. May modify it; returns whether to keep it."""
+
+RuleFactory = Callable[[ImmutableConfig], Optional[ProblemRule]]
+"""Compiles a rule for the given config, or returns None if the rule does not apply to it."""
+
+_rule_factories: List[RuleFactory] = []
+
+
+def register_rule(factory: RuleFactory) -> RuleFactory:
+    """
+    Registers a post-processing rule. Rules are compiled once per config and applied in the order
+    of registration, after overrides and before translation. Usable as a decorator.
+    """
+    _rule_factories.append(factory)
+    return factory
+
+
+@register_rule
+def tweak_rule(config: ImmutableConfig) -> Optional[ProblemRule]:
+    tweakers = get_tweakers()
+    if not tweakers:
+        return None
+
+    # options used by each tweaker are looked up once per config instead of once per problem
+    bound = {
+        key: (tweaker, [arg for arg in config if arg.option in tweaker.used_options])
+        for key, tweaker in tweakers.items()
+    }
+
+    def apply(problem: Problem) -> bool:
+        tweaker_and_args = bound.get((problem.source, problem.code))
+        if tweaker_and_args is None:
+            return True
+
+        tweaker, args = tweaker_and_args
+        if not tweaker.should_keep(problem, args):
+            return False
+        problem.text = tweaker.get_reword(problem)
+        return True
+
+    return apply
+
+
+class PostProcessor:
+    """
+    Post-processing of linter output compiled for one config: drops overridden problems, applies
+    registered rules (tweakers and others) and translates messages, all in a single pass.
+    """
+
+    def __init__(
+        self,
+        config: ImmutableConfig,
+        lang_translator: Optional[LangTranslator] = None,
+        overriders: Optional[Dict[str, Set[str]]] = None,
+    ) -> None:
+        self.overriders = get_overriders() if overriders is None else overriders
+        self.overriding_codes: Set[str] = set().union(*self.overriders.values())
+        self.rules = [rule for rule in map(lambda factory: factory(config), _rule_factories) if rule]
+        self.lang_translator = (
+            lang_translator
+            if lang_translator is not None and lang_translator.lang_translations
+            else None
+        )
+
+    def process(self, problems: List[Problem], translate: bool = True) -> List[Problem]:
+        """
+        Post-processes problems (of one or more files), keeping their order. Without ``translate``,
+        the kept problems are not translated (see :meth:`translate`).
+        """
+        overriders = self.overriders
+        overriding_codes = self.overriding_codes
+        rules = self.rules
+        lang_translator = self.lang_translator if translate else None
+
+        codes_on_lines: Dict[Tuple[str, int], Set[str]] = {}
+        for problem in problems:
+            if problem.code in overriding_codes:
+                codes_on_lines.setdefault((problem.path, problem.line), set()).add(problem.code)
+
+        result = []
+        for problem in problems:
+            if codes_on_lines:
+                code_overriders = overriders.get(problem.code)
+                if code_overriders and not code_overriders.isdisjoint(
+                    codes_on_lines.get((problem.path, problem.line), ())
+                ):
+                    continue
+
+            if not all(rule(problem) for rule in rules):
+                continue
+
+            if lang_translator is not None:
+                translator = lang_translator.get_translator(problem.code, problem.symbol)
+                if translator is not None:
+                    problem.text = translator(problem.text)
+
+            result.append(problem)
+        return result
+
+    def translate(self, problems: List[Problem]) -> List[Problem]:
+        lang_translator = self.lang_translator
+        if lang_translator is None:
+            return problems
+
+        for problem in problems:
+            translator = lang_translator.get_translator(problem.code, problem.symbol)
+            if translator is not None:
+                problem.text = translator(problem.text)
+        return problems
@@ -2,12 +2,36 @@ from edulint.linters import Linter
 from dataclasses import dataclass, field, fields
 from dataclasses_json import dataclass_json, config
 from marshmallow import fields as mm_fields
-from typing import Optional, Dict, Union, List
+from typing import Optional, Dict, Union, List, Tuple, Any
+import json
+from json.encoder import encode_basestring_ascii
 
 ProblemJson = Dict[str, Union[str, int]]
+ProblemTuple = Tuple[
+    str, Optional[str], str, int, int, str, str, Optional[int], Optional[int], Optional[str]
+]
+
+
+def _with_slots(cls: type) -> type:
+    """
+    Recreates the dataclass with ``__slots__`` instead of a per-instance ``__dict__`` (like
+    ``dataclass(slots=True)``, which is only available since Python 3.10).
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)  # defaults are already part of the generated __init__
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
 
 
 @dataclass_json
+@_with_slots
 @dataclass
 class Problem:
     """Holds a single occurrence of an issue."""
@@ -77,6 +101,26 @@ class Problem:
         self.end_column = v
         return self
 
+    def to_tuple(self) -> ProblemTuple:
+        """Returns the values of the fields (in order, as they are serialized into JSON)."""
+        return (
+            self.source.to_name(),
+            self.enabled_by,
+            self.path,
+            self.line,
+            self.column,
+            self.code,
+            self.text,
+            self.end_line,
+            self.end_column,
+            self.symbol,
+        )
+
+    @staticmethod
+    def from_tuple(values: ProblemTuple) -> "Problem":
+        source, *rest = values
+        return Problem(Linter.from_name(source), *rest)
+
     def has_value(self, attr: str) -> bool:
         val = getattr(self, attr)
         return (
@@ -101,3 +145,53 @@ class Problem:
     def __str__(self) -> str:
         enabler_str = f" [{self.enabled_by}]" if self.enabled_by is not None else ""
         return f"{self.path}:{self.line}:{self.column}: {self.code} {self.text}{enabler_str}"
+
+
+PROBLEM_FIELDS = tuple(f.name for f in fields(Problem))
+
+
+def problem_to_dict(problem: Problem) -> Dict[str, Any]:
+    return dict(zip(PROBLEM_FIELDS, problem.to_tuple()))
+
+
+def problem_from_dict(raw: Dict[str, Any]) -> Problem:
+    return Problem.from_tuple(tuple(raw.get(name) for name in PROBLEM_FIELDS))
+
+
+def _encode_value(val: Union[str, int, None]) -> str:
+    if val is None:
+        return "null"
+    if isinstance(val, str):
+        return encode_basestring_ascii(val)
+    return str(val)
+
+
+def problems_to_json(problems: List[Problem], indent: Optional[int] = None) -> str:
+    """
+    Serializes problems into the same JSON as ``Problem.schema().dumps(problems, many=True)``,
+    without building and validating the schema.
+    """
+    if indent is None:
+        return json.dumps([problem_to_dict(problem) for problem in problems])
+    if len(problems) == 0:
+        return "[]"
+
+    # json.dumps with indent falls back to the slow pure-Python encoder, format by hand instead
+    prefixes = [f"\n{' ' * 2 * indent}{json.dumps(name)}: " for name in PROBLEM_FIELDS]
+    end = f"\n{' ' * indent}}}"
+    return (
+        f"[\n{' ' * indent}"
+        + f",\n{' ' * indent}".join(
+            "{"
+            + ",".join(
+                prefix + _encode_value(val) for prefix, val in zip(prefixes, problem.to_tuple())
+            )
+            + end
+            for problem in problems
+        )
+        + "\n]"
+    )
+
+
+def problems_from_json(problems_json: str) -> List[Problem]:
+    return [problem_from_dict(raw) for raw in json.loads(problems_json)]
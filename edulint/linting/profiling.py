@@ -0,0 +1,355 @@
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import os
+import threading
+import time
+import tracemalloc
+
+T = TypeVar("T")
+MIB = 1024 * 1024
+
+
+@dataclass
+class Timing:
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+    peak_memory: int = 0
+    retained_memory: int = 0
+
+    def add(self, other: "Timing") -> None:
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.calls += other.calls
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+        self.retained_memory += other.retained_memory
+
+    def to_dict(self, memory: bool = False) -> Dict[str, float]:
+        result = {"wall": round(self.wall, 6), "cpu": round(self.cpu, 6), "calls": self.calls}
+        if memory:
+            result["peak_memory"] = self.peak_memory
+            result["retained_memory"] = self.retained_memory
+        return result
+
+
+@dataclass
+class _Measurement:
+    wall: float
+    cpu: float
+    memory: Optional[int]
+    """Traced memory at the start, if tracing memory."""
+    lost_peak: int = 0
+    """Peak of the traced memory before it was reset by a nested measurement."""
+
+
+class Profiler:
+    """
+    Wall and CPU time spent in sections of linting (linters, analysis phases, checker methods),
+    per checked file. Sections may be nested, e.g. the time of ``checker:...`` sections is also
+    included in the ``pylint`` section of the same file.
+
+    With ``memory``, the memory allocated in the sections is traced by :mod:`tracemalloc` too:
+    ``peak_memory`` is the largest increase of the traced memory during a call of the section,
+    ``retained_memory`` the memory allocated by the calls and not freed when they end.
+
+    Times are first recorded under absolute paths; :meth:`assign_paths` then moves them under the
+    paths used in the reported problems.
+    """
+
+    def __init__(self, memory: bool = False) -> None:
+        self.memory = memory
+        self.current_path: Optional[str] = None
+        self._pending: Dict[str, Dict[str, Timing]] = {}
+        self._measurements: List[_Measurement] = []
+        self.timings: Dict[str, Dict[str, Timing]] = {}
+
+    def add(
+        self,
+        path: Optional[str],
+        section: str,
+        wall: float,
+        cpu: float,
+        peak_memory: int = 0,
+        retained_memory: int = 0,
+    ) -> None:
+        if path is not None:
+            self._record(
+                self._pending, path, section, Timing(wall, cpu, 1, peak_memory, retained_memory)
+            )
+
+    @staticmethod
+    def _record(
+        timings: Dict[str, Dict[str, Timing]], path: str, section: str, timing: Timing
+    ) -> None:
+        sections = timings.get(path)
+        if sections is None:
+            sections = timings[path] = {}
+        recorded = sections.get(section)
+        if recorded is None:
+            sections[section] = timing
+        else:
+            recorded.add(timing)
+
+    def _start(self) -> _Measurement:
+        if not self.memory:
+            return _Measurement(time.perf_counter(), time.thread_time(), None)
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self._measurements:
+            enclosing = self._measurements[-1]
+            enclosing.lost_peak = max(enclosing.lost_peak, peak)
+        tracemalloc.reset_peak()
+        measurement = _Measurement(time.perf_counter(), time.thread_time(), current)
+        self._measurements.append(measurement)
+        return measurement
+
+    def _stop(self, measurement: _Measurement) -> Timing:
+        wall = time.perf_counter() - measurement.wall
+        cpu = time.thread_time() - measurement.cpu
+        if measurement.memory is None:
+            return Timing(wall, cpu, 1)
+
+        current, peak = tracemalloc.get_traced_memory()
+        self._measurements.pop()
+        peak = max(peak, measurement.lost_peak)
+        if self._measurements:
+            enclosing = self._measurements[-1]
+            enclosing.lost_peak = max(enclosing.lost_peak, peak)
+        return Timing(
+            wall, cpu, 1, max(peak - measurement.memory, 0), current - measurement.memory
+        )
+
+    @contextmanager
+    def file(self, path: str) -> Iterator[None]:
+        """Sections measured in the block are recorded for the file."""
+        previous = self.current_path
+        self.current_path = os.path.abspath(path)
+        try:
+            yield
+        finally:
+            self.current_path = previous
+
+    @contextmanager
+    def measure(self, section: str, path: Optional[str] = None) -> Iterator[None]:
+        """Records the time spent in the block for the given or the current file."""
+        path = os.path.abspath(path) if path is not None else self.current_path
+        measurement = self._start()
+        try:
+            yield
+        finally:
+            timing = self._stop(measurement)
+            if path is not None:
+                self._record(self._pending, path, section, timing)
+
+    @contextmanager
+    def measure_used(self, section: str, used_path: str) -> Iterator[None]:
+        """Records the time spent in the block for the file with the path used in problems."""
+        measurement = self._start()
+        try:
+            yield
+        finally:
+            self._record(self.timings, used_path, section, self._stop(measurement))
+
+    def wrap(self, section: str, function: Callable[..., T]) -> Callable[..., T]:
+        """Returns the function measured as the section of the current file."""
+
+        def measured(*args, **kwargs) -> T:
+            measurement = self._start()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timing = self._stop(measurement)
+                if self.current_path is not None:
+                    self._record(self._pending, self.current_path, section, timing)
+
+        return measured
+
+    def assign_paths(self, get_used_path: Callable[[str], str]) -> None:
+        for path, sections in self._pending.items():
+            used_sections = self.timings.setdefault(get_used_path(path), {})
+            for section, timing in sections.items():
+                used_sections.setdefault(section, Timing()).add(timing)
+        self._pending.clear()
+
+    def get_file_timings(self, path: str) -> Dict[str, Dict[str, float]]:
+        return {
+            section: timing.to_dict(self.memory)
+            for section, timing in self.timings.get(path, {}).items()
+        }
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        return {path: self.get_file_timings(path) for path in self.timings}
+
+    def summary(self) -> Dict[str, Timing]:
+        """Timings of the sections summed over all files, the slowest first."""
+        result: Dict[str, Timing] = {}
+        for sections in self.timings.values():
+            for section, timing in sections.items():
+                result.setdefault(section, Timing()).add(timing)
+        return dict(sorted(result.items(), key=lambda item: item[1].wall, reverse=True))
+
+    def format_summary(self, limit: Optional[int] = 25) -> str:
+        summary = list(self.summary().items())
+        memory_header = f" {'peak [MiB]':>10} {'kept [MiB]':>10}" if self.memory else ""
+        lines = [
+            f"profile of {len(self.timings)} file(s)",
+            f"{'section':56} {'wall [s]':>10} {'cpu [s]':>10} {'calls':>8}{memory_header}",
+        ]
+        for section, timing in summary[:limit]:
+            line = f"{section:56} {timing.wall:10.3f} {timing.cpu:10.3f} {timing.calls:8}"
+            if self.memory:
+                line += f" {timing.peak_memory / MIB:10.2f} {timing.retained_memory / MIB:10.2f}"
+            lines.append(line)
+        if limit is not None and len(summary) > limit:
+            lines.append(f"... {len(summary) - limit} more section(s)")
+        return "\n".join(lines)
+
+
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Returns the profiler if profiling is enabled."""
+    return _profiler
+
+
+MEMORY_PROFILING_SUPPORTED = hasattr(tracemalloc, "reset_peak")  # Python 3.9+
+
+
+def enable_profiling(memory: bool = False) -> Profiler:
+    """Enables profiling; with ``memory``, also starts tracing memory allocations."""
+    global _profiler
+    if memory and not MEMORY_PROFILING_SUPPORTED:
+        raise RuntimeError("profiling memory requires Python 3.9 or newer")
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _profiler = Profiler(memory)
+    return _profiler
+
+
+def disable_profiling() -> None:
+    global _profiler
+    if _profiler is not None and _profiler.memory:
+        tracemalloc.stop()
+    _profiler = None
+
+
+@contextmanager
+def profiled_section(section: str) -> Iterator[None]:
+    """Measures the block as the section of the current file, if profiling is enabled."""
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.measure(section):
+        yield
+
+
+def profiled(section: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator measuring each call as the section of the current file, if profiling is enabled."""
+
+    def decorator(function: Callable[..., T]) -> Callable[..., T]:
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> T:
+            profiler = _profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.measure(section):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def is_edulint_checker(checker: object) -> bool:
+    return type(checker).__module__.startswith("edulint.")
+
+
+def instrument_walker(profiler: Profiler, walker) -> None:
+    """Measures each visit and leave method of EduLint checkers registered in the pylint walker."""
+    if getattr(walker, "edulint_instrumented", False):
+        return
+
+    for events in (walker.visit_events, walker.leave_events):
+        for callbacks in events.values():
+            callbacks[:] = [_instrument_callback(profiler, callback) for callback in callbacks]
+    walker.edulint_instrumented = True
+
+
+def _instrument_callback(profiler: Profiler, callback: Callable) -> Callable:
+    checker = getattr(callback, "__self__", None)
+    if checker is None or not is_edulint_checker(checker):
+        return callback
+    return profiler.wrap(f"checker:{checker.name}.{callback.__name__}", callback)
+
+
+# %% stage hooks
+
+StageHook = Callable[[str, Dict[str, Any]], ContextManager[Any]]
+"""
+Called with the name and attributes of a stage of linting when it starts; the stage runs in the
+returned context manager. Hooks are passed to :func:`edulint.check_code` (and similar functions)
+and apply only to the stages of that call. The stages are:
+
+- ``config`` -- finding the configuration of the files (``files_or_dirs``),
+- ``linter`` -- a run of a linter (``linter``, ``files_or_dirs``),
+- ``analysis`` -- the analyses of a file run before the checkers (``path``),
+- ``postprocessing`` -- overrides and tweaks of the problems of a file (``path``),
+- ``translation`` -- translation of the problems of a file (``path``).
+"""
+
+StageHooks = Tuple[StageHook, ...]
+
+_NO_STAGE = nullcontext()
+_current = threading.local()
+
+
+def stage(hooks: StageHooks, name: str, **attributes: Any) -> ContextManager[Any]:
+    """Runs the block as the stage in the hooks; does nothing if there are none."""
+    if not hooks:
+        return _NO_STAGE
+    if len(hooks) == 1:
+        return hooks[0](name, attributes)
+    return _nested_stages(hooks, name, attributes)
+
+
+@contextmanager
+def current_stage_hooks(hooks: StageHooks) -> Iterator[None]:
+    """
+    Makes the hooks available to code called by the linters in this thread (see
+    :func:`get_current_stage_hooks`) for the duration of the block. The block must not yield, so
+    that the hooks do not apply to code run while a generator is paused.
+    """
+    previous = getattr(_current, "hooks", ())
+    _current.hooks = hooks
+    try:
+        yield
+    finally:
+        _current.hooks = previous
+
+
+def get_current_stage_hooks() -> StageHooks:
+    return getattr(_current, "hooks", ())
+
+
+@contextmanager
+def _nested_stages(
+    hooks: StageHooks, name: str, attributes: Dict[str, Any]
+) -> Iterator[None]:
+    with ExitStack() as stack:
+        for hook in hooks:
+            stack.enter_context(hook(name, attributes))
+        yield
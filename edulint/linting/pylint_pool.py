@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator, List, Tuple
+
+from pylint.lint import PyLinter, Run
+from pylint.reporters.base_reporter import BaseReporter
+from pylint.utils import LinterStats
+
+from edulint.linting.analyses.patcher import teardown_module
+from edulint.linting.profiling import get_profiler, instrument_walker
+
+# Run refuses to configure a linter without files to check; this one is never checked
+PLACEHOLDER_FILE = "edulint-pylint-placeholder.py"
+
+# idle linters are kept for this many most recently used argument lists (in-file configs may
+# make each file's arguments distinct)
+MAX_POOLED_CONFIGS = 4
+
+
+class WarmPyLinter(PyLinter):
+    """
+    PyLinter which is configured by :class:`Run` but does not check anything while being
+    created, so that it can be kept and used to check files later.
+    """
+
+    configured = False
+
+    def check(self, files_or_modules) -> None:
+        if self.configured:
+            super().check(files_or_modules)
+
+    def generate_reports(self, verbose: bool = False):
+        if self.configured:
+            return super().generate_reports(verbose)
+        return None
+
+    def check_astroid_module(self, ast_node, walker, rawcheckers, tokencheckers):
+        profiler = get_profiler()
+        if profiler is None:
+            return self._check_and_tear_down(ast_node, walker, rawcheckers, tokencheckers)
+
+        instrument_walker(profiler, walker)
+        with profiler.file(ast_node.file), profiler.measure("pylint"):
+            return self._check_and_tear_down(ast_node, walker, rawcheckers, tokencheckers)
+
+    def _check_and_tear_down(self, ast_node, walker, rawcheckers, tokencheckers):
+        try:
+            return super().check_astroid_module(ast_node, walker, rawcheckers, tokencheckers)
+        finally:
+            teardown_module(ast_node)
+
+
+class WarmRun(Run):
+    LinterClass = WarmPyLinter
+
+
+def create_linter(args: Tuple[str, ...], reporter: BaseReporter) -> WarmPyLinter:
+    """
+    Parses the arguments, loads the plugins and registers the checkers, exactly as a pylint run
+    with the arguments would, but checks nothing.
+    """
+    linter = WarmRun(list(args) + [PLACEHOLDER_FILE], reporter=reporter, exit=False).linter
+    assert isinstance(linter, WarmPyLinter)
+    linter.configured = True
+    return linter
+
+
+class PyLinterPool:
+    """
+    Configured linters, kept per distinct argument list for the ``max_configs`` most recently used
+    lists. A linter is used by one check at a time; concurrent checks with the same arguments get
+    one linter each.
+    """
+
+    def __init__(self, max_configs: int = MAX_POOLED_CONFIGS) -> None:
+        self.max_configs = max_configs
+        self._idle: "OrderedDict[Tuple[str, ...], List[WarmPyLinter]]" = OrderedDict()
+        self._lock = Lock()
+
+    @contextmanager
+    def linter(self, args: List[str], reporter: BaseReporter) -> Iterator[WarmPyLinter]:
+        key = tuple(args)
+        with self._lock:
+            idle = self._idle.get(key)
+            linter = idle.pop() if idle else None
+
+        if linter is None:
+            linter = create_linter(key, reporter)
+        else:
+            linter.set_reporter(reporter)
+            # the statistics of the previous checks (kept per module) are not reported again
+            linter.stats = LinterStats()
+
+        yield linter
+        # a linter whose check raised is not returned to the pool
+        with self._lock:
+            self._idle.setdefault(key, []).append(linter)
+            self._idle.move_to_end(key)
+            while len(self._idle) > self.max_configs:
+                self._idle.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+
+_pool = PyLinterPool()
+
+
+def get_pylinter_pool() -> PyLinterPool:
+    return _pool
+
+
+def run_pylint(args: List[str], files_or_dirs: List[str], reporter: BaseReporter) -> None:
+    """Checks the files like ``pylint <args> <files_or_dirs>`` would, using a pooled linter."""
+    with get_pylinter_pool().linter(args, reporter) as linter:
+        linter.check(files_or_dirs)
+        linter.generate_reports()
@@ -0,0 +1,97 @@
+from typing import Callable, List, Optional, Sequence
+
+from flake8.checker import FileChecker, Manager
+from flake8.formatting.base import BaseFormatter
+from flake8.main.application import Application
+from flake8.violation import Violation
+from pylint.message import Message
+from pylint.reporters.base_reporter import BaseReporter
+from pylint.reporters.ureports.nodes import Section
+
+from edulint.linting.problem import Problem
+from edulint.linting.profiling import Profiler, get_profiler
+
+
+class ProblemFormatter(BaseFormatter):
+    """Flake8 formatter which turns violations into problems as they are reported."""
+
+    def __init__(self, options, to_problem: Callable[[Violation], Problem]) -> None:
+        self.to_problem = to_problem
+        self.problems: List[Problem] = []
+        super().__init__(options)
+
+    def handle(self, error: Violation) -> None:
+        self.problems.append(self.to_problem(error))
+
+    def _write(self, output: str) -> None:
+        """Statistics and benchmarks are not printed."""
+
+
+class ProfilingManager(Manager):
+    """Flake8 manager measuring the check of each file. Files are checked in this process."""
+
+    def __init__(self, profiler: Profiler, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.profiler = profiler
+
+    def run_serial(self) -> None:
+        results = []
+        for filename in self.filenames:
+            with self.profiler.measure("flake8", filename):
+                checker = FileChecker(filename=filename, plugins=self.plugins, options=self.options)
+                results.append(checker.run_checks())
+        self.results = results
+
+
+class ProblemApplication(Application):
+    """Flake8 application reporting through a :class:`ProblemFormatter`."""
+
+    def __init__(self, to_problem: Callable[[Violation], Problem]) -> None:
+        super().__init__()
+        self.to_problem = to_problem
+
+    def make_formatter(self) -> None:
+        self.formatter = ProblemFormatter(self.options, self.to_problem)
+
+    def make_file_checker_manager(self, argv: Sequence[str]) -> None:
+        profiler = get_profiler()
+        if profiler is None:
+            super().make_file_checker_manager(argv)
+            return
+
+        assert self.guide is not None and self.plugins is not None
+        self.file_checker_manager = ProfilingManager(
+            profiler, style_guide=self.guide, plugins=self.plugins.checkers, argv=argv
+        )
+
+    @property
+    def problems(self) -> List[Problem]:
+        return self.formatter.problems if self.formatter is not None else []
+
+
+class ProblemReporter(BaseReporter):
+    """Pylint reporter which turns messages into problems as they are emitted."""
+
+    name = "edulint-problems"
+
+    def __init__(self, to_problem: Callable[[Message], Problem]) -> None:
+        super().__init__()
+        self.to_problem = to_problem
+        self.problems: List[Problem] = []
+        self.checked_paths: List[str] = []
+
+    def on_set_current_module(self, module: str, filepath: Optional[str]) -> None:
+        if filepath is not None:
+            self.checked_paths.append(filepath)
+
+    def handle_message(self, msg: Message) -> None:
+        self.problems.append(self.to_problem(msg))
+
+    def display_reports(self, layout: Section) -> None:
+        """Reports are not displayed."""
+
+    def _display(self, layout: Section) -> None:
+        """Nothing is displayed."""
+
+    def display_messages(self, layout: Optional[Section]) -> None:
+        """Messages are collected as problems instead of being displayed."""
@@ -0,0 +1,123 @@
+from concurrent.futures import Future, wait
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+import atexit
+import os
+import time
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    import requests
+
+OFFLINE_ENV_VARIABLE = "EDULINT_OFFLINE"
+HTTP_POOL_SIZE = 8
+EXIT_TIMEOUT = 0.5  # seconds the exit waits for the refreshes in flight
+
+
+def is_offline() -> bool:
+    """Background network access is disabled by setting EDULINT_OFFLINE to a non-empty value."""
+    return os.environ.get(OFFLINE_ENV_VARIABLE, "").strip().lower() not in ("", "0", "false", "no")
+
+
+_session: Optional["requests.Session"] = None
+_session_lock = Lock()
+
+
+def get_http_session() -> "requests.Session":
+    """Returns the HTTP session shared by all downloads, so that connections are reused."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+class MaintenanceScheduler:
+    """
+    Runs refreshes of downloaded resources (explanations, version information) on background
+    daemon threads, so that they never delay linting; at exit, the refreshes in flight get at most
+    ``EXIT_TIMEOUT`` seconds to finish. Each resource has at most one refresh in flight
+    (refreshes of different resources run in parallel), and once a refresh finishes, further
+    requests for the resource are ignored until its TTL passes, so repeated calls in a
+    long-running process cost a dict lookup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._checked_until: Dict[str, float] = {}
+        self._closed = False
+        self._exit_registered = False
+
+    def schedule(self, resource: str, ttl: int, refresh: Callable[[], None]) -> Optional[Future]:
+        """
+        Schedules a refresh of the resource unless one is in flight or the resource was refreshed
+        less than ``ttl`` seconds ago. Returns the future of the refresh, or None if it is skipped.
+        """
+        if is_offline():
+            return None
+
+        with self._lock:
+            if self._closed:
+                return None
+
+            in_flight = self._in_flight.get(resource)
+            if in_flight is not None:
+                return in_flight
+
+            if time.monotonic() < self._checked_until.get(resource, 0):
+                return None
+
+            if not self._exit_registered:
+                atexit.register(self.shutdown, EXIT_TIMEOUT)
+                self._exit_registered = True
+
+            future: Future = Future()
+            self._in_flight[resource] = future
+            Thread(
+                target=self._run,
+                args=(resource, ttl, refresh, future),
+                name=f"edulint-maintenance-{resource}",
+                daemon=True,
+            ).start()
+            return future
+
+    def _run(self, resource: str, ttl: int, refresh: Callable[[], None], future: Future) -> None:
+        try:
+            if not self._closed:
+                refresh()
+        except Exception as e:
+            logger.debug("refreshing {resource} failed: {e}", resource=resource, e=e)
+        finally:
+            with self._lock:
+                self._checked_until[resource] = time.monotonic() + ttl
+                del self._in_flight[resource]
+            future.set_result(None)
+
+    def shutdown(self, timeout: Optional[float] = 0) -> None:
+        """
+        Stops scheduling refreshes and waits at most ``timeout`` seconds (None for no limit) for
+        the ones in flight. At exit, it waits ``EXIT_TIMEOUT`` seconds; the refreshes still in
+        flight then are abandoned with their daemon threads. Cache entries are written atomically
+        and an abandoned claim expires with its lease, so another process retries the refresh.
+        """
+        with self._lock:
+            self._closed = True
+            in_flight = list(self._in_flight.values())
+        if in_flight and timeout != 0:
+            wait(in_flight, timeout=timeout)
+
+
+_scheduler = MaintenanceScheduler()
+
+
+def get_maintenance_scheduler() -> MaintenanceScheduler:
+    return _scheduler
@@ -1,11 +1,11 @@
 # Copied from https://github.com/GiraffeReversed/edulint-web/blob/main/setup.py
 
-import requests
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 import argparse
 
 from edulint.versions.utils import Version
+from edulint.maintenance import get_http_session
 
 def _fully_released_versions(data: Dict[str, Any]) -> List[Version]:
     releases = data["releases"]
@@ -36,7 +36,7 @@ def _only_last_patch_of_each_minor(versions: List[Version]) -> List[Version]:
 
 
 def get_versions(package_name: str = 'edulint') -> List[Version]:
-    edulint_info = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=3).json()
+    edulint_info = get_http_session().get(f"https://pypi.org/pypi/{package_name}/json", timeout=3).json()
     version_ids: List[Version] = _fully_released_versions(edulint_info)
     if package_name == "pylint":
         version_ids = [version for version in version_ids if version.major >= 3]
@@ -1,24 +1,13 @@
 from typing import Optional, Tuple
-import os
-import json
 from dataclasses import dataclass
-import time
-from pathlib import Path
 
-from platformdirs import PlatformDirs
-from dataclasses_json import dataclass_json
+from edulint.cache import get_cache_store, current_timestamp
 
-from edulint.versions import pypi_helper
 
-def current_timestamp() -> int:
-    return int(time.time())
-
-
-@dataclass_json
 @dataclass
 class PackageInfo:
     version: Optional[str] = None
-    last_update_started: int = 0
+    last_updated: int = 0
 
 
 class PackageInfoManager:
@@ -39,52 +28,37 @@ class PackageInfoManager:
         return None
 
     @staticmethod
-    def _create_json_file_if_doesnt_exist(filepath: str):
-        if os.path.exists(filepath):
-            return
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", encoding="utf8") as f:
-            f.write("{}")
+    def _package_info_key(package_name: str) -> str:
+        return f"pypi-latest-version:{package_name}"
 
     @classmethod
-    def _package_info_path(cls):
-        filepath = os.path.join(PlatformDirs(appname="edulint").user_data_dir, "versions.json")
-        cls._create_json_file_if_doesnt_exist(filepath)
-        return filepath 
-
-    @classmethod
-    def _save_package_info_locally(cls, package_name: str, version = None, last_update_started: Optional[int] = None) -> PackageInfo:
-        with open(cls._package_info_path(), "r", encoding="utf8") as f:
-            data = json.load(f)
-
-        package_info = PackageInfo.from_dict(data.get(package_name, {}))
-
-        if version:
-            package_info.version = version
-        if last_update_started:
-            package_info.last_update_started = last_update_started
-            
-        data[package_name] = package_info.to_dict()
-        with open(cls._package_info_path(), "w", encoding="utf8") as f:   # I'm aware there is possible race condition between read write. Risk accepted.
-            json.dump(data, f, indent=4)
-        
-        return package_info
+    def _save_package_info_locally(cls, package_name: str, version: str) -> PackageInfo:
+        get_cache_store().put(cls._package_info_key(package_name), version)
+        return cls._get_package_info_locally(package_name)
 
     @classmethod
     def _get_package_info_locally(cls, package_name: str) -> PackageInfo:
-        with open(cls._package_info_path(), "r", encoding="utf8") as f:
-            data = json.load(f)
-            package_info = PackageInfo.from_dict(data.get(package_name, {}))
-            return package_info
+        entry = get_cache_store().get(cls._package_info_key(package_name))
+        if entry is None:
+            return PackageInfo()
+        return PackageInfo(version=entry.read() or None, last_updated=entry.timestamp)
 
     @classmethod
     def get_latest_version(cls, package_name: str, ttl = 600) -> Optional[str]:
         package_info = cls._get_package_info_locally(package_name)
-        if current_timestamp() < package_info.last_update_started + ttl:
-            return package_info.version  # The might be None if the previous request didn't finish yet or if it failed.
+        if current_timestamp() < package_info.last_updated + ttl:
+            return package_info.version
+
+        # Of the processes which find the information outdated, only the one that claims it asks PyPI.
+        # The version might be None if that request didn't finish yet or if all of them failed.
+        store = get_cache_store()
+        key = cls._package_info_key(package_name)
+        if not store.claim(key, ttl):
+            return package_info.version
 
         try:
-            cls._save_package_info_locally(package_name, last_update_started=current_timestamp())
+            from edulint.versions import pypi_helper  # imports requests, needed only when fetching
+
             versions = pypi_helper.get_versions(package_name)
             sorted_versions = list(sorted(versions, key = lambda x: (x.major, x.minor, x.micro)))
             latest_version_str = str(sorted_versions[-1])
@@ -92,6 +66,8 @@ class PackageInfoManager:
             return latest_version_str
         except Exception as _:
             return None
+        finally:
+            store.release(key)  # lets other processes retry right away if the request failed
 
     @classmethod
     def is_update_waiting(cls, package_name: str, ttl = 600) -> bool:
@@ -5,7 +5,12 @@ import astroid
 from astroid import nodes
 
 from edulint.linting.problem import Problem
-from edulint.linting.analyses.patcher import run_analyses
+from edulint.linting.analyses.patcher import (
+    MODULE_ANNOTATIONS,
+    register_module_teardown,
+    release_analyses,
+    run_analyses,
+)
 from edulint.linting.analyses.data_dependency import get_defs_at
 from edulint.linting.analyses.cfg.utils import get_cfg_loc
 from test_utils import apply_and_lint
@@ -297,3 +302,58 @@ def test_data_dependency_defs_uses(lines: List[str], edges: List[Tuple[str, int,
                 received_use_lines.add(use.node.fromlineno)
 
         assert expected_use_lines == received_use_lines
+
+
+def test_release_analyses() -> None:
+    ast = astroid.parse(
+        "def f(xs):\n"
+        "    total = 0\n"
+        "    for x in xs:\n"
+        "        if x > 0:\n"
+        "            total += x\n"
+        "    return total\n"
+        "\n"
+        "print(f([1, 2]))\n"
+    )
+    run_analyses(ast)
+    assert all(hasattr(ast, annotation) for annotation in MODULE_ANNOTATIONS)
+    assert any(hasattr(node, "cfg_loc") for node in ast.nodes_of_class(nodes.NodeNG))
+    loc = get_cfg_loc(ast.body[0].body[0])
+    events = [event for _var, event in loc.var_events.all()]
+    assert any(event.uses for event in events)
+    block = loc.block
+
+    release_analyses(ast)
+    assert not any(hasattr(ast, annotation) for annotation in MODULE_ANNOTATIONS)
+    assert not any(hasattr(node, "cfg_loc") for node in ast.nodes_of_class(nodes.NodeNG))
+    assert not any(event.uses or event.definitions for event in events)
+    assert not block.locs and not block.successors and not block.cfg.unreachable_blocks
+
+    run_analyses(ast)
+    assert get_cfg_loc(ast.body[0].body[0]).var_events
+
+
+def test_module_teardown_after_checkers(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from edulint.config.arg import Arg
+    from edulint.linting import linting
+    from edulint.linting.analyses import patcher
+    from edulint.options import Option
+    from test_utils import prepare_configs
+
+    monkeypatch.setattr(patcher, "_module_teardowns", list(patcher._module_teardowns))
+    code = tmp_path / "code.py"
+    code.write_text("def f(xs):\n    for x in xs:\n        print(x)\n")
+
+    torn_down = []
+
+    @register_module_teardown
+    def record(ast: nodes.Module) -> None:
+        torn_down.append((ast.file, hasattr(ast.body[0].body[0], "cfg_loc")))
+
+    for release in (True, False):
+        monkeypatch.setattr(patcher, "_release_analyses", release)
+        linting.lint_many(
+            prepare_configs([str(code)], [Arg(Option.PYLINT, "--enable=all")], True)
+        )
+        assert torn_down[-1] == (str(code), not release)
+
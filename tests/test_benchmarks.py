@@ -0,0 +1,15 @@
+from random import Random
+import ast
+
+from benchmarks.corpus import SIZES, generate_submission, write_corpus
+
+
+def test_corpus_is_valid_and_reproducible(tmp_path):
+    for functions in SIZES.values():
+        ast.parse(generate_submission(Random(0), functions))
+
+    first = [path.read_text() for path in write_corpus(tmp_path / "first", 20)]
+    second = [path.read_text() for path in write_corpus(tmp_path / "second", 20)]
+    assert first == second
+    for code in first:
+        ast.parse(code)
@@ -0,0 +1,155 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import os
+
+from edulint.cache import CLAIM_LEASE, CacheStore, try_lock
+
+
+def test_cache_store_roundtrip(tmp_path):
+    store = CacheStore(tmp_path)
+    assert store.get("https://example.com/a.toml") is None
+
+    store.put("https://example.com/a.toml", "a = 1\n", etag='"abc"')
+    entry = store.get("https://example.com/a.toml")
+    assert entry is not None
+    assert entry.read() == "a = 1\n"
+    assert entry.etag == '"abc"'
+    assert entry.size == len("a = 1\n")
+    assert entry.is_fresh(60)
+    assert not entry.is_fresh(0)
+
+    # sharded, no leftover temporary files
+    assert entry.path.parent.parent == tmp_path
+    assert os.listdir(entry.path.parent) == [entry.path.name]
+
+
+def test_cache_store_touch_keeps_content(tmp_path):
+    store = CacheStore(tmp_path)
+    store.touch("missing")
+    entry = store.get("missing")
+    assert entry is not None and entry.read() is None
+
+    store.put("key", "content", etag='"1"', last_modified="yesterday")
+    store.touch("key", etag='"2"')
+    entry = store.get("key")
+    assert entry.read() == "content"
+    assert entry.etag == '"2"'
+    assert entry.last_modified == "yesterday"
+
+
+def test_cache_store_evicts_oldest(tmp_path, monkeypatch):
+    store = CacheStore(tmp_path, max_size=10)
+    timestamp = 1000
+    monkeypatch.setattr("edulint.cache.current_timestamp", lambda: timestamp)
+
+    store.put("old", "12345")
+    old_path = store.get("old").path
+    timestamp += 1
+    store.put("new", "123456")
+
+    assert store.get("old") is None
+    assert not old_path.exists()
+    assert store.get("new").read() == "123456"
+
+
+def test_cache_store_claim(tmp_path, monkeypatch):
+    store = CacheStore(tmp_path)
+    timestamp = 1000
+    monkeypatch.setattr("edulint.cache.current_timestamp", lambda: timestamp)
+
+    assert store.claim("key", ttl=60)
+    assert not store.claim("key", ttl=60)
+    # the claim does not make the entry fresh; an abandoned one expires with its lease
+    assert not store.get("key").is_fresh(60)
+    timestamp += CLAIM_LEASE
+    assert store.claim("key", ttl=60)
+    store.release("key")
+    assert store.claim("key", ttl=60)
+    store.put("key", "refreshed")
+    assert store.get("key").is_fresh(60)
+    assert not store.claim("key", ttl=60)
+
+    store.put("content", "kept")
+    before = store.get("content").timestamp
+    timestamp += 60
+    assert store.claim("content", ttl=60)
+    assert store.get("content").read() == "kept"
+    assert store.get("content").timestamp == before
+    store.touch("content")
+    assert store.get("content").timestamp == timestamp
+    timestamp += 60
+    assert store.claim("content", ttl=60)
+
+
+def test_cache_store_adds_claims_to_old_index(tmp_path):
+    import sqlite3
+
+    connection = sqlite3.connect(tmp_path / "index.sqlite")
+    connection.execute(
+        "CREATE TABLE entries (key TEXT PRIMARY KEY, filename TEXT NOT NULL, "
+        "timestamp INTEGER NOT NULL, etag TEXT, last_modified TEXT, size INTEGER NOT NULL)"
+    )
+    connection.execute("INSERT INTO entries VALUES ('old', 'ol/old', 0, NULL, NULL, 0)")
+    connection.commit()
+    connection.close()
+
+    store = CacheStore(tmp_path)
+    assert store.claim("old", ttl=60)
+    store.put("old", "content")
+    assert store.get("old").read() == "content"
+
+
+def test_cache_store_removes_stale_temporary_files(tmp_path):
+    store = CacheStore(tmp_path)
+    store.put("key", "content")
+    folder = store.get("key").path.parent
+    stale, recent = folder / ".tmp-stale", folder / ".tmp-recent"
+    stale.write_text("partial")
+    recent.write_text("partial")
+    os.utime(stale, (0, 0))
+
+    store.put("key", "updated")
+    assert not stale.exists()
+    assert recent.exists()
+
+
+def _claim_in_new_store(folder: str) -> bool:
+    return CacheStore(Path(folder)).claim("shared", ttl=600)
+
+
+def test_cache_store_claimed_by_one_process(tmp_path):
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        claims = list(executor.map(_claim_in_new_store, [str(tmp_path)] * 32))
+    assert claims.count(True) == 1
+
+
+def test_cache_store_lookup_does_not_write(tmp_path):
+    CacheStore(tmp_path).put("key", "content")
+
+    def files_state():
+        return {
+            path: (path.stat().st_size, path.stat().st_mtime_ns)
+            for path in tmp_path.rglob("*")
+            if path.is_file() and not path.name.endswith("-shm")
+        }
+
+    before = files_state()
+    store = CacheStore(tmp_path)
+    assert store.get("key").read() == "content"
+    assert store.get("missing") is None
+    assert store._connect().total_changes == 0
+    assert files_state() == before
+
+
+def _lock_in_new_process(path: str) -> bool:
+    with try_lock(Path(path)) as locked:
+        return locked
+
+
+def test_try_lock(tmp_path):
+    with try_lock(tmp_path / "lock") as locked:
+        assert locked
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert not executor.submit(_lock_in_new_process, str(tmp_path / "lock")).result()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_lock_in_new_process, str(tmp_path / "lock")).result()
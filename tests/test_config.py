@@ -10,14 +10,21 @@ from edulint.config.config import (
     extract_args,
     parse_args,
     parse_config_file,
+    _parse_config_file,
+    _get_packaged_configs_bundle,
+    _get_packaged_configs_bundle_path,
     get_config_many,
     get_config_one,
 )
 from edulint.config.option_sets import OptionSet, OptionSets
+from edulint.config.file_config import CachedHTTPGet, prefetch_remote_files
+from edulint import cache
 from edulint.linting.tweakers import get_tweakers
 from test_utils import get_tests_path, remote_empty_config_url
 from typing import List, Set, Dict, Tuple, Optional
 from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 
 
 @pytest.fixture
@@ -182,11 +189,129 @@ def test_packaged_configs_parse(config_name: str):
     assert parse_config_file(config_name, get_option_parses()) is not None
 
 
+@pytest.mark.parametrize("config_name", packaged_config_files())
+def test_packaged_configs_bundle_matches_parsing(config_name: str, cache_dir, monkeypatch):
+    monkeypatch.setattr("edulint.config.config._packaged_configs_bundle", None)
+    bundled = parse_config_file(config_name, get_option_parses())
+    assert config_name in _get_packaged_configs_bundle()
+    assert list(cache_dir.glob("packaged-configs-*.pickle"))
+
+    parsed = _parse_config_file(config_name, get_option_parses())
+    assert str(bundled[0]) == str(parsed[0])
+    assert bundled[0].enablers == parsed[0].enablers
+    assert bundled[1:] == parsed[1:]
+
+
+def test_packaged_configs_bundle_depends_on_package_sources(tmp_path: Path, cache_dir, monkeypatch):
+    package = tmp_path / "package"
+    (package / "config").mkdir(parents=True)
+    source = package / "config" / "parsing.py"
+    source.write_text("A = 1\n")
+    monkeypatch.setattr("edulint.config.config.PACKAGE_FOLDER", package)
+
+    before = _get_packaged_configs_bundle_path()
+    assert _get_packaged_configs_bundle_path() == before
+    (package / "config" / "added.py").write_text("")
+    added = _get_packaged_configs_bundle_path()
+    assert added != before
+    source.write_text("A = 22\n")
+    assert _get_packaged_configs_bundle_path() not in (before, added)
+
+
+def test_packaged_configs_bundle_keeps_other_installations(cache_dir, monkeypatch):
+    other_version = cache_dir / "packaged-configs-0.0.1-00000000-0-0.pickle"
+    other_version.write_bytes(b"")
+    bundle_path = _get_packaged_configs_bundle_path()
+    own_stale = bundle_path.with_name(bundle_path.name.rsplit("-", 2)[0] + "-0-0.pickle")
+    own_stale.write_bytes(b"")
+
+    monkeypatch.setattr("edulint.config.config._packaged_configs_bundle", None)
+    _get_packaged_configs_bundle()
+    assert bundle_path.exists()
+    assert other_version.exists()
+    assert not own_stale.exists()
+
+
 def test_remote_config_parses():
     url = remote_empty_config_url()
     assert parse_config_file(url, get_option_parses()) is not None
 
 
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_cache_store", cache.CacheStore(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def http_stand_in():
+    files: Dict[str, str] = {}
+    requests_log: List[Tuple[str, int]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content = files.get(self.path)
+            if content is None:
+                status = 404
+            elif self.headers.get("If-None-Match") == f'"{hash(content)}"':
+                status = 304
+            else:
+                status = 200
+            requests_log.append((self.path, status))
+
+            self.send_response(status)
+            if content is not None:
+                self.send_header("ETag", f'"{hash(content)}"')
+            self.end_headers()
+            if status == 200:
+                self.wfile.write(content.encode("utf8"))
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", files, requests_log
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_prefetch_follows_remote_references(cache_dir, http_stand_in):
+    url, files, requests_log = http_stand_in
+    files["/base.toml"] = 'pylint = "--enable=C0114"\n'
+    files["/lang.toml"] = 'C0114 = "Chybi docstring modulu"\n'
+    files["/top.toml"] = (
+        f'config-file = "{url}/base.toml"\nlanguage-file = "{url}/lang.toml"\n'
+    )
+
+    prefetch_remote_files([f"{url}/top.toml", "default", None])
+    assert sorted(path for path, _status in requests_log) == ["/base.toml", "/lang.toml", "/top.toml"]
+
+    requests_log.clear()
+    result = parse_config_file(f"{url}/top.toml", get_option_parses())
+    assert result is not None
+    assert requests_log == []
+
+
+def test_remote_config_revalidated(cache_dir, http_stand_in):
+    url, files, requests_log = http_stand_in
+    files["/empty.toml"] = ""
+
+    assert CachedHTTPGet.http_get(f"{url}/empty.toml") == ""
+    assert CachedHTTPGet.http_get(f"{url}/empty.toml") == ""
+    assert requests_log == [("/empty.toml", 200)]
+
+    assert CachedHTTPGet.http_get(f"{url}/empty.toml", max_cache_time=0) == ""
+    assert requests_log == [("/empty.toml", 200), ("/empty.toml", 304)]
+
+    files["/empty.toml"] = 'pylint = "--enable=C0114"\n'
+    assert CachedHTTPGet.http_get(f"{url}/empty.toml", max_cache_time=0) == files["/empty.toml"]
+    assert requests_log[-1] == ("/empty.toml", 200)
+
+
 def relative_to_file(file_path, relative_path):
     dir_path = os.path.dirname(file_path)
     abspath = os.path.abspath(dir_path)
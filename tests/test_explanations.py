@@ -0,0 +1,61 @@
+import pytest
+import tomli
+
+from edulint import cache, explanations
+from edulint.cache import CacheStore
+from edulint.explanations import (
+    EXPLANATIONS_PIP_DISTRIBUTED_FILEPATH,
+    GITHUB_URL,
+    get_explanations,
+    get_explanations_for,
+)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = CacheStore(tmp_path)
+    monkeypatch.setattr(cache, "_cache_store", store)
+    monkeypatch.setattr(explanations, "_explanations_index", None)
+    return store
+
+
+def packaged_explanations():
+    with open(EXPLANATIONS_PIP_DISTRIBUTED_FILEPATH, "rb") as f:
+        return tomli.load(f)
+
+
+def test_index_matches_packaged_explanations(store):
+    expected = packaged_explanations()
+    assert get_explanations(disable_explanations_update=True) == expected
+    assert (store.folder / explanations.EXPLANATIONS_INDEX_FILENAME).exists()
+
+    assert get_explanations_for(["R6201", "X9999", "E0001"], disable_explanations_update=True) == {
+        "R6201": expected["R6201"],
+        "E0001": expected["E0001"],
+    }
+
+
+def test_index_rebuilt_from_downloaded_explanations(store):
+    assert "R6201" in get_explanations_for(["R6201"], disable_explanations_update=True)
+
+    store.put(GITHUB_URL, '[X0001]\nwhy = "Downloaded."\n')
+    assert get_explanations(disable_explanations_update=True) == {"X0001": {"why": "Downloaded."}}
+
+    store.put(GITHUB_URL, "[X0001\n")
+    assert get_explanations(disable_explanations_update=True) == packaged_explanations()
+
+
+def test_failed_refresh_releases_claim(store, monkeypatch):
+    class Response:
+        status_code = 503
+        text = ""
+
+    class Session:
+        def get(self, url, timeout):
+            return Response()
+
+    monkeypatch.setattr(explanations, "get_http_session", lambda: Session())
+    explanations._refresh_explanations()
+    entry = store.get(GITHUB_URL)
+    assert entry is None or not entry.is_fresh(explanations.EXPLANATIONS_TTL)
+    assert store.claim(GITHUB_URL, explanations.EXPLANATIONS_TTL)
@@ -1,9 +1,16 @@
 import pytest
+import sys
 from pathlib import Path
 from edulint.linters import Linter
 from edulint.options import Option
 from edulint.config.arg import Arg
-from edulint.linting.problem import Problem
+from edulint.linting.problem import Problem, problems_to_json, problems_from_json
+from edulint.linting.overrides import get_overriders
+from edulint.linting.linting import RootIndex, sort, lint_files, lint_many, uses_cross_file_checks, lint_flake8, lint_pylint
+from edulint.linting.postprocessing import PostProcessor, register_rule
+from edulint.linting.tweakers import get_tweakers
+from edulint.config.config import get_config_one
+from edulint.config.language_translations import LangTranslator, Translation
 from test_utils import (
     lazy_problem,
     apply_and_lint,
@@ -11,8 +18,9 @@ from test_utils import (
     just_lint,
     get_tests_path,
     apply_and_lint_multiple,
+    prepare_configs,
 )
-from typing import List
+from typing import Dict, List
 
 
 @pytest.mark.parametrize(
@@ -712,3 +720,318 @@ def test_problem_can_be_dumped_to_json() -> None:
   }
 ]"""
     )
+
+
+@pytest.mark.filterwarnings(
+    "ignore:The 'default' argument to fields is deprecated. Use 'dump_default' instead."
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_fast_problem_json_matches_schema(indent) -> None:
+    problems = [
+        Problem(Linter.FLAKE8, "foo", "path", 5, 1, "E303", "too many blank lines (3)"),
+        Problem(
+            Linter.PYLINT, None, "dir/čř.py", 1, 0, "C0104", 'Disallowed name "ž"', 1, 3, "disallowed-name"
+        ),
+    ]
+    for sublist in ([], problems[:1], problems):
+        out = problems_to_json(sublist, indent=indent)
+        assert out == Problem.schema().dumps(sublist, indent=indent, many=True)  # type: ignore
+        assert problems_from_json(out) == sublist
+
+
+def test_problem_is_slotted() -> None:
+    problem = Problem(Linter.FLAKE8, None, "path", 5, 1, "E303", "too many blank lines (3)")
+    assert not hasattr(problem, "__dict__")
+    assert problem.set_text("changed").text == "changed"
+    with pytest.raises(AttributeError):
+        problem.unknown_attribute = 1  # type: ignore
+
+
+def test_sort_by_roots_paths_and_positions() -> None:
+    import random
+
+    rnd = random.Random(0)
+    roots = ["b", "a"]
+    codes = ["C0104", "R6307", "W0107", "W0101", "E225", "R6609", "C0114"]
+    problems = [
+        Problem(
+            Linter.PYLINT,
+            None,
+            rnd.choice(["a/x.py", "a/y.py", "b/z.py", "b"]),
+            rnd.randint(1, 5),
+            rnd.randint(0, 3),
+            rnd.choice(codes),
+            str(i),
+        )
+        for i in range(300)
+    ]
+
+    root_index = lambda path: roots.index(path.split("/")[0])
+    expected = sorted(problems, key=lambda problem: (root_index(problem.path), problem.path, problem.line, problem.column))
+    assert sort(roots, problems) == expected
+
+
+def test_root_index_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("")
+    (tmp_path / "b.py").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    root_index = RootIndex([str(tmp_path / "b.py"), "pkg"])
+    assert root_index.get_used_path("b.py") == str(tmp_path / "b.py")
+    assert root_index.get_used_path(str(tmp_path / "pkg" / "a.py")) == "pkg/a.py"
+    assert root_index.get_used_path("Command line") == "Command line"
+
+    assert root_index.get_root_index(str(tmp_path / "b.py")) == 0
+    assert root_index.get_root_index("pkg/a.py") == 1
+    assert root_index.get_root_index("Command line") == -1
+
+
+def _post_processing_problems() -> List[Problem]:
+    import random
+
+    rnd = random.Random(1)
+    kinds = [
+        (Linter.PYLINT, "C0104", "disallowed-name", 'Disallowed name "{}"'),
+        (Linter.PYLINT, "R6609", "use-augmented-assign", "Use augmented assignment: '{} += 1'"),
+        (Linter.FLAKE8, "F841", "", "local variable '{}' is assigned to but never used"),
+        (Linter.PYLINT, "W0107", "unnecessary-pass", "Unnecessary pass statement"),
+        (Linter.FLAKE8, "E712", "", "comparison to True should be 'if cond is True:' or 'if {}:'"),
+    ]
+    problems = []
+    for i in range(300):
+        source, code, symbol, text = rnd.choice(kinds)
+        problems.append(
+            Problem(
+                source,
+                None,
+                rnd.choice(["a.py", "b.py"]),
+                rnd.randint(1, 6),
+                0,
+                code,
+                text.format(rnd.choice(["i", "j", "name"])),
+                symbol=symbol,
+            )
+        )
+    return problems
+
+
+def _post_process_naively(
+    problems: List[Problem], config, lang_translations: Dict[str, Translation]
+) -> List[Problem]:
+    overriders = get_overriders()
+    codes_on_lines = {}
+    for problem in problems:
+        codes_on_lines.setdefault((problem.path, problem.line), set()).add(problem.code)
+    problems = [
+        problem
+        for problem in problems
+        if not overriders.get(problem.code, set()) & codes_on_lines[(problem.path, problem.line)]
+    ]
+
+    tweakers = get_tweakers()
+    result = []
+    for problem in problems:
+        tweaker = tweakers.get((problem.source, problem.code))
+        if tweaker:
+            if not tweaker.should_keep(problem, [arg for arg in config if arg.option in tweaker.used_options]):
+                continue
+            problem.text = tweaker.get_reword(problem)
+        result.append(problem)
+
+    for problem in result:
+        translation = lang_translations.get(problem.code, lang_translations.get(problem.symbol))
+        if translation is not None:
+            problem.text = translation.translate(problem.code, problem.text)
+    return result
+
+
+def test_post_processor_matches_separate_passes(tmp_path: Path) -> None:
+    checked = tmp_path / "a.py"
+    checked.write_text("")
+    config, _lang_translations = get_config_one(str(checked), ["allowed-onechar-names=i"])
+    lang_translations = {
+        "R6609": Translation("Pouzij '{} {}= {}'", extracts={"2": {"+": "plus"}}),
+        "unnecessary-pass": Translation("Zbytecny pass", extracts={}),
+    }
+
+    expected = _post_process_naively(_post_processing_problems(), config, lang_translations)
+
+    post_processor = PostProcessor(config, LangTranslator(lang_translations))
+    assert post_processor.process(_post_processing_problems()) == expected
+    untranslated = post_processor.process(_post_processing_problems(), translate=False)
+    assert post_processor.translate(untranslated) == expected
+
+
+def test_post_processor_applies_registered_rules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from edulint.linting import postprocessing
+
+    monkeypatch.setattr(postprocessing, "_rule_factories", list(postprocessing._rule_factories))
+
+    @register_rule
+    def drop_pass_rule(config):
+        if config[Option.ALLOWED_ONECHAR_NAMES] != "i":
+            return None
+        return lambda problem: problem.code != "W0107"
+
+    checked = tmp_path / "a.py"
+    checked.write_text("")
+    config, _lang_translations = get_config_one(str(checked), ["allowed-onechar-names=i"])
+    result = PostProcessor(config).process(_post_processing_problems())
+    assert result and all(problem.code != "W0107" for problem in result)
+
+
+def test_lint_many_streams_files_to_consumer(tmp_path: Path) -> None:
+    clean = tmp_path / "clean.py"
+    clean.write_text("print(1)\n")
+    dirty = tmp_path / "dirty.py"
+    dirty.write_text('def f():\n    """Does nothing."""\n    pass\n')
+    partition = prepare_configs(
+        [str(dirty), str(clean)], [Arg(Option.PYLINT, "--enable=unnecessary-pass")], True
+    )
+
+    consumed = []
+    assert lint_many(partition, lambda path, config, problems: consumed.append((path, problems))) == []
+
+    assert [path for path, _problems in consumed] == [str(dirty), str(clean)]
+    assert consumed[0][1] and consumed[1][1] == []
+    assert [problem for _path, problems in consumed for problem in problems] == lint_many(partition)
+
+
+def test_linters_report_in_process(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    checked = tmp_path / "checked.py"
+    checked.write_text("foo=1\n")
+    partition = prepare_configs(
+        [str(checked)],
+        [Arg(Option.PYLINT, "--enable=disallowed-name"), Arg(Option.FLAKE8, "--select=E225")],
+        True,
+    )
+    config = partition[0][1]
+
+    stdout, stderr = sys.stdout, sys.stderr
+    flake8_problems = lint_flake8([str(checked)], config)
+    pylint_problems = lint_pylint([str(checked)], config)
+    assert (sys.stdout, sys.stderr) == (stdout, stderr)
+    assert capsys.readouterr().out == ""
+
+    assert [(p.source, p.code, p.path, p.line) for p in flake8_problems + pylint_problems] == [
+        (Linter.FLAKE8, "E225", str(checked), 1),
+        (Linter.PYLINT, "C0104", str(checked), 1),
+    ]
+
+
+def test_pylint_linters_are_reused(tmp_path: Path) -> None:
+    from edulint.linting.pylint_pool import get_pylinter_pool
+
+    checked = tmp_path / "checked.py"
+    checked.write_text("foo = 1\n")
+    config = prepare_configs([str(checked)], [Arg(Option.PYLINT, "--enable=disallowed-name")], True)[0][1]
+
+    get_pylinter_pool().clear()
+    first = lint_pylint([str(checked)], config)
+    (linters,) = get_pylinter_pool()._idle.values()
+    assert len(linters) == 1
+    linter = linters[0]
+
+    assert lint_pylint([str(checked)], config) == first
+    assert get_pylinter_pool()._idle == {tuple(["--recursive=y"] + list(config[Option.PYLINT])): [linter]}
+    assert [problem.code for problem in first] == ["C0104"]
+
+
+
+def test_pylint_pool_is_bounded_and_resets_stats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from edulint.linting import pylint_pool
+
+    monkeypatch.setattr(pylint_pool, "_pool", pylint_pool.PyLinterPool(max_configs=1))
+    first = tmp_path / "first.py"
+    first.write_text("foo = 1\n")
+    second = tmp_path / "second.py"
+    second.write_text("foo = 1\n")
+    config = prepare_configs([str(first)], [Arg(Option.PYLINT, "--enable=disallowed-name")], True)[0][1]
+    other = prepare_configs([str(first)], [Arg(Option.PYLINT, "--enable=unnecessary-pass")], True)[0][1]
+
+    lint_pylint([str(first)], config)
+    lint_pylint([str(second)], config)
+    ((key, (linter,)),) = pylint_pool.get_pylinter_pool()._idle.items()
+    assert list(linter.stats.by_module) == ["second"]
+
+    lint_pylint([str(first)], other)
+    assert list(pylint_pool.get_pylinter_pool()._idle) == [tuple(["--recursive=y"] + list(other[Option.PYLINT]))]
+
+def test_lint_files_streams_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from contextlib import contextmanager
+    from edulint.linting import linting
+
+    for name in ("a", "b", "c", "d", "e"):
+        (tmp_path / f"{name}.py").write_text("foo = 1\n")
+    (tmp_path / "notes.txt").write_text("foo = 1\n")
+    config = prepare_configs([str(tmp_path)], [Arg(Option.PYLINT, "--enable=disallowed-name")], True)[0][1]
+    expected = list(lint_files([str(tmp_path)], config))
+
+    events = []
+
+    @contextmanager
+    def hook(name, attributes):
+        if attributes.get("linter") == Linter.PYLINT:
+            events.append(("pylint", len(attributes["files_or_dirs"])))
+        yield
+
+    monkeypatch.setattr(linting, "LINT_CHUNK_SIZE", 2)
+    results = []
+    for path, problems in lint_files([str(tmp_path)], config, hooks=(hook,)):
+        events.append(("result", Path(path).name))
+        results.append((path, problems))
+
+    assert results == expected
+    assert [Path(path).name for path, _problems in results] == ["a.py", "b.py", "c.py", "d.py", "e.py"]
+    assert events == [
+        ("pylint", 2), ("result", "a.py"), ("result", "b.py"),
+        ("pylint", 2), ("result", "c.py"), ("result", "d.py"),
+        ("pylint", 1), ("result", "e.py"),
+    ]
+
+    duplicate_code = prepare_configs([str(tmp_path)], [Arg(Option.PYLINT, "--enable=duplicate-code")], True)[0][1]
+    events.clear()
+    list(lint_files([str(tmp_path)], duplicate_code, hooks=(hook,)))
+    assert events == [("pylint", 1)]
+
+
+def test_lint_files_chunks_respect_ignored_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from edulint.linting import linting
+
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text("foo = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "d.py").write_text("foo = 1\n")
+    (tmp_path / "vendored").mkdir()
+    (tmp_path / "vendored" / "e.py").write_text("foo = 1\n")
+    (tmp_path / "pkg" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    config = prepare_configs(
+        [str(tmp_path)],
+        [
+            Arg(Option.PYLINT, "--enable=disallowed-name"),
+            Arg(Option.PYLINT, "--ignore=vendored"),
+            Arg(Option.FLAKE8, "--select=E225"),
+            Arg(Option.FLAKE8, "--exclude=vendored"),
+        ],
+        True,
+    )[0][1]
+    expected = list(lint_files([str(tmp_path)], config))
+    assert [Path(path).name for path, _problems in expected] == ["a.py", "b.py", "c.py", "d.py"]
+
+    monkeypatch.setattr(linting, "LINT_CHUNK_SIZE", 2)
+    assert list(lint_files([str(tmp_path)], config)) == expected
+
+
+@pytest.mark.parametrize("pylint_args,expected", [
+    ([], True),
+    (["--disable=all", "--enable=noop"], False),
+    (["--disable=all", "--enable=duplicate-code"], True),
+    (["--enable=all", "--disable=r0801,imports"], False),
+    (["--enable=all", "--disable=R0801"], True),
+    (["--disable=all", "--enable=R"], True),
+])
+def test_uses_cross_file_checks(pylint_args: List[str], expected: bool) -> None:
+    assert uses_cross_file_checks(pylint_args) == expected
@@ -1,6 +1,6 @@
 import pytest
 from edulint.edulint import main
-from os.path import join
+from os.path import basename, join
 import sys
 import json
 
@@ -48,6 +48,25 @@ def test_single_file_stdout_json(monkeypatch, capsys, argv):
     result = json.loads(out)
     assert result
 
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [
+            join("tests", "data", "custom_nonpep_assign.py"),
+            join("tests", "data", "custom_flake8_pylint.py"),
+        ],
+    ],
+)
+def test_multiple_files_stdout_ndjson(monkeypatch, capsys, argv):
+    lines = run(monkeypatch, capsys, argv + ["--format", "ndjson"]).splitlines()
+    assert "configs" in json.loads(lines[0])
+
+    results = [json.loads(line) for line in lines[1:]]
+    assert [result["path"] for result in results] == argv
+
+    whole = json.loads(run(monkeypatch, capsys, argv + ["--json"]))
+    assert [problem for result in results for problem in result["problems"]] == whole["problems"]
+
 @pytest.mark.parametrize(
     "argv,output",
     [
@@ -177,3 +196,248 @@ def test_passing_cmd_args(monkeypatch, capsys, argv, output):
 @pytest.mark.parametrize("argv,output", [([join("tests", "data", "custom_swap.py")], "")])
 def test_ib111_week(monkeypatch, capsys, argv, output):
     compare_output(monkeypatch, capsys, argv, output)
+
+
+def test_iter_check_stops_with_consumer(monkeypatch, tmp_path):
+    from edulint import iter_check
+    from edulint.linting import linting
+
+    first = tmp_path / "first.py"
+    first.write_text("# edulint: config-file=empty\nfoo = 1\n")
+    second = tmp_path / "second.py"
+    second.write_text("foo = 1\n")
+
+    linted = []
+    lint_files = linting.lint_files
+
+    def recording_lint_files(files_or_dirs, *args, **kwargs):
+        linted.append(files_or_dirs)
+        return lint_files(files_or_dirs, *args, **kwargs)
+
+    monkeypatch.setattr(linting, "lint_files", recording_lint_files)
+
+    results = iter_check([str(first), str(second)])
+    path, config, problems = next(results)
+    assert path == str(first) and problems == []
+    results.close()
+
+    assert linted == [[str(first)]]
+    assert [path for path, _config, _problems in iter_check([str(second)])] == [str(second)]
+
+
+def test_profile_json(monkeypatch, capsys, tmp_path):
+    from edulint.linting import profiling
+    from edulint.linting.analyses import z3_analysis
+
+    monkeypatch.setattr(profiling, "_profiler", None)
+    monkeypatch.setattr(z3_analysis, "_statistics_collector", None)
+    code = tmp_path / "code.py"
+    code.write_text(
+        "def is_positive(x):\n    if x > 0:\n        return True\n    else:\n        return False\n"
+    )
+
+    monkeypatch.setattr("sys.argv", ["script", "check", "--json", "--profile", str(code)])
+    main()
+    captured = capsys.readouterr()
+    result = json.loads(captured.out)
+
+    assert any(problem["symbol"] == "simplifiable-if-return" for problem in result["problems"])
+    timings = result["timings"][str(code)]
+    for section in (
+        "flake8",
+        "pylint",
+        "pylint:parse",
+        "analysis:cfg",
+        "analysis:var-events",
+        "analysis:reaching-definitions",
+        "checker:simplifiable-if.visit_if",
+        "postprocessing",
+    ):
+        assert timings[section]["calls"] >= 1 and timings[section]["wall"] >= 0, section
+    assert "checker:simplifiable-if.visit_if" in captured.err
+
+
+
+
+def test_ndjson_reports_clean_files(monkeypatch, capsys, tmp_path):
+    (tmp_path / "clean.py").write_text("print(1)\n")
+    (tmp_path / "dirty.py").write_text("foo=1\n")
+
+    monkeypatch.setattr(
+        "sys.argv", ["script", "check", "--format", "ndjson", "--option", "pylint=--enable=disallowed-name", str(tmp_path)]
+    )
+    assert main() == 1
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()[1:]]
+    assert [basename(result["path"]) for result in results] == ["clean.py", "dirty.py"]
+    assert results[0]["problems"] == [] and results[1]["problems"]
+
+def test_profile_parse_excludes_analyses(monkeypatch, capsys, tmp_path):
+    import time
+    from edulint.linting import profiling
+    from edulint.linting.analyses import patcher
+
+    monkeypatch.setattr(profiling, "_profiler", None)
+    run_analyses = patcher.run_analyses
+
+    def slow_run_analyses(ast):
+        time.sleep(0.3)
+        run_analyses(ast)
+
+    monkeypatch.setattr(patcher, "run_analyses", slow_run_analyses)
+    code = tmp_path / "code.py"
+    code.write_text("x = 1\n")
+
+    monkeypatch.setattr("sys.argv", ["script", "check", "--json", "--profile", str(code)])
+    main()
+    timings = json.loads(capsys.readouterr().out)["timings"][str(code)]
+    assert timings["pylint:parse"]["wall"] < 0.3
+
+def test_z3_slow_queries_json(monkeypatch, capsys, tmp_path):
+    from edulint.linting.analyses import z3_analysis
+
+    monkeypatch.setattr(z3_analysis, "_statistics_collector", None)
+    code = tmp_path / "code.py"
+    code.write_text(
+        "def f(x):\n"
+        "    if x > 5 and x > 3:\n"
+        "        print(x)\n"
+        "    while x > 0:\n"
+        "        x += 1\n"
+    )
+
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "script",
+            "check",
+            "--json",
+            "--option",
+            "config=full",
+            "--z3-slow-query-threshold",
+            "0",
+            str(code),
+        ],
+    )
+    main()
+    captured = capsys.readouterr()
+    result = json.loads(captured.out)
+
+    assert "timings" not in result
+    statistics = result["z3"]
+    assert statistics["total"]["queries"] > 0
+    assert statistics["files"][str(code)]["queries"] == statistics["total"]["queries"]
+    assert len(statistics["slow_queries"]) == statistics["total"]["queries"]
+    for query in statistics["slow_queries"]:
+        assert query["path"] == str(code)
+        assert query["line"] is not None and query["node"] is not None
+        assert query["formula_size"] > 0
+    assert captured.err.startswith("z3: ") or "\nz3: " in captured.err
+
+
+def test_check_code_stage_hooks(tmp_path):
+    from contextlib import contextmanager
+    import os
+    from edulint.edulint import check_code
+    from edulint.linters import Linter
+    from edulint.linting import profiling
+
+    code = tmp_path / "code.py"
+    code.write_text("def f(x):\n    if x > 0:\n        return True\n    else:\n        return False\n")
+
+    events = []
+
+    @contextmanager
+    def hook(name, attributes):
+        events.append(("start", name, attributes))
+        yield
+        events.append(("end", name))
+
+    result = check_code([str(code)], hooks=[hook])
+
+    assert result is not None and result[1]
+    assert profiling.get_current_stage_hooks() == ()
+    started = [(name, attributes) for event, name, *attributes in events if event == "start"]
+    assert started[0] == ("config", [{"files_or_dirs": [str(code)]}])
+    assert [attributes[0]["linter"] for name, attributes in started if name == "linter"] == [
+        Linter.EDULINT,
+        Linter.FLAKE8,
+        Linter.PYLINT,
+    ]
+    for name in ("analysis", "postprocessing", "translation"):
+        assert any(
+            stage == name and os.path.samefile(attributes[0]["path"], code)
+            for stage, attributes in started
+        ), name
+    assert len(started) == sum(1 for event in events if event[0] == "end")
+
+
+def test_profile_memory_json(monkeypatch, capsys, tmp_path):
+    from edulint.linting import profiling
+    from edulint.linting.analyses import patcher, z3_analysis
+
+    monkeypatch.setattr(profiling, "_profiler", None)
+    monkeypatch.setattr(z3_analysis, "_statistics_collector", None)
+    monkeypatch.setattr(patcher, "_release_analyses", True)
+    code = tmp_path / "code.py"
+    code.write_text("def f(xs):\n    for x in xs:\n        print(x)\n")
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["script", "check", "--json", "--profile-memory", "--keep-analyses", str(code)],
+    )
+    try:
+        main()
+    finally:
+        profiling.disable_profiling()
+    captured = capsys.readouterr()
+    result = json.loads(captured.out)
+
+    assert not patcher.get_release_analyses()
+    timings = result["timings"][str(code)]
+    assert timings["pylint:parse"]["peak_memory"] > 0
+    assert all("retained_memory" in timing for timing in timings.values())
+    assert "peak [MiB]" in captured.err
+
+
+def test_stage_hooks_apply_only_to_their_call(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import contextmanager
+    from edulint.edulint import check_code, iter_check
+
+    first = tmp_path / "first.py"
+    first.write_text("print(1)\n")
+    other = tmp_path / "other.py"
+    other.write_text("print(3)\n")
+
+    seen = []
+
+    @contextmanager
+    def hook(name, attributes):
+        seen.append(attributes)
+        yield
+
+    results = iter_check([str(first)], hooks=[hook])
+    next(results)
+    seen.clear()
+
+    # while the iterator is paused, neither this thread nor others report to its hooks
+    assert check_code([str(other)]) is not None
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(check_code, [str(other)]).result() is not None
+    assert seen == []
+    results.close()
+
+
+def test_profile_memory_unsupported(monkeypatch, tmp_path):
+    from edulint.linting import profiling
+
+    monkeypatch.setattr(profiling, "_profiler", None)
+    monkeypatch.setattr(profiling, "MEMORY_PROFILING_SUPPORTED", False)
+    code = tmp_path / "code.py"
+    code.write_text("print(1)\n")
+
+    monkeypatch.setattr("sys.argv", ["script", "check", "--profile-memory", str(code)])
+    assert main() == 2
+    assert profiling.get_profiler() is None
+    with pytest.raises(RuntimeError):
+        profiling.enable_profiling(memory=True)
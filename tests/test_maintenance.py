@@ -0,0 +1,92 @@
+import threading
+
+from edulint.maintenance import OFFLINE_ENV_VARIABLE, MaintenanceScheduler
+
+
+def test_refreshes_are_coalesced():
+    scheduler = MaintenanceScheduler()
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+
+    first = scheduler.schedule("resource", 60, refresh)
+    assert scheduler.schedule("resource", 60, refresh) is first
+    release.set()
+    first.result(5)
+
+    # refreshed less than ttl ago
+    assert scheduler.schedule("resource", 60, refresh) is None
+    scheduler.schedule("other", 60, refresh).result(5)
+    assert len(calls) == 2
+
+    scheduler.shutdown()
+    assert scheduler.schedule("another", 60, refresh) is None
+
+
+def test_failing_refresh_does_not_propagate():
+    scheduler = MaintenanceScheduler()
+
+    def refresh():
+        raise OSError("offline")
+
+    scheduler.schedule("resource", 0, refresh).result(5)
+    scheduler.schedule("resource", 0, refresh).result(5)
+    scheduler.shutdown()
+
+
+def test_offline_mode_disables_refreshes(monkeypatch):
+    monkeypatch.setenv(OFFLINE_ENV_VARIABLE, "1")
+    scheduler = MaintenanceScheduler()
+    assert scheduler.schedule("resource", 60, lambda: None) is None
+
+
+def test_refreshes_run_in_parallel_and_do_not_delay_exit():
+    import subprocess
+    import sys
+    import time
+
+    code = (
+        "import time\n"
+        "from edulint.maintenance import get_maintenance_scheduler\n"
+        "scheduler = get_maintenance_scheduler()\n"
+        "scheduler.schedule('first', 60, lambda: time.sleep(5))\n"
+        "scheduler.schedule('second', 60, lambda: time.sleep(5))\n"
+    )
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
+    assert time.monotonic() - start < 4
+
+
+def test_refresh_started_after_shutdown_is_skipped():
+    from concurrent.futures import Future
+
+    scheduler = MaintenanceScheduler()
+    calls = []
+    future: Future = Future()
+    with scheduler._lock:
+        scheduler._in_flight["resource"] = future
+    scheduler.shutdown()
+
+    # the thread of a refresh scheduled just before the shutdown starts running only now
+    scheduler._run("resource", 60, lambda: calls.append(1), future)
+    assert calls == [] and future.done()
+
+
+def test_exit_waits_briefly_for_refreshes(tmp_path):
+    import subprocess
+    import sys
+
+    done = tmp_path / "done"
+    code = (
+        "import time\n"
+        "from edulint.maintenance import get_maintenance_scheduler\n"
+        "def refresh():\n"
+        "    time.sleep(0.1)\n"
+        f"    open({str(done)!r}, 'w').close()\n"
+        "get_maintenance_scheduler().schedule('resource', 60, refresh)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
+    assert done.exists()
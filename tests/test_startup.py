@@ -0,0 +1,55 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# modules which only checking code needs, so the other commands must not import them
+HEAVY_MODULES = [
+    "requests",
+    "pylint",
+    "flake8",
+    "astroid",
+    "z3",
+    "marshmallow",
+    "dataclasses_json",
+    "edulint.config.config",
+    "edulint.linting.linting",
+]
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Returns cumulative import times (in microseconds) of modules imported by the statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative_us)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import edulint",
+        "import edulint.edulint",
+        "from edulint.edulint import main",
+        "from edulint import Option, Linter, version",
+    ],
+)
+def test_startup_does_not_import_heavy_modules(statement: str) -> None:
+    times = import_times(statement)
+    imported = [module for module in HEAVY_MODULES if module in times]
+    assert imported == [], f"{statement} imports {imported} ({times.get('edulint.edulint')} us)"
+
+
+def test_lazy_package_attributes() -> None:
+    times = import_times("import edulint; edulint.Problem; edulint.check_code")
+    assert "edulint.linting.problem" in times and "edulint.edulint" in times
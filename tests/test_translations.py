@@ -4,7 +4,17 @@ import pytest
 
 from edulint.options import Option
 from edulint.config.arg import Arg
-from edulint.config.language_translations import Translation, parse_lang_file
+from edulint.config import raw_checker_patterns
+from edulint.config.language_translations import (
+    Translation,
+    LangTranslator,
+    parse_lang_file,
+    get_pattern,
+    get_patterns,
+    get_edulint_patterns,
+    get_pylint_patterns,
+    get_edulint_checkers_fingerprint,
+)
 from test_utils import lazy_problem, apply_and_lint, get_tests_path
 
 def get_lang_translations_path(filename):
@@ -16,6 +26,70 @@ def get_lang_translations_path(filename):
 def test_parse_lang_file(filename: str, expected_output):
     assert parse_lang_file(get_lang_translations_path(filename)) == expected_output
 
+def test_prebuilt_patterns_are_current():
+    import pylint
+
+    assert raw_checker_patterns.EDULINT == get_edulint_patterns(), \
+        "regenerate with python -m edulint.config.language_translations"
+    assert raw_checker_patterns.EDULINT_FINGERPRINT == get_edulint_checkers_fingerprint(), \
+        "regenerate with python -m edulint.config.language_translations"
+    if pylint.__version__ == raw_checker_patterns.PYLINT_VERSION:
+        assert raw_checker_patterns.PYLINT == get_pylint_patterns()
+
+@pytest.fixture
+def fresh_messages():
+    from edulint.config import language_translations
+
+    language_translations._get_messages.cache_clear()
+    yield language_translations
+    language_translations._get_messages.cache_clear()
+
+def test_raw_patterns_keep_precedence(fresh_messages, monkeypatch):
+    import pylint
+
+    monkeypatch.setattr(raw_checker_patterns, "PYLINT_VERSION", pylint.__version__)
+    monkeypatch.setattr(raw_checker_patterns, "EDULINT_FINGERPRINT", get_edulint_checkers_fingerprint())
+    monkeypatch.setattr(raw_checker_patterns, "PYLINT", {"X0001": "pylint", "X0002": "pylint"})
+    monkeypatch.setattr(raw_checker_patterns, "EDULINT", {"X0001": "edulint", "X0002": "edulint"})
+    monkeypatch.setitem(fresh_messages.FLAKE8, "X0002", "flake8")
+    assert fresh_messages._get_raw_pattern("X0001") == "edulint"
+    assert fresh_messages._get_raw_pattern("X0002") == "flake8"
+
+def test_raw_patterns_fall_back_to_live_messages(fresh_messages, monkeypatch):
+    monkeypatch.setattr(raw_checker_patterns, "EDULINT_FINGERPRINT", "stale")
+    monkeypatch.setattr(raw_checker_patterns, "EDULINT", {})
+    assert fresh_messages._get_raw_pattern("R6609") == get_patterns()["R6609"]
+
+@pytest.mark.parametrize("code", ["R6609", "C0104", "E712", "F401", "W0107"])
+def test_compiled_pattern_matches_walked_pattern(code):
+    pattern = get_pattern(code)
+    walked = get_patterns()[code]
+    if "(.*)" not in walked:
+        assert pattern is None
+    else:
+        assert pattern is get_pattern(code)
+        assert pattern.pattern == walked
+
+def test_translate_with_compiled_pattern():
+    translation = Translation("Pouzij '{} {}= {}'", extracts={"2": {"+": "plus"}})
+    assert translation.translate("R6609", "Use augmented assignment: 'x += 1'") == "Pouzij 'x plus= 1'"
+    assert translation.translate("R6609", "unexpected message") == "Pouzij '{} {}= {}'"
+
+def test_lang_translator_matches_translation():
+    lang_translations = {
+        "R6609": Translation("Pouzij '{} {}= {}'", extracts={"2": {"+": "plus"}}),
+        "unnecessary-pass": Translation("Zbytecny pass", extracts={}),
+    }
+    translator = LangTranslator(lang_translations)
+    for code, symbol, message in [
+        ("R6609", "use-augmented-assign", "Use augmented assignment: 'x += 1'"),
+        ("R6609", "use-augmented-assign", "unexpected message"),
+        ("W0107", "unnecessary-pass", "Unnecessary pass statement"),
+    ]:
+        translation = lang_translations.get(code, lang_translations.get(symbol))
+        assert translator.get_translator(code, symbol)(message) == translation.translate(code, message)
+    assert translator.get_translator("C0114", "missing-module-docstring") is None
+
 @pytest.mark.parametrize("checked_filename,translations_filename,expected_output", [
     ("z202817-zkouska.py", "R6609-pylint-translation-by-symbol.toml", [
         lazy_problem().set_line(10).set_text("Use 'num //= 10'"),